@@ -59,7 +59,6 @@ def compute_exposures(run: ValuationRun) -> dict:
         [{'currency': 'XAF', 'value_base': Money(1000000, 'XAF'), 'pct_total': Decimal('50.00')}, ...]
     """
     results = run.get_results().select_related(
-        "position_snapshot__instrument__issuer",
         "position_snapshot__instrument__instrument_group",
         "position_snapshot__instrument__instrument_type",
     )
@@ -186,14 +185,13 @@ def compute_issuer_exposures(
 
     for result in results:
         instrument = result.position_snapshot.instrument
-        issuer = instrument.issuer
-        issuer_id = issuer.id if issuer else None
-        issuer_name = issuer.name if issuer else "Unknown"
+        # Instrument.issuer_name is denormalized, so no issuer join is needed
+        issuer_id = instrument.issuer_id
         value = result.market_value_base_currency.amount
 
         issuer_totals[issuer_id] += value
         if issuer_id not in issuer_names:
-            issuer_names[issuer_id] = issuer_name
+            issuer_names[issuer_id] = instrument.issuer_name or "Unknown"
 
     # Convert to list of dicts and calculate percentages
     base_currency = total_market_value.currency
@@ -254,14 +252,16 @@ def compute_country_exposures(
     country_names: dict[str | None, str] = {}
 
     for result in results:
-        instrument = result.position_snapshot.instrument
-        country_code = str(instrument.country) if instrument.country else None
-        country_name = countries.name(country_code) if country_code else "Unknown"
+        # CountryField wraps the code in a new Country object on every access;
+        # read it once and resolve the display name once per country
+        country_code = result.position_snapshot.instrument.country.code or None
         value = result.market_value_base_currency.amount
 
         country_totals[country_code] += value
         if country_code not in country_names:
-            country_names[country_code] = country_name
+            country_names[country_code] = (
+                countries.name(country_code) if country_code else "Unknown"
+            )
 
     # Convert to list of dicts and calculate percentages
     base_currency = total_market_value.currency
@@ -323,14 +323,12 @@ def compute_instrument_group_exposures(
 
     for result in results:
         instrument = result.position_snapshot.instrument
-        group = instrument.instrument_group
-        group_id = group.id
-        group_name = group.name
+        group_id = instrument.instrument_group_id
         value = result.market_value_base_currency.amount
 
         group_totals[group_id] += value
         if group_id not in group_names:
-            group_names[group_id] = group_name
+            group_names[group_id] = instrument.instrument_group.name
 
     # Convert to list of dicts and calculate percentages
     base_currency = total_market_value.currency
@@ -392,14 +390,12 @@ def compute_instrument_type_exposures(
 
     for result in results:
         instrument = result.position_snapshot.instrument
-        instr_type = instrument.instrument_type
-        type_id = instr_type.id
-        type_name = instr_type.name
+        type_id = instrument.instrument_type_id
         value = result.market_value_base_currency.amount
 
         type_totals[type_id] += value
         if type_id not in type_names:
-            type_names[type_id] = type_name
+            type_names[type_id] = instrument.instrument_type.name
 
     # Convert to list of dicts and calculate percentages
     base_currency = total_market_value.currency
@@ -492,14 +488,13 @@ def compute_top_concentrations(
         instrument_labels: dict[int, str] = {}
 
         for result in results:
-            instrument = result.position_snapshot.instrument
-            instrument_id = instrument.id
-            instrument_name = instrument.name
+            position_snapshot = result.position_snapshot
+            instrument_id = position_snapshot.instrument_id
             value = result.market_value_base_currency.amount
 
             instrument_totals[instrument_id] += value
             if instrument_id not in instrument_labels:
-                instrument_labels[instrument_id] = instrument_name
+                instrument_labels[instrument_id] = position_snapshot.instrument.name
 
         base_currency = total_market_value.currency
         total_amount = total_market_value.amount
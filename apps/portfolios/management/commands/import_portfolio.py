@@ -132,7 +132,7 @@ class Command(BaseCommand):
         )
         self.stdout.write(f"Organization: {organization.name} (ID: {org_id})")
         self.stdout.write(
-            f"Portfolio: {portfolio_import.portfolio.name} (ID: {portfolio_import.portfolio.id})"
+            f"Portfolio: {portfolio_import.portfolio.name} (ID: {portfolio_import.portfolio_id})"
         )
         self.stdout.write(f"File: {file_name}")
         self.stdout.write(f"As-of Date: {portfolio_import.as_of_date}")
@@ -245,7 +245,7 @@ class Command(BaseCommand):
             "organization_id": organization.id,
             "organization_name": organization.name,
             "portfolio_import_id": portfolio_import.id,
-            "portfolio_id": portfolio_import.portfolio.id,
+            "portfolio_id": portfolio_import.portfolio_id,
             "portfolio_name": portfolio_import.portfolio.name,
             "file_name": file_name,
             "as_of_date": str(portfolio_import.as_of_date),
@@ -153,15 +153,16 @@ def preflight_portfolio_import(portfolio_import_id: int) -> dict:
 
         # Check prices for instruments that might need them
         # (In MVP, this is optional, but we check for completeness)
-        for instrument in existing_instruments:
-            # Check if price exists for this instrument/date
-            price_exists = InstrumentPrice.objects.filter(
-                instrument=instrument,
+        # One query for all instruments instead of an exists() per instrument
+        priced_instrument_ids = set(
+            InstrumentPrice.objects.filter(
+                instrument__in=existing_instruments,
                 date=as_of_date,
                 price_type=InstrumentPrice.PriceType.CLOSE,
-            ).exists()
-
-            if not price_exists:
+            ).values_list("instrument_id", flat=True)
+        )
+        for instrument in existing_instruments:
+            if instrument.id not in priced_instrument_ids:
                 # Only warn, don't block (MVP uses USE_SNAPSHOT_MV)
                 identifier = instrument.isin or instrument.ticker or str(instrument.id)
                 result["missing_prices"].append(
@@ -189,16 +190,23 @@ def preflight_portfolio_import(portfolio_import_id: int) -> dict:
             if inst.instrument_group and "fixed" in inst.instrument_group.name.lower()
         ]
 
+        # Currencies with a curve point on the date, loaded in one query
+        # instead of a join + exists() per bond
+        # (We check for any tenor, as specific tenors would require maturity date analysis)
+        curve_currencies = set()
+        if bond_instruments:
+            curve_currencies = set(
+                YieldCurvePoint.objects.filter(
+                    curve__currency__in={inst.currency for inst in bond_instruments},
+                    date=as_of_date,
+                )
+                .values_list("curve__currency", flat=True)
+                .distinct()
+            )
+
         for instrument in bond_instruments:
             currency = instrument.currency
-            # Check if yield curve exists for this currency/date
-            # (We check for any tenor, as specific tenors would require maturity date analysis)
-            curve_exists = YieldCurvePoint.objects.filter(
-                curve__currency=currency,
-                date=as_of_date,
-            ).exists()
-
-            if not curve_exists:
+            if currency not in curve_currencies:
                 # Only warn, don't block (not required for MVP)
                 result["missing_curves"].append(
                     {
@@ -17,6 +17,7 @@ from apps.reference_data.models.indices import (
     MarketIndexValue,
     MarketIndexValueObservation,
 )
+from libs.choices import IMPORT_STATUS_LABELS
 
 
 @admin.register(MarketIndex)
@@ -27,10 +28,18 @@ class MarketIndexAdmin(admin.ModelAdmin):
     Provides management interface for market index definitions.
     """
 
-    list_display = ["name", "code", "currency", "is_active", "created_at"]
+    list_display = [
+        "name",
+        "code",
+        "currency",
+        "last_value",
+        "last_date",
+        "is_active",
+        "created_at",
+    ]
     list_filter = ["currency", "is_active", "created_at"]
     search_fields = ["name", "code"]
-    readonly_fields = ["created_at"]
+    readonly_fields = ["last_date", "last_value", "last_return_pct", "created_at"]
 
 
 @admin.register(MarketIndexConstituent)
@@ -54,6 +63,10 @@ class MarketIndexConstituentAdmin(admin.ModelAdmin):
     raw_id_fields = ["index", "instrument"]
     ordering = ["-as_of_date", "index", "-weight"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
+
 
 @admin.register(MarketIndexValueObservation)
 class MarketIndexValueObservationAdmin(admin.ModelAdmin):
@@ -76,6 +89,10 @@ class MarketIndexValueObservationAdmin(admin.ModelAdmin):
     raw_id_fields = ["index", "source"]
     ordering = ["-date", "index"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
+
 
 @admin.register(MarketIndexValue)
 class MarketIndexValueAdmin(admin.ModelAdmin):
@@ -99,6 +116,10 @@ class MarketIndexValueAdmin(admin.ModelAdmin):
     raw_id_fields = ["index", "chosen_source"]
     ordering = ["-date", "index"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
+
 
 @admin.register(MarketIndexImport)
 class MarketIndexImportAdmin(admin.ModelAdmin):
@@ -208,7 +229,7 @@ class MarketIndexImportAdmin(admin.ModelAdmin):
         return format_html(
             '<span style="color: {}; font-weight: bold;">{}</span>',
             color,
-            obj.get_status_display(),
+            IMPORT_STATUS_LABELS.get(obj.status, obj.status),
         )
 
     @admin.display(description="Observations")
@@ -264,7 +285,7 @@ class MarketIndexImportAdmin(admin.ModelAdmin):
                     file_name,
                     import_obj.index.name if import_obj.index else "-",
                     import_obj.source.code if import_obj.source else "-",
-                    import_obj.get_status_display(),
+                    IMPORT_STATUS_LABELS.get(import_obj.status, import_obj.status),
                     import_obj.error_message,
                 ]
             )
@@ -51,6 +51,10 @@ class InstrumentTypeAdmin(admin.ModelAdmin):
     search_fields = ["name", "description", "group__name"]
     raw_id_fields = ["group"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_related()
+
 
 @admin.register(Instrument)
 class InstrumentAdmin(admin.ModelAdmin):
@@ -86,6 +90,10 @@ class InstrumentAdmin(admin.ModelAdmin):
     raw_id_fields = ["organization", "issuer", "instrument_group", "instrument_type"]
     actions = ["export_to_excel_template"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_related()
+
     @admin.action(description="Export selected instruments to Excel template")
     def export_to_excel_template(self, request, queryset):
         """Export selected instruments to Excel template format."""
@@ -95,9 +103,7 @@ class InstrumentAdmin(admin.ModelAdmin):
 
         # Prepare data in template format
         data = []
-        for instrument in queryset.select_related(
-            "instrument_group", "instrument_type", "issuer"
-        ):
+        for instrument in queryset.with_related():
             data.append(
                 {
                     "instrument_identifier": instrument.isin or instrument.ticker or "",
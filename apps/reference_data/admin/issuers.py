@@ -20,6 +20,7 @@ class IssuerRatingInline(admin.TabularInline):
     extra = 0
     fields = ["agency", "rating", "date_assigned", "is_active"]
     readonly_fields = ["created_at"]
+    ordering = ["-date_assigned", "agency"]
 
 
 @admin.register(Issuer)
@@ -37,6 +38,7 @@ class IssuerAdmin(admin.ModelAdmin):
         "short_name",
         "country",
         "issuer_group",
+        "current_rating",
         "is_active",
         "created_at",
     ]
@@ -47,6 +49,10 @@ class IssuerAdmin(admin.ModelAdmin):
     inlines = [IssuerRatingInline]
     actions = ["export_to_excel_template"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_related()
+
     @admin.action(description="Export selected issuers to Excel template")
     def export_to_excel_template(self, request, queryset):
         """Export selected issuers to Excel template format."""
@@ -104,6 +110,10 @@ class IssuerRatingAdmin(admin.ModelAdmin):
     raw_id_fields = ["issuer"]
     ordering = ["-date_assigned", "agency"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
+
 
 @admin.register(IssuerGroup)
 class IssuerGroupAdmin(admin.ModelAdmin):
@@ -119,6 +129,10 @@ class IssuerGroupAdmin(admin.ModelAdmin):
     readonly_fields = ["created_at", "updated_at"]
     ordering = ["sort_order", "name"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view and skip descriptions."""
+        return super().get_queryset(request).for_list().select_related("parent")
+
     fieldsets = (
         (
             None,
@@ -42,3 +42,7 @@ class MarketDataSourcePriorityAdmin(admin.ModelAdmin):
     ordering = ["organization", "data_type", "priority"]
     list_editable = ["priority"]
     raw_id_fields = ["organization", "source"]
+
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
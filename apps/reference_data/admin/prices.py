@@ -38,6 +38,10 @@ class InstrumentPriceObservationAdmin(admin.ModelAdmin):
     raw_id_fields = ["instrument", "source"]
     ordering = ["-date", "instrument"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
+
 
 @admin.register(InstrumentPrice)
 class InstrumentPriceAdmin(admin.ModelAdmin):
@@ -61,6 +65,10 @@ class InstrumentPriceAdmin(admin.ModelAdmin):
     raw_id_fields = ["instrument", "chosen_source"]
     ordering = ["-date", "instrument"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
+
 
 @admin.register(InstrumentPriceImport)
 class InstrumentPriceImportAdmin(admin.ModelAdmin):
@@ -85,6 +93,8 @@ class InstrumentPriceImportAdmin(admin.ModelAdmin):
     readonly_fields = [
         "file",
         "file_name_display",
+        "file_sha256",
+        "file_size",
         "source",
         "sheet_name",
         "status",
@@ -105,6 +115,8 @@ class InstrumentPriceImportAdmin(admin.ModelAdmin):
                 "fields": (
                     "file",
                     "file_name_display",
+                    "file_sha256",
+                    "file_size",
                     "source",
                     "sheet_name",
                 )
@@ -86,6 +86,10 @@ class YieldCurvePointObservationAdmin(admin.ModelAdmin):
     raw_id_fields = ["curve", "source"]
     ordering = ["-date", "curve", "tenor"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
+
 
 @admin.register(YieldCurvePoint)
 class YieldCurvePointAdmin(admin.ModelAdmin):
@@ -114,6 +118,7 @@ class YieldCurvePointAdmin(admin.ModelAdmin):
         "chosen_source",
         "is_official",
         "published_date_assumed",
+        "staleness_bucket",
         "date",
         "last_published_date",
         "created_at",
@@ -123,6 +128,10 @@ class YieldCurvePointAdmin(admin.ModelAdmin):
     raw_id_fields = ["curve", "chosen_source"]
     ordering = ["-date", "curve", "tenor"]
 
+    def get_queryset(self, request):
+        """Join related objects shown in the list view."""
+        return super().get_queryset(request).with_display()
+
     @admin.display(description="Staleness (days)")
     def staleness_days_display(self, obj):
         """Display staleness in days with color coding."""
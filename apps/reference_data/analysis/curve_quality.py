@@ -13,7 +13,8 @@ from collections import defaultdict
 from datetime import date, timedelta
 from typing import Any
 
-from django.db.models import Max, Min, Q
+from django.db.models import FloatField, Max, Min, Q
+from django.db.models.functions import Cast
 
 from apps.reference_data.models import YieldCurve, YieldCurvePoint
 
@@ -406,21 +407,29 @@ def extract_clean_series(
     points = YieldCurvePoint.objects.filter(
         curve=curve,
         tenor_days=tenor_days
-    ).order_by("date")
+    ).with_staleness().order_by("date")
     
     if start_date:
         points = points.filter(date__gte=start_date)
     if end_date:
         points = points.filter(date__lte=end_date)
     
+    # Read plain tuples (rate cast to float in SQL) instead of model instances
+    rows = points.values_list(
+        "date",
+        Cast("rate", FloatField()),
+        "last_published_date",
+        "published_staleness",
+        "published_date_assumed",
+    )
     series = []
-    for point in points:
+    for point_date, rate, last_published_date, staleness, assumed in rows:
         series.append({
-            "date": point.date,
-            "rate": float(point.rate),
-            "last_published_date": point.last_published_date,
-            "staleness_days": point.staleness_days,
-            "published_date_assumed": point.published_date_assumed,
+            "date": point_date,
+            "rate": rate,
+            "last_published_date": last_published_date,
+            "staleness_days": staleness.days if staleness is not None else None,
+            "published_date_assumed": assumed,
         })
     
     return series
@@ -411,7 +411,7 @@ class Command(BaseCommand):
                 "import_id": import_record.id,
                 "source_code": import_record.source.code,
                 "source_name": import_record.source.name,
-                "curve_id": import_record.curve.id if import_record.curve else None,
+                "curve_id": import_record.curve_id,
                 "curve_name": import_record.curve.name if import_record.curve else None,
                 "file_name": import_record.file.name,
                 "file_hash": file_hash,
@@ -428,7 +428,7 @@ class Command(BaseCommand):
             "import_id": import_record.id,
             "source_code": import_record.source.code,
             "source_name": import_record.source.name,
-            "curve_id": import_record.curve.id if import_record.curve else None,
+            "curve_id": import_record.curve_id,
             "curve_name": import_record.curve.name if import_record.curve else None,
             "file_name": import_record.file.name,
             "observations_created": result.get("created", 0),
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-17 00:57
+
+from django.db import migrations
+
+import libs.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0016_add_yield_curve_stress_profile"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="marketindexvalueobservation",
+            name="reference_d_date_aa07ea_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="marketindexvalueobservation",
+            name="reference_d_observe_ae3a5d_idx",
+        ),
+        migrations.AddIndex(
+            model_name="marketindexvalueobservation",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["date"], name="mivo_date_brin", pages_per_range=32
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="marketindexvalueobservation",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["observed_at"], name="mivo_observed_at_brin", pages_per_range=32
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-17 01:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0017_marketindexvalueobservation_brin_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="marketindexvalue",
+            name="return_pct",
+            field=models.FloatField(
+                blank=True,
+                help_text="Daily return as percentage",
+                null=True,
+                verbose_name="Return %",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindexvalue",
+            name="value",
+            field=models.FloatField(
+                help_text="Index level/value on this date (stored directly for performance)",
+                verbose_name="Value",
+            ),
+        ),
+    ]
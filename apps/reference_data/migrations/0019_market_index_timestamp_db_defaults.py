@@ -0,0 +1,131 @@
+# Generated by Django 5.2 on 2026-10-17 01:01
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+import libs.postgres
+
+# Keep updated_at current for writes that bypass the ORM (COPY staging
+# upserts, raw UPDATEs). ORM saves still set it via auto_now.
+SET_UPDATED_AT_SQL = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER marketindex_set_updated_at
+    BEFORE UPDATE ON reference_data_marketindex
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+CREATE TRIGGER marketindexconstituent_set_updated_at
+    BEFORE UPDATE ON reference_data_marketindexconstituent
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+CREATE TRIGGER marketindexvalue_set_updated_at
+    BEFORE UPDATE ON reference_data_marketindexvalue
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+CREATE TRIGGER marketindexvalueobservation_set_updated_at
+    BEFORE UPDATE ON reference_data_marketindexvalueobservation
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+"""
+
+DROP_SET_UPDATED_AT_SQL = """
+DROP TRIGGER IF EXISTS marketindex_set_updated_at ON reference_data_marketindex;
+DROP TRIGGER IF EXISTS marketindexconstituent_set_updated_at ON reference_data_marketindexconstituent;
+DROP TRIGGER IF EXISTS marketindexvalue_set_updated_at ON reference_data_marketindexvalue;
+DROP TRIGGER IF EXISTS marketindexvalueobservation_set_updated_at ON reference_data_marketindexvalueobservation;
+DROP FUNCTION IF EXISTS set_updated_at();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0018_marketindexvalue_float_values"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="marketindex",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindex",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Updated At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindexconstituent",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindexconstituent",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Updated At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindeximport",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindexvalue",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindexvalue",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Updated At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindexvalueobservation",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketindexvalueobservation",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                verbose_name="Updated At",
+            ),
+        ),
+        libs.postgres.PostgresRunSQL(
+            sql=SET_UPDATED_AT_SQL, reverse_sql=DROP_SET_UPDATED_AT_SQL
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-17 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0019_market_index_timestamp_db_defaults"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="marketindexconstituent",
+            name="reference_d_index_i_4041fe_idx",
+        ),
+        migrations.AddIndex(
+            model_name="marketindexconstituent",
+            index=models.Index(
+                fields=["index", "-as_of_date", "-weight"],
+                include=("instrument", "shares"),
+                name="idx_constituent_topk",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-17 01:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0020_marketindexconstituent_topk_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="marketindex",
+            name="last_date",
+            field=models.DateField(
+                blank=True,
+                help_text="Date of the most recent canonical value for this index",
+                null=True,
+                verbose_name="Last Date",
+            ),
+        ),
+        migrations.AddField(
+            model_name="marketindex",
+            name="last_return_pct",
+            field=models.FloatField(
+                blank=True,
+                help_text="Daily return of the most recent canonical value",
+                null=True,
+                verbose_name="Last Return %",
+            ),
+        ),
+        migrations.AddField(
+            model_name="marketindex",
+            name="last_value",
+            field=models.FloatField(
+                blank=True,
+                help_text="Most recent canonical index level",
+                null=True,
+                verbose_name="Last Value",
+            ),
+        ),
+    ]
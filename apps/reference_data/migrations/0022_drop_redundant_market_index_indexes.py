@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-17 01:04
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0021_marketindex_latest_value"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="marketindex",
+            name="reference_d_code_8fa474_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="marketindexvalue",
+            name="reference_d_index_i_0d3367_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="marketindexvalue",
+            name="reference_d_date_ec23a6_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="marketindexvalueobservation",
+            name="reference_d_index_i_b4d7c6_idx",
+        ),
+    ]
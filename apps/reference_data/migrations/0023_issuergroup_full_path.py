@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-17 01:18
+
+from django.db import migrations, models
+
+
+def populate_full_path(apps, schema_editor):
+    """Backfill IssuerGroup.full_path from the parent hierarchy."""
+    IssuerGroup = apps.get_model("reference_data", "IssuerGroup")
+    groups = {group.id: group for group in IssuerGroup.objects.all()}
+
+    def build_path(group):
+        if group.full_path:
+            return group.full_path
+        parent = groups.get(group.parent_id)
+        group.full_path = (
+            f"{build_path(parent)} > {group.name}" if parent else group.name
+        )
+        return group.full_path
+
+    for group in groups.values():
+        build_path(group)
+    IssuerGroup.objects.bulk_update(groups.values(), ["full_path"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0022_drop_redundant_market_index_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issuergroup",
+            name="full_path",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Denormalized hierarchical path (e.g., 'Financial > Bank'), maintained on save.",
+                max_length=1024,
+                verbose_name="Full Path",
+            ),
+        ),
+        migrations.RunPython(populate_full_path, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-17 01:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0001_initial"),
+        ("reference_data", "0023_issuergroup_full_path"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="instrument",
+            name="reference_d_organiz_aa88a2_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="instrument",
+            name="reference_d_organiz_548689_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="issuerrating",
+            name="reference_d_issuer__4d91c6_idx",
+        ),
+        migrations.AddIndex(
+            model_name="instrument",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["organization", "next_coupon_date"],
+                name="instr_org_active_nxtcpn",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issuerrating",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["issuer", "agency"],
+                name="rating_issuer_agency_active",
+            ),
+        ),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 5.2 on 2026-10-17 01:20
+
+from django.db import migrations, models
+from django.db.models.functions import Length
+
+# (model, field, new max_length) for every column narrowed below
+NARROWED_FIELDS = [
+    ("Instrument", "coupon_frequency", 32),
+    ("Instrument", "sector", 128),
+    ("Instrument", "valuation_method", 32),
+    ("IssuerRating", "agency", 20),
+    ("IssuerRating", "rating", 16),
+]
+
+
+def check_value_lengths(apps, schema_editor):
+    """Fail early with guidance if any value is longer than its new max_length."""
+    too_long = []
+    for model_name, field_name, max_length in NARROWED_FIELDS:
+        model = apps.get_model("reference_data", model_name)
+        count = (
+            model._base_manager.annotate(value_length=Length(field_name))
+            .filter(value_length__gt=max_length)
+            .count()
+        )
+        if count:
+            too_long.append(
+                f"{model_name}.{field_name} ({count} rows over {max_length} chars)"
+            )
+    if too_long:
+        raise RuntimeError(
+            "Some values are too long for the narrowed columns: "
+            f"{', '.join(too_long)}. Shorten them before migrating."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0024_partial_active_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_value_lengths, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="instrument",
+            name="coupon_frequency",
+            field=models.CharField(
+                blank=True, max_length=32, null=True, verbose_name="Coupon Frequency"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="instrument",
+            name="sector",
+            field=models.CharField(
+                blank=True,
+                help_text="Economic sector classification.",
+                max_length=128,
+                null=True,
+                verbose_name="Sector",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="instrument",
+            name="valuation_method",
+            field=models.CharField(
+                choices=[
+                    ("mark_to_market", "Mark to Market"),
+                    ("mark_to_model", "Mark to Model"),
+                    ("external_appraisal", "External Appraisal"),
+                    ("manual_declared", "Manual Declared"),
+                ],
+                default="mark_to_market",
+                help_text="How this instrument is valued.",
+                max_length=32,
+                verbose_name="Valuation Method",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="issuerrating",
+            name="agency",
+            field=models.CharField(
+                choices=[
+                    ("S&P", "Standard & Poor's"),
+                    ("Moody's", "Moody's"),
+                    ("Fitch", "Fitch"),
+                    ("Bloomfield", "Bloomfield"),
+                ],
+                help_text="Agency that assigned the rating (e.g., 'S&P', 'Moody's', 'Fitch').",
+                max_length=20,
+                verbose_name="Rating Agency",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="issuerrating",
+            name="rating",
+            field=models.CharField(
+                help_text="Credit rating assigned (e.g., 'AAA', 'BB+').",
+                max_length=16,
+                verbose_name="Rating",
+            ),
+        ),
+    ]
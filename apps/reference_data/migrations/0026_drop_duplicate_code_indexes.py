@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-17 01:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0025_narrow_short_char_fields"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="issuer",
+            name="reference_d_issuer__2587fb_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="issuergroup",
+            name="reference_d_code_56eb41_idx",
+        ),
+        migrations.AlterField(
+            model_name="issuer",
+            name="issuer_code",
+            field=models.CharField(
+                blank=True,
+                help_text="Stable identifier code following format [REGION]-[TYPE]-[IDENTIFIER] (e.g., CM-SOV-GOVT, GA-BNK-BANQUEDEGAB). Auto-generated if not provided. Globally unique.",
+                max_length=50,
+                null=True,
+                unique=True,
+                verbose_name="Issuer Code",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="issuergroup",
+            name="code",
+            field=models.CharField(
+                help_text="Short code identifier (e.g., 'BANK', 'SOV').",
+                max_length=50,
+                unique=True,
+                verbose_name="Code",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-17 01:26
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_issuer_name(apps, schema_editor):
+    """Backfill Instrument.issuer_name from the linked issuer."""
+    Instrument = apps.get_model("reference_data", "Instrument")
+    Issuer = apps.get_model("reference_data", "Issuer")
+    Instrument._base_manager.update(
+        issuer_name=Subquery(
+            Issuer._base_manager.filter(pk=OuterRef("issuer_id")).values("name")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0026_drop_duplicate_code_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="instrument",
+            name="issuer_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Denormalized issuer name for reports, synced from the issuer on save.",
+                max_length=255,
+                verbose_name="Issuer Name",
+            ),
+        ),
+        migrations.RunPython(populate_issuer_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2 on 2026-10-17 01:29
+
+import re
+
+from django.db import migrations, models
+
+ISSUER_CODE_PATTERN = re.compile(r"^[A-Z]{2,3}-[A-Z]{3}-[A-Z0-9]{1,10}$")
+
+
+def check_existing_issuer_codes(apps, schema_editor):
+    """Fail early with guidance if legacy issuer codes would break the constraint."""
+    Issuer = apps.get_model("reference_data", "Issuer")
+    invalid = [
+        code
+        for code in Issuer._base_manager.exclude(issuer_code__isnull=True)
+        .values_list("issuer_code", flat=True)
+        .iterator()
+        if not ISSUER_CODE_PATTERN.match(code)
+    ]
+    if invalid:
+        raise RuntimeError(
+            f"{len(invalid)} issuer(s) have codes not matching "
+            f"[REGION]-[TYPE]-[IDENTIFIER] (e.g. {invalid[:5]}). "
+            "Run 'python manage.py migrate_issuer_codes' before migrating."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0001_initial"),
+        ("reference_data", "0027_instrument_issuer_name"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_existing_issuer_codes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="issuer",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("issuer_code__isnull", True),
+                    ("issuer_code__regex", "^[A-Z]{2,3}-[A-Z]{3}-[A-Z0-9]{1,10}$"),
+                    _connector="OR",
+                ),
+                name="issuer_code_format",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-17 01:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0001_initial"),
+        ("reference_data", "0028_issuer_code_format_check"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="instrument",
+            name="reference_d_organiz_bca7ff_idx",
+        ),
+        migrations.AddIndex(
+            model_name="instrument",
+            index=models.Index(
+                condition=models.Q(
+                    ("fund_category__isnull", False), ("is_active", True)
+                ),
+                fields=["organization", "fund_category"],
+                name="instr_org_active_fund_cat",
+            ),
+        ),
+    ]
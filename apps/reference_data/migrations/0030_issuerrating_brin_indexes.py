@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 01:34
+
+from django.db import migrations
+
+import libs.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0029_partial_fund_category_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="issuerrating",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["date_assigned"], name="ir_date_brin", pages_per_range=32
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issuerrating",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["created_at"], name="ir_created_at_brin", pages_per_range=32
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-17 01:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0030_issuerrating_brin_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="issuerrating",
+            name="reference_d_agency_6b28da_idx",
+        ),
+        migrations.AddIndex(
+            model_name="issuerrating",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["agency"],
+                include=("issuer", "rating", "date_assigned"),
+                name="ir_active_cov",
+            ),
+        ),
+    ]
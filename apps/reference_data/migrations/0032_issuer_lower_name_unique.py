@@ -0,0 +1,47 @@
+# Generated by Django 5.2 on 2026-10-17 01:36
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_duplicate_names(apps, schema_editor):
+    """Fail early with guidance if issuer names differ only by case."""
+    Issuer = apps.get_model("reference_data", "Issuer")
+    duplicates = list(
+        Issuer._base_manager.annotate(name_lower=Lower("name"))
+        .values("organization_id", "name_lower")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+        .values_list("name_lower", flat=True)[:5]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Some issuers share a name that differs only by case "
+            f"(e.g. {duplicates}). Merge or rename them before migrating."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0001_initial"),
+        ("reference_data", "0031_issuerrating_active_covering_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_duplicate_names, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name="issuer",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="issuer",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                models.F("organization"),
+                name="unique_issuer_lower_name_per_org",
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2 on 2026-10-17 01:37
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_current_rating(apps, schema_editor):
+    """Backfill Issuer.current_rating* from the latest active rating."""
+    Issuer = apps.get_model("reference_data", "Issuer")
+    IssuerRating = apps.get_model("reference_data", "IssuerRating")
+    latest = IssuerRating._base_manager.filter(
+        issuer_id=OuterRef("pk"), is_active=True
+    ).order_by("-date_assigned", "agency")
+    Issuer._base_manager.update(
+        current_rating=Coalesce(Subquery(latest.values("rating")[:1]), Value("")),
+        current_rating_agency=Coalesce(
+            Subquery(latest.values("agency")[:1]), Value("")
+        ),
+        current_rating_date=Subquery(latest.values("date_assigned")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0032_issuer_lower_name_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issuer",
+            name="current_rating",
+            field=models.CharField(
+                blank=True, editable=False, max_length=16, verbose_name="Current Rating"
+            ),
+        ),
+        migrations.AddField(
+            model_name="issuer",
+            name="current_rating_agency",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=20,
+                verbose_name="Current Rating Agency",
+            ),
+        ),
+        migrations.AddField(
+            model_name="issuer",
+            name="current_rating_date",
+            field=models.DateField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="Current Rating Date",
+            ),
+        ),
+        migrations.RunPython(populate_current_rating, migrations.RunPython.noop),
+    ]
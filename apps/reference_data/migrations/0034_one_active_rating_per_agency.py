@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-17 01:40
+
+from django.db import migrations, models
+
+
+def deactivate_superseded_ratings(apps, schema_editor):
+    """Keep only the latest active rating per issuer and agency."""
+    IssuerRating = apps.get_model("reference_data", "IssuerRating")
+    seen = set()
+    superseded = []
+    for pk, issuer_id, agency in (
+        IssuerRating._base_manager.filter(is_active=True)
+        .order_by("issuer_id", "agency", "-date_assigned", "-pk")
+        .values_list("pk", "issuer_id", "agency")
+        .iterator()
+    ):
+        if (issuer_id, agency) in seen:
+            superseded.append(pk)
+        else:
+            seen.add((issuer_id, agency))
+    IssuerRating._base_manager.filter(pk__in=superseded).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0033_issuer_current_rating"),
+    ]
+
+    operations = [
+        migrations.RunPython(deactivate_superseded_ratings, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="issuerrating",
+            name="rating_issuer_agency_active",
+        ),
+        migrations.AddConstraint(
+            model_name="issuerrating",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_active", True)),
+                fields=("issuer", "agency"),
+                name="uniq_active_rating_per_agency",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-17 01:44
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+import libs.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0001_initial"),
+        ("reference_data", "0034_one_active_rating_per_agency"),
+    ]
+
+    operations = [
+        # No-op outside PostgreSQL
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="issuer",
+            index=libs.postgres.PortableGinIndex(
+                fields=["name"], name="issuer_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 01:45
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0035_issuer_name_trigram_index"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="issuerrating",
+            options={
+                "verbose_name": "Issuer Rating",
+                "verbose_name_plural": "Issuer Ratings",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="marketdatasource",
+            options={
+                "verbose_name": "Market Data Source",
+                "verbose_name_plural": "Market Data Sources",
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-17 01:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0036_drop_default_orderings"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="issuerrating",
+            name="reference_d_issuer__3b1e42_idx",
+        ),
+        migrations.AddIndex(
+            model_name="issuerrating",
+            index=models.Index(
+                fields=["issuer", "-date_assigned", "agency"],
+                name="ir_issuer_date_desc",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-17 01:48
+
+from django.db import migrations, models
+
+
+def check_priority_range(apps, schema_editor):
+    """Fail early with guidance if any priority falls outside 1-1000."""
+    out_of_range = models.Q(priority__lt=1) | models.Q(priority__gt=1000)
+    for model_name in ("MarketDataSource", "MarketDataSourcePriority"):
+        model = apps.get_model("reference_data", model_name)
+        bad = list(
+            model._base_manager.filter(out_of_range).values_list("pk", "priority")[:5]
+        )
+        if bad:
+            raise RuntimeError(
+                f"Some {model_name} rows have a priority outside 1-1000 "
+                f"(pk, priority: {bad}). Fix them before migrating."
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0001_initial"),
+        ("reference_data", "0037_issuerrating_issuer_date_desc_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_priority_range, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="marketdatasource",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("priority__gte", 1), ("priority__lte", 1000)),
+                name="mds_priority_range",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="marketdatasourcepriority",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("priority__gte", 1), ("priority__lte", 1000)),
+                name="mdsp_priority_range",
+            ),
+        ),
+    ]
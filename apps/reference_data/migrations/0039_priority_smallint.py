@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2026-10-17 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0038_priority_range_checks"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="marketdatasource",
+            name="priority",
+            field=models.SmallIntegerField(
+                default=100,
+                help_text="Priority rank (lower = higher priority, e.g., 1 = best, 10 = worst)",
+                verbose_name="Priority",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="marketdatasourcepriority",
+            name="priority",
+            field=models.SmallIntegerField(
+                help_text="Priority rank for this org/data_type combination (lower = higher priority).",
+                verbose_name="Priority",
+            ),
+        ),
+    ]
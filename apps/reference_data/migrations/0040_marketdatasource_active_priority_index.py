@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-17 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0039_priority_smallint"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="marketdatasource",
+            name="reference_d_priorit_b596db_idx",
+        ),
+        migrations.AddIndex(
+            model_name="marketdatasource",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["priority", "code"],
+                name="mds_active_priority",
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 01:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0040_marketdatasource_active_priority_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="instrumentprice",
+            name="reference_d_instrum_3b8d2d_idx",
+        ),
+        migrations.AddIndex(
+            model_name="instrumentprice",
+            index=models.Index(
+                fields=["instrument", "date", "price_type"],
+                include=("price", "quote_convention", "clean_or_dirty", "currency"),
+                name="ip_cover_val",
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-17 01:52
+
+from django.db import migrations
+
+import libs.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0041_instrumentprice_covering_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="instrumentpriceobservation",
+            name="reference_d_date_455550_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="instrumentpriceobservation",
+            name="reference_d_observe_df54ae_idx",
+        ),
+        migrations.AddIndex(
+            model_name="instrumentpriceobservation",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["date"], name="ipo_date_brin", pages_per_range=32
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="instrumentpriceobservation",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["observed_at"], name="ipo_observed_at_brin", pages_per_range=32
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-17 01:58
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0042_instrumentpriceobservation_brin_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="instrumentprice",
+            name="reference_d_instrum_d9a8d5_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="instrumentpriceobservation",
+            name="reference_d_instrum_aeb0f7_idx",
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 02:00
+
+from django.conf import settings
+from django.db import migrations
+
+import libs.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0043_drop_redundant_price_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="instrumentprice",
+            name="reference_d_date_80c4a5_idx",
+        ),
+        migrations.AddIndex(
+            model_name="instrumentprice",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["date"], name="ip_date_brin", pages_per_range=32
+            ),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.2 on 2026-10-17 02:03
+
+from django.db import migrations, models
+
+
+def check_negative_revisions(apps, schema_editor):
+    """Fail early with guidance if any observation has a negative revision."""
+    InstrumentPriceObservation = apps.get_model(
+        "reference_data", "InstrumentPriceObservation"
+    )
+    if InstrumentPriceObservation._base_manager.filter(revision__lt=0).exists():
+        raise RuntimeError(
+            "Some price observations have a negative revision. "
+            "Renumber them from 0 before migrating."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0044_instrumentprice_date_brin"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_negative_revisions, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="instrumentprice",
+            name="clean_or_dirty",
+            field=models.CharField(
+                choices=[("clean", "Clean"), ("dirty", "Dirty"), ("na", "N/A")],
+                default="na",
+                help_text="Whether price includes accrued interest (CLEAN, DIRTY, NA)",
+                max_length=5,
+                verbose_name="Clean or Dirty",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="instrumentprice",
+            name="price_type",
+            field=models.CharField(
+                choices=[
+                    ("close", "Close"),
+                    ("bid", "Bid"),
+                    ("ask", "Ask"),
+                    ("mid", "Mid"),
+                    ("open", "Open"),
+                    ("high", "High"),
+                    ("low", "Low"),
+                    ("nav", "NAV"),
+                ],
+                default="close",
+                help_text="Type of price (close, bid, ask, etc.)",
+                max_length=5,
+                verbose_name="Price Type",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="instrumentpriceobservation",
+            name="clean_or_dirty",
+            field=models.CharField(
+                choices=[("clean", "Clean"), ("dirty", "Dirty"), ("na", "N/A")],
+                default="na",
+                help_text="Whether price includes accrued interest (CLEAN, DIRTY, NA)",
+                max_length=5,
+                verbose_name="Clean or Dirty",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="instrumentpriceobservation",
+            name="price_type",
+            field=models.CharField(
+                choices=[
+                    ("close", "Close"),
+                    ("bid", "Bid"),
+                    ("ask", "Ask"),
+                    ("mid", "Mid"),
+                    ("open", "Open"),
+                    ("high", "High"),
+                    ("low", "Low"),
+                    ("nav", "NAV"),
+                ],
+                default="close",
+                help_text="Type of price (close, bid, ask, etc.)",
+                max_length=5,
+                verbose_name="Price Type",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="instrumentpriceobservation",
+            name="revision",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="Revision number (0 = initial, 1+ = corrections)",
+                verbose_name="Revision",
+            ),
+        ),
+    ]
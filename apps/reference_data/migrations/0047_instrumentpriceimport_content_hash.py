@@ -0,0 +1,48 @@
+# Generated by Django 5.2 on 2026-10-17 02:08
+
+from django.db import migrations, models
+
+import apps.reference_data.models.prices
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0046_price_enum_column_sizes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="instrumentpriceimport",
+            name="file_sha256",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="SHA-256 of the file content, used to dedupe re-uploads.",
+                max_length=64,
+                verbose_name="File SHA-256",
+            ),
+        ),
+        migrations.AddField(
+            model_name="instrumentpriceimport",
+            name="file_size",
+            field=models.BigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="File size in bytes.",
+                null=True,
+                verbose_name="File Size",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="instrumentpriceimport",
+            name="file",
+            field=models.FileField(
+                help_text="Uploaded Excel file with instrument price data.",
+                max_length=255,
+                upload_to=apps.reference_data.models.prices.instrument_price_import_upload_to,
+                verbose_name="File",
+            ),
+        ),
+    ]
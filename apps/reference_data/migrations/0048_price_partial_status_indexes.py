@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-17 02:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0047_instrumentpriceimport_content_hash"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="instrumentpriceimport",
+            name="reference_d_source__7a6f59_idx",
+        ),
+        migrations.AddIndex(
+            model_name="instrumentprice",
+            index=models.Index(
+                condition=models.Q(("selection_reason", "manual_override")),
+                fields=["instrument", "date"],
+                name="ip_manual_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="instrumentpriceimport",
+            index=models.Index(
+                condition=models.Q(
+                    (
+                        "status__in",
+                        ["pending", "parsing", "validating", "processing", "importing"],
+                    )
+                ),
+                fields=["source"],
+                name="imp_active_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-17 02:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0048_price_partial_status_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="instrumentprice",
+            name="reference_d_chosen__25c426_idx",
+        ),
+        migrations.AlterField(
+            model_name="instrumentprice",
+            name="chosen_source",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="The source that was selected for this canonical price",
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="canonical_market_data",
+                to="reference_data.marketdatasource",
+                verbose_name="Chosen Source",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="instrumentprice",
+            index=models.Index(fields=["chosen_source", "date"], name="ip_source_date"),
+        ),
+    ]
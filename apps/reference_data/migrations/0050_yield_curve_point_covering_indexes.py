@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-17 02:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0049_instrumentprice_source_date_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="yieldcurvepoint",
+            name="reference_d_curve_i_86655c_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="yieldcurvepointobservation",
+            name="reference_d_curve_i_91d226_idx",
+        ),
+        migrations.AddIndex(
+            model_name="yieldcurvepoint",
+            index=models.Index(
+                fields=["curve", "tenor_days", "date"],
+                include=("rate", "chosen_source", "last_published_date"),
+                name="ycp_curve_tenor_date_cov",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="yieldcurvepointobservation",
+            index=models.Index(
+                fields=["curve", "tenor_days", "date"],
+                include=("rate", "source"),
+                name="ycpo_curve_tenor_date_cov",
+            ),
+        ),
+    ]
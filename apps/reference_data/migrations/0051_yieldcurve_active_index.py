@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-17 02:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0050_yield_curve_point_covering_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="yieldcurve",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["currency", "curve_type"],
+                name="yc_active_by_ccy_type",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-17 02:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0051_yieldcurve_active_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="yieldcurve",
+            name="reference_d_currenc_d171a9_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="yieldcurve",
+            name="reference_d_curve_t_7ea953_idx",
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-17 02:30
+
+from django.db import migrations
+
+import libs.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0052_drop_redundant_yieldcurve_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="yieldcurvepointobservation",
+            name="reference_d_date_9b0535_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="yieldcurvepointobservation",
+            name="reference_d_observe_d13a12_idx",
+        ),
+        migrations.AddIndex(
+            model_name="yieldcurvepointobservation",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["date"], name="ycpo_date_brin", pages_per_range=32
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="yieldcurvepointobservation",
+            index=libs.postgres.PortableBrinIndex(
+                fields=["observed_at"], name="ycpo_observed_at_brin", pages_per_range=32
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 02:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0053_yieldcurvepointobservation_brin_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="yieldcurvepoint",
+            options={
+                "verbose_name": "Yield Curve Point",
+                "verbose_name_plural": "Yield Curve Points",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="yieldcurvepointobservation",
+            options={
+                "verbose_name": "Yield Curve Point Observation",
+                "verbose_name_plural": "Yield Curve Point Observations",
+            },
+        ),
+    ]
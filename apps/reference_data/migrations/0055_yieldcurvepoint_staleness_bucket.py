@@ -0,0 +1,53 @@
+# Generated by Django 5.2 on 2026-10-17 02:34
+
+from datetime import date, timedelta
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+
+def populate_staleness_bucket(apps, schema_editor):
+    """
+    Backfill YieldCurvePoint.staleness_bucket (0 fresh, 1 stale, 2 very stale).
+
+    The 7 and 30 day thresholds mirror STALENESS_FRESH_MAX_DAYS and
+    STALENESS_STALE_MAX_DAYS, copied so the migration does not depend on
+    the current model code.
+    """
+    YieldCurvePoint = apps.get_model("reference_data", "YieldCurvePoint")
+    today = date.today()
+    YieldCurvePoint._base_manager.filter(last_published_date__isnull=False).update(
+        staleness_bucket=Case(
+            When(last_published_date__gte=today - timedelta(days=7), then=Value(0)),
+            When(last_published_date__gte=today - timedelta(days=30), then=Value(1)),
+            default=Value(2),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0054_drop_yield_curve_point_orderings"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="yieldcurvepoint",
+            name="staleness_bucket",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                choices=[(0, "Fresh"), (1, "Stale"), (2, "Very Stale")],
+                help_text="Staleness of last_published_date (fresh / stale / very stale). Set on save and reclassified nightly; NULL if last_published_date is NULL.",
+                null=True,
+                verbose_name="Staleness Bucket",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="yieldcurvepoint",
+            index=models.Index(
+                fields=["curve", "staleness_bucket"], name="ycp_curve_staleness_idx"
+            ),
+        ),
+        migrations.RunPython(populate_staleness_bucket, migrations.RunPython.noop),
+    ]
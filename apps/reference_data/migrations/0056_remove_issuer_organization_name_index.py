@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-17 03:27
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_data", "0055_yieldcurvepoint_staleness_bucket"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="issuer",
+            name="reference_d_organiz_3c9f67_idx",
+        ),
+    ]
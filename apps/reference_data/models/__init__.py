@@ -15,8 +15,12 @@ All models are exported here for backward compatibility with existing imports.
 """
 
 from apps.reference_data.models.choices import (
+    CleanOrDirty,
     FundCategory,
+    PriceType,
+    QuoteConvention,
     SelectionReason,
+    StalenessBucket,
     ValuationMethod,
     YieldCurveType,
 )
@@ -53,8 +57,12 @@ from apps.reference_data.models.yield_curves import (
 
 __all__ = [
     # Choices
+    "CleanOrDirty",
     "FundCategory",
+    "PriceType",
+    "QuoteConvention",
     "SelectionReason",
+    "StalenessBucket",
     "ValuationMethod",
     "YieldCurveType",
     # Issuers
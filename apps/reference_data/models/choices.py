@@ -1,7 +1,7 @@
 """
 Choice classes for reference data models.
 
-Contains TextChoices classes used across multiple model domains.
+Contains TextChoices/IntegerChoices classes used across multiple model domains.
 """
 
 from __future__ import annotations
@@ -39,6 +39,47 @@ class SelectionReason(models.TextChoices):
     ONLY_AVAILABLE = "only_available", _("Only Available")  # Only one source available
 
 
+class StalenessBucket(models.IntegerChoices):
+    """Coarse staleness classification of canonical yield curve points."""
+
+    FRESH = 0, _("Fresh")  # Published within the last 7 days
+    STALE = 1, _("Stale")  # Published 8-30 days ago
+    VERY_STALE = 2, _("Very Stale")  # Published more than 30 days ago
+
+
+class PriceType(models.TextChoices):
+    """Price type choices for price observations and canonical prices."""
+
+    CLOSE = "close", _("Close")
+    BID = "bid", _("Bid")
+    ASK = "ask", _("Ask")
+    MID = "mid", _("Mid")
+    OPEN = "open", _("Open")
+    HIGH = "high", _("High")
+    LOW = "low", _("Low")
+    NAV = "nav", _("NAV")  # For mutual funds
+
+
+class QuoteConvention(models.TextChoices):
+    """Quote convention choices - how to interpret the price value."""
+
+    PRICE = "price", _("Price")  # Absolute price (equities, some bonds)
+    PERCENT_OF_PAR = "percent_of_par", _(
+        "Percent of Par"
+    )  # Common for bonds (e.g., 105.50 = 105.5%)
+    YIELD = "yield", _(
+        "Yield"
+    )  # Yield-to-maturity (sometimes provided instead of price)
+
+
+class CleanOrDirty(models.TextChoices):
+    """Clean or dirty price indicator."""
+
+    CLEAN = "clean", _("Clean")  # Price excludes accrued interest
+    DIRTY = "dirty", _("Dirty")  # Price includes accrued interest
+    NA = "na", _("N/A")  # Not applicable (equities, funds, deposits)
+
+
 class YieldCurveType(models.TextChoices):
     """Yield curve type choices."""
 
@@ -18,11 +18,13 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Now
 from django.utils.translation import gettext_lazy as _
 from djmoney.models.fields import CurrencyField
 
 from apps.reference_data.models.choices import SelectionReason
-from libs.choices import ImportStatus
+from libs.choices import IMPORT_STATUS_LABELS, ImportStatus
+from libs.postgres import PortableBrinIndex
 
 
 class MarketIndex(models.Model):
@@ -41,6 +43,11 @@ class MarketIndex(models.Model):
         base_date (date, optional): Base date for the index (when it started or was rebased).
         base_value (decimal, optional): Base value for the index (e.g., 100.0, 1000.0).
         is_active (bool): Whether this index is currently active.
+        last_date (date, optional): Date of the most recent canonical value.
+        last_value (float, optional): Most recent canonical index level.
+        last_return_pct (float, optional): Daily return of the most recent canonical value.
+            last_* fields are automatically maintained during canonicalization so
+            index listings can show the current level without joining MarketIndexValue.
         created_at (datetime): When the index record was created.
         updated_at (datetime): When the index record was last updated.
 
@@ -91,14 +98,34 @@ class MarketIndex(models.Model):
         help_text=_("Base value for the index (e.g., 100.0, 1000.0)"),
     )
     is_active = models.BooleanField(_("Is Active"), default=True)
-    created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
-    updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
+    last_date = models.DateField(
+        _("Last Date"),
+        blank=True,
+        null=True,
+        help_text=_("Date of the most recent canonical value for this index"),
+    )
+    last_value = models.FloatField(
+        _("Last Value"),
+        blank=True,
+        null=True,
+        help_text=_("Most recent canonical index level"),
+    )
+    last_return_pct = models.FloatField(
+        _("Last Return %"),
+        blank=True,
+        null=True,
+        help_text=_("Daily return of the most recent canonical value"),
+    )
+    created_at = models.DateTimeField(
+        _("Created At"), auto_now_add=True, db_default=Now()
+    )
+    updated_at = models.DateTimeField(_("Updated At"), auto_now=True, db_default=Now())
 
     class Meta:
         verbose_name = _("Market Index")
         verbose_name_plural = _("Market Indices")
+        # code is unique, so its constraint index already serves code lookups
         indexes = [
-            models.Index(fields=["code"]),
             models.Index(fields=["currency"]),
             models.Index(fields=["is_active"]),
         ]
@@ -108,6 +135,14 @@ class MarketIndex(models.Model):
         return f"{self.name} ({self.code})"
 
 
+class MarketIndexConstituentQuerySet(models.QuerySet):
+    """QuerySet for MarketIndexConstituent."""
+
+    def with_display(self) -> MarketIndexConstituentQuerySet:
+        """Join the relations used by __str__ to avoid one query per row."""
+        return self.select_related("index", "instrument", "source")
+
+
 class MarketIndexConstituent(models.Model):
     """
     MarketIndexConstituent model representing time-versioned index constituents.
@@ -201,14 +236,24 @@ class MarketIndexConstituent(models.Model):
         verbose_name=_("Source"),
         help_text=_("Source of this constituent data (optional)"),
     )
-    created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
-    updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
+    created_at = models.DateTimeField(
+        _("Created At"), auto_now_add=True, db_default=Now()
+    )
+    updated_at = models.DateTimeField(_("Updated At"), auto_now=True, db_default=Now())
+
+    objects = MarketIndexConstituentQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("Market Index Constituent")
         verbose_name_plural = _("Market Index Constituents")
         indexes = [
-            models.Index(fields=["index", "as_of_date"]),
+            # Serves "top-N constituents of index X as of date D" without a sort;
+            # its (index, as_of_date) prefix also serves per-index date lookups.
+            models.Index(
+                fields=["index", "-as_of_date", "-weight"],
+                include=["instrument", "shares"],
+                name="idx_constituent_topk",
+            ),
             models.Index(fields=["instrument", "as_of_date"]),
             models.Index(fields=["as_of_date"]),
         ]
@@ -220,6 +265,46 @@ class MarketIndexConstituent(models.Model):
         return f"{self.index.code} - {self.instrument.name} ({self.weight}%) as of {self.as_of_date}"
 
 
+class MarketIndexValueObservationQuerySet(models.QuerySet):
+    """QuerySet for MarketIndexValueObservation."""
+
+    def with_display(self) -> MarketIndexValueObservationQuerySet:
+        """Join the relations used by __str__ to avoid one query per row."""
+        return self.select_related("index", "source")
+
+
+class MarketIndexValueObservationManager(
+    models.Manager.from_queryset(MarketIndexValueObservationQuerySet)
+):
+    """
+    Manager for MarketIndexValueObservation with a batched ETL upsert path.
+    """
+
+    def bulk_upsert(
+        self, objs: list[MarketIndexValueObservation], batch_size: int = 2000
+    ) -> list[MarketIndexValueObservation]:
+        """
+        Insert observations, updating existing rows on (index, date, source, revision) conflict.
+
+        Issues one multi-row INSERT ... ON CONFLICT DO UPDATE per batch instead
+        of one round trip per row.
+
+        Args:
+            objs: Unsaved MarketIndexValueObservation instances.
+            batch_size: Number of rows per INSERT statement.
+
+        Returns:
+            list: The observations passed in.
+        """
+        return self.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=["value", "return_pct", "observed_at", "updated_at"],
+            unique_fields=["index", "date", "source", "revision"],
+        )
+
+
 class MarketIndexValueObservation(models.Model):
     """
     MarketIndexValueObservation model representing multi-source raw index value observations.
@@ -299,17 +384,29 @@ class MarketIndexValueObservation(models.Model):
         _("Observed At"),
         help_text=_("When this observation was received/recorded"),
     )
-    created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
-    updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
+    created_at = models.DateTimeField(
+        _("Created At"), auto_now_add=True, db_default=Now()
+    )
+    updated_at = models.DateTimeField(_("Updated At"), auto_now=True, db_default=Now())
+
+    objects = MarketIndexValueObservationManager()
 
     class Meta:
         verbose_name = _("Market Index Value Observation")
         verbose_name_plural = _("Market Index Value Observations")
+        # (index, date) lookups use the leading columns of the unique index
         indexes = [
-            models.Index(fields=["index", "date"]),
-            models.Index(fields=["date"]),
             models.Index(fields=["source", "date"]),
-            models.Index(fields=["observed_at"]),
+            # Append-only landing zone: rows arrive in date/observed_at order, so
+            # BRIN block summaries stay selective at a fraction of a B-tree's size.
+            PortableBrinIndex(
+                fields=["date"], pages_per_range=32, name="mivo_date_brin"
+            ),
+            PortableBrinIndex(
+                fields=["observed_at"],
+                pages_per_range=32,
+                name="mivo_observed_at_brin",
+            ),
         ]
         # Multiple observations per index/date/source/revision are allowed
         unique_together = [["index", "date", "source", "revision"]]
@@ -319,6 +416,14 @@ class MarketIndexValueObservation(models.Model):
         return f"{self.index.code} = {self.value} from {self.source.code} ({self.date})"
 
 
+class MarketIndexValueQuerySet(models.QuerySet):
+    """QuerySet for MarketIndexValue."""
+
+    def with_display(self) -> MarketIndexValueQuerySet:
+        """Join the relations used by __str__ to avoid one query per row."""
+        return self.select_related("index", "chosen_source", "observation")
+
+
 class MarketIndexValue(models.Model):
     """
     MarketIndexValue model representing canonical "chosen" index values for benchmarking.
@@ -333,8 +438,8 @@ class MarketIndexValue(models.Model):
         date (date): Date for which this index value is valid.
         chosen_source (MarketDataSource): The source that was selected for this canonical value.
         observation (MarketIndexValueObservation, optional): The observation that was selected.
-        value (decimal): Index level/value on this date (stored directly for performance).
-        return_pct (decimal, optional): Daily return as percentage.
+        value (float): Index level/value on this date (stored directly for performance).
+        return_pct (float, optional): Daily return as percentage.
         selection_reason (str): Why this value was selected (AUTO_POLICY, MANUAL_OVERRIDE, etc.).
         selected_by (User, optional): User who manually selected this value (if manual override).
         selected_at (datetime): When this value was selected/canonicalized.
@@ -347,6 +452,8 @@ class MarketIndexValue(models.Model):
         - Manual overrides are tracked for audit purposes.
         - Used for benchmarking, performance comparison, and macro context.
         - NOT used to value individual holdings (that's what InstrumentPrice is for).
+        - value/return_pct are double precision: index levels are presentation numbers,
+          not money. The exact Decimal values remain on MarketIndexValueObservation.
 
     Example:
         >>> index = MarketIndex.objects.get(code="BVMAC")
@@ -390,16 +497,12 @@ class MarketIndexValue(models.Model):
         verbose_name=_("Observation"),
         help_text=_("The observation that was selected (optional, for audit trail)"),
     )
-    value = models.DecimalField(
+    value = models.FloatField(
         _("Value"),
-        max_digits=20,
-        decimal_places=6,
         help_text=_("Index level/value on this date (stored directly for performance)"),
     )
-    return_pct = models.DecimalField(
+    return_pct = models.FloatField(
         _("Return %"),
-        max_digits=10,
-        decimal_places=4,
         blank=True,
         null=True,
         help_text=_("Daily return as percentage"),
@@ -424,15 +527,18 @@ class MarketIndexValue(models.Model):
         _("Selected At"),
         help_text=_("When this value was selected/canonicalized"),
     )
-    created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
-    updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
+    created_at = models.DateTimeField(
+        _("Created At"), auto_now_add=True, db_default=Now()
+    )
+    updated_at = models.DateTimeField(_("Updated At"), auto_now=True, db_default=Now())
+
+    objects = MarketIndexValueQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("Market Index Value")
         verbose_name_plural = _("Market Index Values")
+        # (index, date) lookups use the unique index
         indexes = [
-            models.Index(fields=["index", "date"]),
-            models.Index(fields=["date"]),
             models.Index(fields=["chosen_source"]),
         ]
         # One canonical value per index/date (global, not org-scoped)
@@ -524,7 +630,9 @@ class MarketIndexImport(models.Model):
         default=0,
         help_text="Number of canonical values created (if canonicalized).",
     )
-    created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
+    created_at = models.DateTimeField(
+        _("Created At"), auto_now_add=True, db_default=Now()
+    )
     completed_at = models.DateTimeField(
         _("Completed At"),
         blank=True,
@@ -552,4 +660,5 @@ class MarketIndexImport(models.Model):
         ]
 
     def __str__(self) -> str:
-        return f"{self.index.code} - {self.source.code} ({self.get_status_display()})"
+        status = IMPORT_STATUS_LABELS.get(self.status, self.status)
+        return f"{self.index.code} - {self.source.code} ({status})"
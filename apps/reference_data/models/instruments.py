@@ -9,13 +9,18 @@ from __future__ import annotations
 from django.conf import settings
 from django.db import models
 from django.db.models import UniqueConstraint
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 from djmoney.models.fields import CurrencyField
 
 from apps.reference_data.models.choices import FundCategory, ValuationMethod
 from apps.reference_data.models.issuers import Issuer
-from libs.models import OrganizationOwnedModel
+from libs.models import (
+    OrganizationManager,
+    OrganizationOwnedModel,
+    OrganizationQuerySet,
+)
 
 
 class InstrumentGroup(models.Model):
@@ -67,6 +72,14 @@ class InstrumentGroup(models.Model):
         return self.name
 
 
+class InstrumentTypeQuerySet(models.QuerySet):
+    """QuerySet helpers for InstrumentType."""
+
+    def with_related(self) -> InstrumentTypeQuerySet:
+        """Join the group read by ``InstrumentType.__str__``."""
+        return self.select_related("group")
+
+
 class InstrumentType(models.Model):
     """
     Represents a type of financial instrument.
@@ -88,6 +101,8 @@ class InstrumentType(models.Model):
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = InstrumentTypeQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Instrument Type")
         verbose_name_plural = _("Instrument Types")
@@ -97,9 +112,28 @@ class InstrumentType(models.Model):
         unique_together = [["group", "name"]]
 
     def __str__(self) -> str:
+        return self.display_name
+
+    @cached_property
+    def display_name(self) -> str:
+        """Group-qualified name, computed once per instance."""
         return f"{self.group.name} - {self.name}"
 
 
+class InstrumentQuerySet(OrganizationQuerySet):
+    """Organization-scoped QuerySet helpers for Instrument."""
+
+    def with_related(self) -> InstrumentQuerySet:
+        """Join the classification and issuer relations shown in list views."""
+        return self.select_related(
+            "instrument_group",
+            "instrument_type",
+            "instrument_type__group",
+            "issuer",
+            "issuer__issuer_group",
+        )
+
+
 class Instrument(OrganizationOwnedModel):
     """
     Instrument model representing financial instruments in portfolios.
@@ -203,10 +237,18 @@ class Instrument(OrganizationOwnedModel):
         verbose_name=_("Issuer"),
         help_text="The issuer of this instrument.",
     )
+    issuer_name = models.CharField(
+        _("Issuer Name"),
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="Denormalized issuer name for reports, synced from the issuer "
+        "on save.",
+    )
     country = CountryField(_("Country"), max_length=2, blank=True, null=True)
     sector = models.CharField(
         _("Sector"),
-        max_length=255,
+        max_length=128,
         blank=True,
         null=True,
         help_text="Economic sector classification.",
@@ -221,7 +263,7 @@ class Instrument(OrganizationOwnedModel):
         help_text="Coupon rate for bonds (as percentage).",
     )
     coupon_frequency = models.CharField(
-        _("Coupon Frequency"), max_length=255, blank=True, null=True
+        _("Coupon Frequency"), max_length=32, blank=True, null=True
     )
     first_listing_date = models.DateField(
         _("First Listing Date"),
@@ -288,7 +330,7 @@ class Instrument(OrganizationOwnedModel):
     )
     valuation_method = models.CharField(
         _("Valuation Method"),
-        max_length=255,
+        max_length=32,
         choices=ValuationMethod.choices,
         default=ValuationMethod.MARK_TO_MARKET,
         help_text="How this instrument is valued.",
@@ -297,6 +339,8 @@ class Instrument(OrganizationOwnedModel):
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = OrganizationManager.from_queryset(InstrumentQuerySet)()
+
     class Meta:
         verbose_name = _("Instrument")
         verbose_name_plural = _("Instruments")
@@ -305,13 +349,22 @@ class Instrument(OrganizationOwnedModel):
             models.Index(fields=["organization", "ticker"]),
             models.Index(fields=["organization", "instrument_group"]),
             models.Index(fields=["organization", "instrument_type"]),
-            models.Index(fields=["organization", "currency"]),
             models.Index(fields=["organization", "issuer"]),
             models.Index(fields=["organization", "country"]),
             models.Index(fields=["organization", "maturity_date"]),
             models.Index(fields=["organization", "first_listing_date"]),
-            models.Index(fields=["organization", "next_coupon_date"]),
-            models.Index(fields=["organization", "fund_category"]),
+            # Coupon schedules only concern active instruments
+            models.Index(
+                fields=["organization", "next_coupon_date"],
+                condition=models.Q(is_active=True),
+                name="instr_org_active_nxtcpn",
+            ),
+            # Only active funds carry a category; skip every other instrument
+            models.Index(
+                fields=["organization", "fund_category"],
+                condition=models.Q(fund_category__isnull=False, is_active=True),
+                name="instr_org_active_fund_cat",
+            ),
         ]
         constraints = [
             UniqueConstraint(
@@ -326,6 +379,32 @@ class Instrument(OrganizationOwnedModel):
             ),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded issuer so save() only re-reads it on change
+        instance._loaded_issuer_id = instance.__dict__.get("issuer_id")
+        return instance
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save instrument, copying the issuer name for report queries.
+
+        The issuer is only read when it changed since load (or is already
+        cached on the instance); issuer renames are pushed to instruments by
+        Issuer.save().
+        """
+        issuer_changed = self.issuer_id != getattr(self, "_loaded_issuer_id", None)
+        if self.issuer_id is not None and (
+            issuer_changed or Instrument.issuer.is_cached(self)
+        ):
+            self.issuer_name = self.issuer.name
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "issuer_name"}
+        super().save(*args, **kwargs)
+        self._loaded_issuer_id = self.issuer_id
+
     def __str__(self) -> str:
         if self.isin:
             return f"{self.name} ({self.isin})"
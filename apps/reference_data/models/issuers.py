@@ -6,16 +6,43 @@ Models for entities that issue financial instruments and their credit ratings.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from itertools import islice
+
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce, Lower
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 
 from apps.reference_data.utils.issuer_codes import (
+    ISSUER_CODE_PATTERN,
     generate_issuer_code,
+    suffix_issuer_code,
     validate_issuer_code,
 )
-from libs.models import OrganizationOwnedModel
+from libs.models import (
+    OrganizationManager,
+    OrganizationOwnedModel,
+    OrganizationQuerySet,
+)
+from libs.postgres import PortableBrinIndex, PortableGinIndex, is_postgres
+
+# Upper bound on numeric suffixes tried when a generated issuer_code collides
+MAX_ISSUER_CODE_SUFFIX = 999
+
+# Saves retried when concurrent writers keep claiming the chosen issuer_code
+MAX_ISSUER_CODE_SAVE_ATTEMPTS = 5
+
+
+class IssuerGroupQuerySet(models.QuerySet):
+    """QuerySet helpers for IssuerGroup."""
+
+    def for_list(self) -> IssuerGroupQuerySet:
+        """Skip the description TextField, which list views do not show."""
+        return self.defer("description")
 
 
 class IssuerGroup(models.Model):
@@ -46,7 +73,6 @@ class IssuerGroup(models.Model):
         _("Code"),
         max_length=50,
         unique=True,
-        db_index=True,
         help_text="Short code identifier (e.g., 'BANK', 'SOV').",
     )
     parent = models.ForeignKey(
@@ -61,32 +87,92 @@ class IssuerGroup(models.Model):
     description = models.TextField(_("Description"), blank=True)
     is_active = models.BooleanField(_("Is Active"), default=True)
     sort_order = models.IntegerField(_("Sort Order"), default=0)
+    full_path = models.CharField(
+        _("Full Path"),
+        max_length=1024,
+        blank=True,
+        editable=False,
+        help_text="Denormalized hierarchical path (e.g., 'Financial > Bank'), "
+        "maintained on save.",
+    )
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = IssuerGroupQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Issuer Group")
         verbose_name_plural = _("Issuer Groups")
         ordering = ["sort_order", "name"]
         indexes = [
-            models.Index(fields=["code"]),
             models.Index(fields=["parent", "is_active"]),
         ]
 
     def __str__(self) -> str:
         """Return full path for hierarchical display."""
-        if self.parent:
-            return f"{self.parent} > {self.name}"
-        return self.name
+        return self.get_full_path()
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save group, refreshing the denormalized full_path.
+
+        When the path changes (rename or re-parenting), descendants are saved
+        too so their paths stay in sync.
+        """
+        is_new = self._state.adding
+        previous_path = self.full_path
+        self.full_path = self._build_full_path()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "full_path"}
+
+        super().save(*args, **kwargs)
+
+        if not is_new and self.full_path != previous_path:
+            for child in self.children.all():
+                child.save(update_fields=["full_path", "updated_at"])
+
+    def _build_full_path(self) -> str:
+        """Build the path from the parent's stored path (single lookup)."""
+        if self.parent_id is None:
+            return self.name
+        return f"{self.parent.get_full_path()} > {self.name}"
 
     def get_full_path(self) -> str:
         """Get full hierarchical path."""
-        path = [self.name]
-        parent = self.parent
-        while parent:
-            path.insert(0, parent.name)
-            parent = parent.parent
-        return " > ".join(path)
+        if self.full_path:
+            return self.full_path
+        return self._build_full_path()
+
+
+class IssuerQuerySet(OrganizationQuerySet):
+    """Organization-scoped QuerySet helpers for Issuer."""
+
+    def with_related(self) -> IssuerQuerySet:
+        """
+        Join the issuer group shown in list views.
+
+        The current rating is denormalized onto Issuer, so list views need no
+        rating join at all.
+        """
+        return self.select_related("issuer_group")
+
+    def with_active_ratings(self) -> IssuerQuerySet:
+        """
+        Prefetch active ratings, newest first, into ``active_ratings``.
+
+        Listing issuers with their current ratings then costs one extra query
+        instead of one per issuer.
+        """
+        return self.prefetch_related(
+            Prefetch(
+                "ratings",
+                queryset=IssuerRating.objects.filter(is_active=True).order_by(
+                    "-date_assigned", "agency"
+                ),
+                to_attr="active_ratings",
+            )
+        )
 
 
 class Issuer(OrganizationOwnedModel):
@@ -104,8 +190,10 @@ class Issuer(OrganizationOwnedModel):
         lei (str, optional): Legal Entity Identifier (20-character code).
         country (str): Country code of the issuer's domicile.
         issuer_group (IssuerGroup, optional): Group classification (foreign key to IssuerGroup).
-        rating (str, optional): Credit rating (e.g., "AAA", "BB+").
-        rating_agency (str, optional): Rating agency that provided the rating.
+        current_rating (str): Latest active credit rating (e.g., "AAA", "BB+"),
+            denormalized from IssuerRating.
+        current_rating_agency (str): Agency that assigned the current rating.
+        current_rating_date (date, optional): Date the current rating became effective.
         is_active (bool): Whether this issuer is currently active.
         created_at (datetime): When the issuer record was created.
         updated_at (datetime): When the issuer record was last updated.
@@ -128,7 +216,6 @@ class Issuer(OrganizationOwnedModel):
         blank=True,
         null=True,
         unique=True,
-        db_index=True,
         help_text=(
             "Stable identifier code following format [REGION]-[TYPE]-[IDENTIFIER] "
             "(e.g., CM-SOV-GOVT, GA-BNK-BANQUEDEGAB). "
@@ -155,20 +242,57 @@ class Issuer(OrganizationOwnedModel):
         verbose_name=_("Issuer Group"),
         help_text="Group classification for this issuer.",
     )
+    # Denormalized from the latest active IssuerRating so list views can show
+    # the current rating without joining ratings
+    current_rating = models.CharField(
+        _("Current Rating"), max_length=16, blank=True, editable=False
+    )
+    current_rating_agency = models.CharField(
+        _("Current Rating Agency"), max_length=20, blank=True, editable=False
+    )
+    current_rating_date = models.DateField(
+        _("Current Rating Date"), null=True, blank=True, editable=False
+    )
     is_active = models.BooleanField(_("Is Active"), default=True)
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    # Written only by sync_current_ratings()
+    CURRENT_RATING_FIELDS = (
+        "current_rating",
+        "current_rating_agency",
+        "current_rating_date",
+    )
+
+    objects = OrganizationManager.from_queryset(IssuerQuerySet)()
+
     class Meta:
         verbose_name = _("Issuer")
         verbose_name_plural = _("Issuers")
         indexes = [
-            models.Index(fields=["organization", "name"]),
             models.Index(fields=["organization", "country"]),
             models.Index(fields=["organization", "issuer_group"]),
-            models.Index(fields=["issuer_code"]),
+            # Trigram index so name searches (admin icontains) avoid seq scans
+            PortableGinIndex(
+                fields=["name"], opclasses=["gin_trgm_ops"], name="issuer_name_trgm"
+            ),
+        ]
+        constraints = [
+            # Case-insensitive so "Republic of Cameroon" and "REPUBLIC OF
+            # CAMEROON" cannot coexist; the index also serves Lower(name) lookups
+            models.UniqueConstraint(
+                Lower("name"),
+                "organization",
+                name="unique_issuer_lower_name_per_org",
+            ),
+            # Enforced by the database for writes that bypass save()
+            # (bulk_create/bulk_update/queryset updates)
+            models.CheckConstraint(
+                condition=models.Q(issuer_code__isnull=True)
+                | models.Q(issuer_code__regex=ISSUER_CODE_PATTERN.pattern),
+                name="issuer_code_format",
+            ),
         ]
-        unique_together = [["organization", "name"]]
 
     def clean(self) -> None:
         """
@@ -189,78 +313,245 @@ class Issuer(OrganizationOwnedModel):
 
         Auto-generates issuer_code following the format [REGION]-[TYPE]-[IDENTIFIER]
         if not provided. Validates format if issuer_code is manually provided.
-        """
-        # Auto-generate issuer_code if missing
-        if not self.issuer_code:
-            issuer_group_code = self.issuer_group.code if self.issuer_group else None
-            country_code = str(self.country) if self.country else None
-            self.issuer_code = generate_issuer_code(
-                name=self.name,
-                country=country_code,
-                issuer_group_code=issuer_group_code,
-            )
 
-            # Handle potential uniqueness conflicts by appending a number
-            # Use _base_manager to check global uniqueness (bypass organization filter)
-            if self.pk:
-                # For updates, check if code conflicts with other issuers
-                base_code = self.issuer_code
-                counter = 1
-                while (
-                    Issuer._base_manager.filter(issuer_code=self.issuer_code)
-                    .exclude(pk=self.pk)
-                    .exists()
-                ):
-                    # Append number to identifier part
-                    parts = base_code.rsplit("-", 1)
-                    if len(parts) == 2:
-                        region_type, identifier = parts
-                        # Truncate identifier if needed to fit max_length
-                        max_id_length = 10 - len(str(counter))
-                        identifier = (
-                            identifier[:max_id_length] if max_id_length > 0 else "X"
-                        )
-                        self.issuer_code = f"{region_type}-{identifier}{counter}"
-                    else:
-                        self.issuer_code = f"{base_code}{counter}"
-                    counter += 1
-                    if counter > 999:  # Safety limit
-                        raise ValueError("Unable to generate unique issuer code")
-            else:
-                # For new issuers, check conflicts before saving
-                base_code = self.issuer_code
-                counter = 1
-                while Issuer._base_manager.filter(
-                    issuer_code=self.issuer_code
-                ).exists():
-                    # Append number to identifier part
-                    parts = base_code.rsplit("-", 1)
-                    if len(parts) == 2:
-                        region_type, identifier = parts
-                        # Truncate identifier if needed to fit max_length
-                        max_id_length = 10 - len(str(counter))
-                        identifier = (
-                            identifier[:max_id_length] if max_id_length > 0 else "X"
-                        )
-                        self.issuer_code = f"{region_type}-{identifier}{counter}"
-                    else:
-                        self.issuer_code = f"{base_code}{counter}"
-                    counter += 1
-                    if counter > 999:  # Safety limit
-                        raise ValueError("Unable to generate unique issuer code")
+        Generated codes are written optimistically: the save is attempted inside
+        a savepoint and, only when the database reports an actual issuer_code
+        collision, the next free numeric suffix is looked up with one query.
+        The unique constraint stays the final arbiter for concurrent writers.
+
+        The denormalized current_rating* fields are owned by
+        sync_current_ratings() and are left out of updates, so saving an
+        instance loaded before a rating change does not revert them.
 
-        # Validate issuer code format before saving
+        Raises:
+            ValidationError: If issuer_code format is invalid.
+            ValueError: If no free suffixed issuer code can be found.
+        """
+        is_new = self._state.adding
+        if not is_new and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in self.CURRENT_RATING_FIELDS
+            ]
         if self.issuer_code:
+            # Validate manually provided issuer code format before saving
             is_valid, error_message = validate_issuer_code(self.issuer_code)
             if not is_valid:
                 raise ValidationError({"issuer_code": error_message})
+            super().save(*args, **kwargs)
+        else:
+            self._save_with_generated_code(*args, **kwargs)
+
+        if not is_new and self.name != getattr(self, "_loaded_name", None):
+            # Keep the denormalized Instrument.issuer_name in sync on renames
+            Issuer.sync_instrument_names([self.pk])
+        self._loaded_name = self.name
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded name so save() only syncs instruments on renames
+        instance._loaded_name = instance.__dict__.get("name")
+        return instance
+
+    def _save_with_generated_code(self, *args, **kwargs) -> None:
+        """Generate issuer_code and save, resolving code collisions."""
+        # Generated codes always match ISSUER_CODE_PATTERN, so skip validation
+        issuer_group_code = self.issuer_group.code if self.issuer_group else None
+        country_code = str(self.country) if self.country else None
+        self.issuer_code = generate_issuer_code(
+            name=self.name,
+            country=country_code,
+            issuer_group_code=issuer_group_code,
+        )
+
+        base_code = self.issuer_code
+        for _attempt in range(MAX_ISSUER_CODE_SAVE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                # Only retry on an issuer_code collision; other constraint
+                # violations (e.g. duplicate name in the organization) propagate.
+                # Use _base_manager to check global uniqueness (bypass organization filter)
+                if (
+                    not Issuer._base_manager.filter(issuer_code=self.issuer_code)
+                    .exclude(pk=self.pk)
+                    .exists()
+                ):
+                    raise
+                self.issuer_code = self._next_free_code(base_code)
 
-        super().save(*args, **kwargs)
+        raise ValueError("Unable to generate unique issuer code")
+
+    @classmethod
+    def sync_instrument_names(cls, issuer_ids: list[int]) -> int:
+        """
+        Copy issuer names onto the denormalized Instrument.issuer_name.
+
+        Runs a single UPDATE with a correlated subquery, so callers that write
+        issuers in bulk (bypassing save()) can refresh all their instruments
+        at once.
+
+        Args:
+            issuer_ids: IDs of issuers whose instruments should be refreshed.
+
+        Returns:
+            int: Number of instruments updated.
+        """
+        instrument_model = cls._meta.get_field("instruments").related_model
+        return instrument_model._base_manager.filter(issuer_id__in=issuer_ids).update(
+            issuer_name=Subquery(
+                cls._base_manager.filter(pk=OuterRef("issuer_id")).values("name")[:1]
+            )
+        )
+
+    @classmethod
+    def sync_current_ratings(cls, issuer_ids: list[int]) -> int:
+        """
+        Copy the latest active rating onto the denormalized current_rating fields.
+
+        Runs a single UPDATE with correlated subqueries. Issuers without an
+        active rating have the fields cleared.
+
+        Args:
+            issuer_ids: IDs of issuers whose current rating should be refreshed.
+
+        Returns:
+            int: Number of issuers updated.
+        """
+        latest = (
+            cls._meta.get_field("ratings")
+            .related_model._base_manager.filter(
+                issuer_id=OuterRef("pk"), is_active=True
+            )
+            .order_by("-date_assigned", "agency")
+        )
+        return cls._base_manager.filter(pk__in=issuer_ids).update(
+            current_rating=Coalesce(Subquery(latest.values("rating")[:1]), Value("")),
+            current_rating_agency=Coalesce(
+                Subquery(latest.values("agency")[:1]), Value("")
+            ),
+            current_rating_date=Subquery(latest.values("date_assigned")[:1]),
+        )
+
+    @classmethod
+    def _next_free_code(cls, base_code: str) -> str:
+        """
+        Find the first free suffixed variant of a taken issuer code.
+
+        All codes sharing the shortest possible suffixed prefix are loaded in
+        one query and the suffix is picked in memory, instead of probing each
+        counter value against the database.
+
+        Args:
+            base_code: Generated issuer code that is already taken.
+
+        Returns:
+            str: First free suffixed issuer code.
+
+        Raises:
+            ValueError: If every suffix up to MAX_ISSUER_CODE_SUFFIX is taken.
+        """
+        region_type, _, identifier = base_code.rpartition("-")
+        # Suffixing truncates the identifier to leave room for the counter digits
+        shortest = 10 - len(str(MAX_ISSUER_CODE_SUFFIX))
+        taken = set(
+            cls._base_manager.filter(
+                issuer_code__startswith=f"{region_type}-{identifier[:shortest]}"
+            ).values_list("issuer_code", flat=True)
+        )
+        for counter in range(1, MAX_ISSUER_CODE_SUFFIX + 1):
+            candidate = suffix_issuer_code(base_code, counter)
+            if candidate not in taken:
+                return candidate
+        raise ValueError("Unable to generate unique issuer code")
+
+    @classmethod
+    def generate_unique_codes(cls, issuers: list[Issuer]) -> list[Issuer]:
+        """
+        Assign globally unique issuer codes to unsaved issuers in bulk.
+
+        Issuers without an issuer_code get a generated code. Collisions with
+        existing rows are found with one ``issuer_code IN (...)`` query per
+        round and resolved in memory together with collisions inside the
+        batch; a further round is only needed for codes that had to be
+        suffixed. The returned issuers are ready for ``bulk_create``.
+
+        Args:
+            issuers: Issuers to assign codes to (issuers with a code are kept).
+
+        Returns:
+            list[Issuer]: The same issuers, with issuer_code populated.
+
+        Raises:
+            ValueError: If no free suffixed issuer code can be found.
+
+        Example:
+            >>> batch = Issuer.generate_unique_codes(new_issuers)
+            >>> Issuer.objects.bulk_create(batch, batch_size=1000)
+        """
+        # Each pending entry is [issuer, base_code, counter, candidate_code]
+        pending = []
+        for issuer in issuers:
+            if issuer.issuer_code:
+                continue
+            base_code = generate_issuer_code(
+                name=issuer.name,
+                country=str(issuer.country) if issuer.country else None,
+                issuer_group_code=(
+                    issuer.issuer_group.code if issuer.issuer_group else None
+                ),
+            )
+            pending.append([issuer, base_code, 0, base_code])
+
+        taken: set[str] = set()
+        while pending:
+            candidates = {entry[3] for entry in pending}
+            # Use _base_manager to check global uniqueness (bypass organization filter)
+            taken.update(
+                cls._base_manager.filter(issuer_code__in=candidates).values_list(
+                    "issuer_code", flat=True
+                )
+            )
+
+            unresolved = []
+            requested: set[str] = set()
+            for issuer, base_code, counter, candidate in pending:
+                # Skip codes known to be taken or requested by another issuer
+                while candidate in taken or candidate in requested:
+                    counter += 1
+                    if counter > MAX_ISSUER_CODE_SUFFIX:
+                        raise ValueError("Unable to generate unique issuer code")
+                    candidate = suffix_issuer_code(base_code, counter)
+                if candidate in candidates:
+                    issuer.issuer_code = candidate
+                    taken.add(candidate)
+                else:
+                    # Suffixed code not checked against the database yet
+                    requested.add(candidate)
+                    unresolved.append([issuer, base_code, counter, candidate])
+            pending = unresolved
+
+        return issuers
 
     def __str__(self) -> str:
         return self.name
 
 
+class IssuerRatingQuerySet(models.QuerySet):
+    """QuerySet helpers for IssuerRating."""
+
+    def with_display(self) -> IssuerRatingQuerySet:
+        """Join the issuer read by ``IssuerRating.__str__``."""
+        return self.select_related("issuer")
+
+
 class IssuerRating(models.Model):
     """
     Represents a credit rating assigned to an Issuer by a specific rating agency at a point in time.
@@ -302,13 +593,13 @@ class IssuerRating(models.Model):
     )
     agency = models.CharField(
         _("Rating Agency"),
-        max_length=255,
+        max_length=20,
         choices=RatingAgency.choices,
         help_text="Agency that assigned the rating (e.g., 'S&P', 'Moody's', 'Fitch').",
     )
     rating = models.CharField(
         _("Rating"),
-        max_length=255,
+        max_length=16,
         help_text="Credit rating assigned (e.g., 'AAA', 'BB+').",
     )
     date_assigned = models.DateField(
@@ -321,16 +612,41 @@ class IssuerRating(models.Model):
     )
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
 
+    objects = IssuerRatingQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Issuer Rating")
         verbose_name_plural = _("Issuer Ratings")
-        ordering = ["-date_assigned", "agency"]
         indexes = [
-            models.Index(fields=["issuer", "agency"]),
-            models.Index(fields=["issuer", "date_assigned"]),
-            models.Index(fields=["agency", "is_active"]),
+            # Matches the "latest ratings for an issuer" order (current rating
+            # sync, rating prefetches) so rows stream pre-sorted
+            models.Index(
+                fields=["issuer", "-date_assigned", "agency"],
+                name="ir_issuer_date_desc",
+            ),
+            # Covering index: active ratings per agency as an index-only scan
+            models.Index(
+                fields=["agency"],
+                include=["issuer", "rating", "date_assigned"],
+                condition=models.Q(is_active=True),
+                name="ir_active_cov",
+            ),
+            # Ratings are appended over time; BRIN keeps date range scans cheap
+            PortableBrinIndex(
+                fields=["date_assigned"], pages_per_range=32, name="ir_date_brin"
+            ),
+            PortableBrinIndex(
+                fields=["created_at"], pages_per_range=32, name="ir_created_at_brin"
+            ),
         ]
         unique_together = [["issuer", "agency", "date_assigned"]]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["issuer", "agency"],
+                condition=models.Q(is_active=True),
+                name="uniq_active_rating_per_agency",
+            ),
+        ]
 
     def __str__(self) -> str:
         """
@@ -340,3 +656,142 @@ class IssuerRating(models.Model):
             str: Human-readable string of the form "Issuer - Agency: Rating (as of date)".
         """
         return f"{self.issuer.name} - {self.agency}: {self.rating} (as of {self.date_assigned})"
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save rating, refreshing the issuer's denormalized current rating.
+
+        An active rating supersedes the agency's current active rating when
+        its date_assigned is at least as recent; that rating is deactivated
+        first to satisfy the one-active-rating-per-agency constraint. An
+        older (backfilled) rating is saved inactive so the latest rating
+        stays current. The agency's active rating is locked while this runs,
+        and all writes commit or roll back together.
+        """
+        with transaction.atomic():
+            if self.is_active:
+                current = list(
+                    IssuerRating._base_manager.select_for_update()
+                    .filter(
+                        issuer_id=self.issuer_id, agency=self.agency, is_active=True
+                    )
+                    .exclude(pk=self.pk)
+                    .values_list("pk", "date_assigned")
+                )
+                if any(assigned > self.date_assigned for _pk, assigned in current):
+                    self.is_active = False
+                elif current:
+                    IssuerRating._base_manager.filter(
+                        pk__in=[pk for pk, _assigned in current]
+                    ).update(is_active=False)
+            super().save(*args, **kwargs)
+            Issuer.sync_current_ratings([self.issuer_id])
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete rating, refreshing the issuer's denormalized current rating.
+        """
+        issuer_id = self.issuer_id
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            Issuer.sync_current_ratings([issuer_id])
+        return result
+
+    @classmethod
+    def bulk_load(cls, rows: Iterable[tuple], batch_size: int = 1000) -> int:
+        """
+        Load a stream of ratings (e.g. a quarterly agency feed) in batches.
+
+        On PostgreSQL rows are streamed with COPY instead of building a model
+        instance per row; other backends fall back to bulk_create(). The feed
+        is consumed batch by batch, so it is never held in memory at once.
+        The save() semantics are applied set-wise per batch: for each
+        (issuer, agency) pair only the latest incoming active rating can stay
+        active, it supersedes the pair's stored active rating only if it is
+        at least as recent (otherwise it is loaded inactive), and the issuers'
+        denormalized current rating is refreshed afterwards. All batches run
+        in one transaction.
+
+        Args:
+            rows: Iterable of (issuer_id, agency, rating, date_assigned,
+                is_active) tuples.
+            batch_size: Rows per batch (default: 1000).
+
+        Returns:
+            int: Number of ratings loaded.
+        """
+        rows = iter(rows)
+        loaded = 0
+        now = timezone.now()
+        with transaction.atomic():
+            while batch := [list(row) for row in islice(rows, batch_size)]:
+                cls._load_batch(batch, now)
+                loaded += len(batch)
+        return loaded
+
+    @classmethod
+    def _load_batch(cls, batch: list[list], now) -> None:
+        """Apply bulk_load() supersede rules to one batch and write it."""
+        latest_active = {}
+        for row in batch:
+            issuer_id, agency, _rating, date_assigned, is_active = row
+            current = latest_active.get((issuer_id, agency))
+            if is_active and (current is None or current[3] <= date_assigned):
+                latest_active[(issuer_id, agency)] = row
+
+        # Compare with the stored active ratings of the batch's pairs: a newer
+        # stored rating stays active, an older one is superseded
+        stored = cls._base_manager.filter(
+            is_active=True,
+            issuer_id__in={issuer_id for issuer_id, _agency in latest_active},
+            agency__in={agency for _issuer_id, agency in latest_active},
+        ).values_list("pk", "issuer_id", "agency", "date_assigned")
+        superseded = []
+        for pk, issuer_id, agency, date_assigned in stored:
+            row = latest_active.get((issuer_id, agency))
+            if row is None:
+                continue
+            if date_assigned > row[3]:
+                row[4] = False
+            else:
+                superseded.append(pk)
+        for row in batch:
+            if row[4] and latest_active[(row[0], row[1])] is not row:
+                row[4] = False
+
+        if superseded:
+            cls._base_manager.filter(pk__in=superseded).update(is_active=False)
+        if is_postgres(connection):
+            quote = connection.ops.quote_name
+            columns = ", ".join(
+                quote(cls._meta.get_field(name).column)
+                for name in (
+                    "issuer",
+                    "agency",
+                    "rating",
+                    "date_assigned",
+                    "is_active",
+                    "created_at",
+                )
+            )
+            with connection.cursor() as cursor:
+                with cursor.copy(
+                    f"COPY {quote(cls._meta.db_table)} ({columns}) FROM STDIN"
+                ) as copy:
+                    for row in batch:
+                        copy.write_row((*row, now))
+        else:
+            cls._base_manager.bulk_create(
+                [
+                    cls(
+                        issuer_id=issuer_id,
+                        agency=agency,
+                        rating=rating,
+                        date_assigned=date_assigned,
+                        is_active=is_active,
+                    )
+                    for issuer_id, agency, rating, date_assigned, is_active in batch
+                ],
+                batch_size=len(batch),
+            )
+        Issuer.sync_current_ratings({row[0] for row in batch})
@@ -9,7 +9,15 @@ from __future__ import annotations
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from libs.models import OrganizationOwnedModel
+from libs.models import (
+    OrganizationManager,
+    OrganizationOwnedModel,
+    OrganizationQuerySet,
+)
+
+# Valid priority range, enforced by database check constraints
+MIN_PRIORITY = 1
+MAX_PRIORITY = 1000
 
 
 class MarketDataSource(models.Model):
@@ -60,7 +68,7 @@ class MarketDataSource(models.Model):
         max_length=255,
         help_text=_("Full name of the source"),
     )
-    priority = models.IntegerField(
+    priority = models.SmallIntegerField(
         _("Priority"),
         default=100,
         help_text=_(
@@ -85,16 +93,35 @@ class MarketDataSource(models.Model):
     class Meta:
         verbose_name = _("Market Data Source")
         verbose_name_plural = _("Market Data Sources")
-        ordering = ["priority", "code"]
         indexes = [
             models.Index(fields=["code"]),
-            models.Index(fields=["priority", "is_active"]),
+            # Source selection only considers active sources
+            models.Index(
+                fields=["priority", "code"],
+                condition=models.Q(is_active=True),
+                name="mds_active_priority",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(priority__gte=MIN_PRIORITY)
+                & models.Q(priority__lte=MAX_PRIORITY),
+                name="mds_priority_range",
+            ),
         ]
 
     def __str__(self) -> str:
         return f"{self.name} ({self.code})"
 
 
+class MarketDataSourcePriorityQuerySet(OrganizationQuerySet):
+    """Organization-scoped QuerySet helpers for MarketDataSourcePriority."""
+
+    def with_display(self) -> MarketDataSourcePriorityQuerySet:
+        """Join the organization and source read by ``__str__``."""
+        return self.select_related("organization", "source")
+
+
 class MarketDataSourcePriority(OrganizationOwnedModel):
     """
     Organization-specific market data source priority override.
@@ -142,13 +169,15 @@ class MarketDataSourcePriority(OrganizationOwnedModel):
         verbose_name=_("Source"),
         help_text="Market data source this priority applies to.",
     )
-    priority = models.IntegerField(
+    priority = models.SmallIntegerField(
         _("Priority"),
         help_text="Priority rank for this org/data_type combination (lower = higher priority).",
     )
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = OrganizationManager.from_queryset(MarketDataSourcePriorityQuerySet)()
+
     class Meta:
         verbose_name = _("Market Data Source Priority Override")
         verbose_name_plural = _("Market Data Source Priority Overrides")
@@ -157,6 +186,36 @@ class MarketDataSourcePriority(OrganizationOwnedModel):
             models.Index(fields=["organization", "data_type", "priority"]),
             models.Index(fields=["organization", "data_type", "source"]),
         ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(priority__gte=MIN_PRIORITY)
+                & models.Q(priority__lte=MAX_PRIORITY),
+                name="mdsp_priority_range",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.organization.name} - {self.get_data_type_display()} - {self.source.code}: {self.priority}"
+
+    @classmethod
+    def get_overrides(cls, org_id: int) -> dict[tuple[str, int], int]:
+        """
+        Get all priority overrides for an organization in one query.
+
+        Canonicalization runs load this once and pass it down (see
+        apps.reference_data.utils.priority) instead of querying per
+        observation. Nothing is cached across runs, so edits made from any
+        process take effect on the next run.
+
+        Args:
+            org_id: Organization ID.
+
+        Returns:
+            dict: Mapping of (data_type, source_id) -> priority.
+        """
+        return {
+            (data_type, source_id): priority
+            for data_type, source_id, priority in cls._base_manager.filter(
+                organization_id=org_id
+            ).values_list("data_type", "source_id", "priority")
+        }
@@ -6,13 +6,54 @@ Models for instrument prices, including observations and canonical prices.
 
 from __future__ import annotations
 
+import hashlib
+import os
+from collections.abc import Iterable
+from itertools import islice
+
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from djmoney.models.fields import CurrencyField
 
-from apps.reference_data.models.choices import SelectionReason
+from apps.reference_data.models.choices import (
+    CleanOrDirty,
+    PriceType,
+    QuoteConvention,
+    SelectionReason,
+)
 from libs.choices import ImportStatus
+from libs.postgres import PortableBrinIndex, batched_upsert, stream_upsert
+
+# Upsert key (the unique_together) and upserted columns for observation ingest
+OBSERVATION_KEY_FIELDS = ["instrument", "date", "price_type", "source", "revision"]
+OBSERVATION_VALUE_FIELDS = [
+    "price",
+    "quote_convention",
+    "clean_or_dirty",
+    "volume",
+    "observed_at",
+]
+# Upsert key and the columns copied from the chosen observation for canonical prices
+CANONICAL_KEY_FIELDS = ["instrument", "date", "price_type"]
+CANONICAL_VALUE_FIELDS = [
+    "chosen_source",
+    "observation",
+    "price",
+    "quote_convention",
+    "clean_or_dirty",
+    "volume",
+    "currency",
+]
+
+
+class InstrumentPriceObservationQuerySet(models.QuerySet):
+    """QuerySet for InstrumentPriceObservation."""
+
+    def with_display(self) -> InstrumentPriceObservationQuerySet:
+        """Join the relations used by __str__ to avoid one query per row."""
+        return self.select_related("instrument", "source")
 
 
 class InstrumentPriceObservation(models.Model):
@@ -62,35 +103,10 @@ class InstrumentPriceObservation(models.Model):
         ... )
     """
 
-    class PriceType(models.TextChoices):
-        """Price type choices."""
-
-        CLOSE = "close", _("Close")
-        BID = "bid", _("Bid")
-        ASK = "ask", _("Ask")
-        MID = "mid", _("Mid")
-        OPEN = "open", _("Open")
-        HIGH = "high", _("High")
-        LOW = "low", _("Low")
-        NAV = "nav", _("NAV")  # For mutual funds
-
-    class QuoteConvention(models.TextChoices):
-        """Quote convention choices - how to interpret the price value."""
-
-        PRICE = "price", _("Price")  # Absolute price (equities, some bonds)
-        PERCENT_OF_PAR = "percent_of_par", _(
-            "Percent of Par"
-        )  # Common for bonds (e.g., 105.50 = 105.5%)
-        YIELD = "yield", _(
-            "Yield"
-        )  # Yield-to-maturity (sometimes provided instead of price)
-
-    class CleanOrDirty(models.TextChoices):
-        """Clean or dirty price indicator."""
-
-        CLEAN = "clean", _("Clean")  # Price excludes accrued interest
-        DIRTY = "dirty", _("Dirty")  # Price includes accrued interest
-        NA = "na", _("N/A")  # Not applicable (equities, funds, deposits)
+    # Shared with InstrumentPrice; kept as attributes for existing callers
+    PriceType = PriceType
+    QuoteConvention = QuoteConvention
+    CleanOrDirty = CleanOrDirty
 
     instrument = models.ForeignKey(
         "reference_data.Instrument",
@@ -104,7 +120,7 @@ class InstrumentPriceObservation(models.Model):
     )
     price_type = models.CharField(
         _("Price Type"),
-        max_length=10,
+        max_length=5,
         choices=PriceType.choices,
         default=PriceType.CLOSE,
         help_text=_("Type of price (close, bid, ask, etc.)"),
@@ -132,12 +148,12 @@ class InstrumentPriceObservation(models.Model):
     )
     clean_or_dirty = models.CharField(
         _("Clean or Dirty"),
-        max_length=10,
+        max_length=5,
         choices=CleanOrDirty.choices,
         default=CleanOrDirty.NA,
         help_text=_("Whether price includes accrued interest (CLEAN, DIRTY, NA)"),
     )
-    revision = models.SmallIntegerField(
+    revision = models.PositiveSmallIntegerField(
         _("Revision"),
         default=0,
         help_text=_("Revision number (0 = initial, 1+ = corrections)"),
@@ -164,14 +180,22 @@ class InstrumentPriceObservation(models.Model):
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = InstrumentPriceObservationQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Instrument Price Observation")
         verbose_name_plural = _("Instrument Price Observations")
         indexes = [
-            models.Index(fields=["instrument", "date", "price_type"]),
-            models.Index(fields=["date"]),
+            # (instrument, date, price_type) lookups use the unique_together index
             models.Index(fields=["source", "date"]),
-            models.Index(fields=["observed_at"]),
+            # Append-only landing zone; BRIN keeps date range scans cheap
+            # without per-row index maintenance on ETL inserts
+            PortableBrinIndex(
+                fields=["date"], pages_per_range=32, name="ipo_date_brin"
+            ),
+            PortableBrinIndex(
+                fields=["observed_at"], pages_per_range=32, name="ipo_observed_at_brin"
+            ),
         ]
         # Multiple observations per instrument/date/price_type/source/revision are allowed
         unique_together = [["instrument", "date", "price_type", "source", "revision"]]
@@ -180,6 +204,71 @@ class InstrumentPriceObservation(models.Model):
     def __str__(self) -> str:
         return f"{self.instrument.name} - {self.price} from {self.source.code} ({self.date})"
 
+    @classmethod
+    def bulk_ingest(
+        cls,
+        observations: Iterable[InstrumentPriceObservation],
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Insert or update observations in batches.
+
+        Each batch is a single INSERT ... ON CONFLICT DO UPDATE keyed on the
+        (instrument, date, price_type, source, revision) unique constraint,
+        replacing one update_or_create() round trip per row. All batches run
+        in one transaction (see libs.postgres.batched_upsert). Observations
+        must be unique on that key within the iterable.
+
+        Args:
+            observations: Unsaved InstrumentPriceObservation instances.
+            batch_size: Rows per statement (default: settings.PRICE_INGEST_BATCH_SIZE).
+
+        Returns:
+            int: Number of observations written.
+        """
+        return batched_upsert(
+            cls,
+            observations,
+            OBSERVATION_KEY_FIELDS,
+            OBSERVATION_VALUE_FIELDS,
+            batch_size or settings.PRICE_INGEST_BATCH_SIZE,
+        )
+
+    @classmethod
+    def copy_ingest(cls, rows: Iterable[tuple]) -> int:
+        """
+        Stream observations into the table with COPY, upserting on the key.
+
+        For the largest loads. On PostgreSQL rows are COPYed into a temporary
+        staging table (no model instances, no per-row statement) and merged
+        with one INSERT ... SELECT ... ON CONFLICT DO UPDATE, keeping the same
+        upsert semantics as bulk_ingest(). Other backends fall back to
+        bulk_ingest(). Rows must be unique on the observation key.
+
+        Args:
+            rows: Tuples ordered as OBSERVATION_KEY_FIELDS followed by
+                OBSERVATION_VALUE_FIELDS, with instrument and source given
+                as IDs.
+
+        Returns:
+            int: Number of rows written.
+        """
+        return stream_upsert(
+            cls,
+            OBSERVATION_KEY_FIELDS,
+            OBSERVATION_VALUE_FIELDS,
+            rows,
+            settings.PRICE_INGEST_BATCH_SIZE,
+        )
+
+
+class InstrumentPriceQuerySet(models.QuerySet):
+    """QuerySet for InstrumentPrice."""
+
+    def with_display(self) -> InstrumentPriceQuerySet:
+        """Join the relations used by __str__ to avoid one query per row."""
+        return self.select_related("instrument", "chosen_source")
+
 
 class InstrumentPrice(models.Model):
     """
@@ -234,35 +323,10 @@ class InstrumentPrice(models.Model):
         ... )
     """
 
-    class PriceType(models.TextChoices):
-        """Price type choices."""
-
-        CLOSE = "close", _("Close")
-        BID = "bid", _("Bid")
-        ASK = "ask", _("Ask")
-        MID = "mid", _("Mid")
-        OPEN = "open", _("Open")
-        HIGH = "high", _("High")
-        LOW = "low", _("Low")
-        NAV = "nav", _("NAV")  # For mutual funds
-
-    class QuoteConvention(models.TextChoices):
-        """Quote convention choices - how to interpret the price value."""
-
-        PRICE = "price", _("Price")  # Absolute price (equities, some bonds)
-        PERCENT_OF_PAR = "percent_of_par", _(
-            "Percent of Par"
-        )  # Common for bonds (e.g., 105.50 = 105.5%)
-        YIELD = "yield", _(
-            "Yield"
-        )  # Yield-to-maturity (sometimes provided instead of price)
-
-    class CleanOrDirty(models.TextChoices):
-        """Clean or dirty price indicator."""
-
-        CLEAN = "clean", _("Clean")  # Price excludes accrued interest
-        DIRTY = "dirty", _("Dirty")  # Price includes accrued interest
-        NA = "na", _("N/A")  # Not applicable (equities, funds, deposits)
+    # Shared with InstrumentPriceObservation; kept as attributes for existing callers
+    PriceType = PriceType
+    QuoteConvention = QuoteConvention
+    CleanOrDirty = CleanOrDirty
 
     instrument = models.ForeignKey(
         "reference_data.Instrument",
@@ -276,7 +340,7 @@ class InstrumentPrice(models.Model):
     )
     price_type = models.CharField(
         _("Price Type"),
-        max_length=10,
+        max_length=5,
         choices=PriceType.choices,
         default=PriceType.CLOSE,
         help_text=_("Type of price (close, bid, ask, etc.)"),
@@ -284,6 +348,8 @@ class InstrumentPrice(models.Model):
     chosen_source = models.ForeignKey(
         "reference_data.MarketDataSource",
         on_delete=models.PROTECT,
+        # Covered by the (chosen_source, date) index
+        db_index=False,
         related_name="canonical_market_data",
         verbose_name=_("Chosen Source"),
         help_text=_("The source that was selected for this canonical price"),
@@ -312,7 +378,7 @@ class InstrumentPrice(models.Model):
     )
     clean_or_dirty = models.CharField(
         _("Clean or Dirty"),
-        max_length=10,
+        max_length=5,
         choices=CleanOrDirty.choices,
         default=CleanOrDirty.NA,
         help_text=_("Whether price includes accrued interest (CLEAN, DIRTY, NA)"),
@@ -355,14 +421,30 @@ class InstrumentPrice(models.Model):
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = InstrumentPriceQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Instrument Price")
         verbose_name_plural = _("Instrument Prices")
         indexes = [
-            models.Index(fields=["instrument", "date"]),
-            models.Index(fields=["date"]),
-            models.Index(fields=["instrument", "date", "price_type"]),
-            models.Index(fields=["chosen_source"]),
+            # Canonical prices are written date by date; BRIN serves
+            # valuation-window range scans at a fraction of a B-tree's size
+            PortableBrinIndex(fields=["date"], pages_per_range=32, name="ip_date_brin"),
+            # Covering index: valuation reads are served by an index-only scan
+            models.Index(
+                fields=["instrument", "date", "price_type"],
+                include=["price", "quote_convention", "clean_or_dirty", "currency"],
+                name="ip_cover_val",
+            ),
+            # Few distinct sources: a bare source index is barely selective,
+            # adding date serves per-source audits over a date range
+            models.Index(fields=["chosen_source", "date"], name="ip_source_date"),
+            # Audit of manual overrides: a small slice of canonical prices
+            models.Index(
+                fields=["instrument", "date"],
+                condition=models.Q(selection_reason=SelectionReason.MANUAL_OVERRIDE),
+                name="ip_manual_idx",
+            ),
         ]
         # One canonical price per instrument/date/price_type (global, not org-scoped)
         unique_together = [["instrument", "date", "price_type"]]
@@ -371,6 +453,85 @@ class InstrumentPrice(models.Model):
     def __str__(self) -> str:
         return f"{self.instrument.name} - {self.price} from {self.chosen_source.code} ({self.date})"
 
+    @classmethod
+    def upsert_from_observations(
+        cls,
+        observations: Iterable[InstrumentPriceObservation],
+        selection_reason: str = SelectionReason.AUTO_POLICY,
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Write the chosen observations as canonical prices in batches.
+
+        Each batch is a single INSERT ... ON CONFLICT DO UPDATE keyed on
+        (instrument, date, price_type), replacing one update_or_create()
+        read-then-write per canonical price. Observations must be unique on
+        that key within the iterable. All batches commit or roll back together.
+
+        Args:
+            observations: Saved InstrumentPriceObservation instances selected
+                as canonical.
+            selection_reason: SelectionReason recorded on every price.
+            batch_size: Rows per statement (default: settings.PRICE_INGEST_BATCH_SIZE).
+
+        Returns:
+            int: Number of canonical prices written.
+        """
+        batch_size = batch_size or settings.PRICE_INGEST_BATCH_SIZE
+        selected_at = timezone.now()
+        prices = (
+            cls(
+                instrument_id=obs.instrument_id,
+                date=obs.date,
+                price_type=obs.price_type,
+                chosen_source_id=obs.source_id,
+                observation=obs,
+                price=obs.price,
+                quote_convention=obs.quote_convention,
+                clean_or_dirty=obs.clean_or_dirty,
+                volume=obs.volume,
+                currency=obs.currency,
+                selection_reason=selection_reason,
+                selected_at=selected_at,
+            )
+            for obs in observations
+        )
+        written = 0
+        with transaction.atomic():
+            while batch := list(islice(prices, batch_size)):
+                cls.objects.bulk_create(
+                    batch,
+                    batch_size=batch_size,
+                    update_conflicts=True,
+                    unique_fields=CANONICAL_KEY_FIELDS,
+                    update_fields=[
+                        *CANONICAL_VALUE_FIELDS,
+                        "selection_reason",
+                        "selected_at",
+                        "updated_at",
+                    ],
+                )
+                written += len(batch)
+        return written
+
+
+def instrument_price_import_upload_to(instance, filename: str) -> str:
+    """
+    Store price import files under a content-addressed path.
+
+    Files are keyed by their SHA-256 (set by InstrumentPriceImport.save()), so
+    byte-identical spreadsheets share one stored object. Because several rows
+    can point at the same file, stored files must never be deleted when a
+    single import row is deleted. Without a hash, files fall back to the
+    original dated layout.
+    """
+    if not instance.file_sha256:
+        dated_dir = timezone.now().strftime("market_data/instrument_prices/%Y/%m")
+        return f"{dated_dir}/{filename}"
+    sha = instance.file_sha256
+    extension = os.path.splitext(filename)[1].lower()
+    return f"market_data/instrument_prices/by-sha/{sha[:2]}/{sha}{extension}"
+
 
 class InstrumentPriceImport(models.Model):
     """
@@ -378,7 +539,9 @@ class InstrumentPriceImport(models.Model):
 
     Tracks the import of instrument price data from uploaded Excel files.
     Stores the file reference, import status, and error information.
-    Files are stored in media storage (works with local and S3/R2).
+    Files are stored in media storage (works with local and S3/R2) and are
+    shared between imports of identical content, so deleting an import row
+    never removes its stored file.
 
     Note: This model is NOT organization-scoped because instrument prices
     are global reference data shared across all organizations.
@@ -406,9 +569,25 @@ class InstrumentPriceImport(models.Model):
     )
     file = models.FileField(
         _("File"),
-        upload_to="market_data/instrument_prices/%Y/%m/",
+        upload_to=instrument_price_import_upload_to,
+        max_length=255,
         help_text="Uploaded Excel file with instrument price data.",
     )
+    file_sha256 = models.CharField(
+        _("File SHA-256"),
+        max_length=64,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="SHA-256 of the file content, used to dedupe re-uploads.",
+    )
+    file_size = models.BigIntegerField(
+        _("File Size"),
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="File size in bytes.",
+    )
     sheet_name = models.CharField(
         _("Sheet Name"),
         max_length=255,
@@ -466,9 +645,47 @@ class InstrumentPriceImport(models.Model):
         verbose_name_plural = _("Instrument Price Imports")
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["source", "status"]),
+            # Only in-flight imports are polled; finished ones are never filtered
+            # by status, so keep them out of the index
+            models.Index(
+                fields=["source"],
+                condition=models.Q(
+                    status__in=[
+                        ImportStatus.PENDING,
+                        ImportStatus.PARSING,
+                        ImportStatus.VALIDATING,
+                        ImportStatus.PROCESSING,
+                        ImportStatus.IMPORTING,
+                    ]
+                ),
+                name="imp_active_idx",
+            ),
             models.Index(fields=["created_at"]),
         ]
 
     def __str__(self) -> str:
         return f"{self.source.code} - Instrument Prices ({self.get_status_display()})"
+
+    def save(self, *args, **kwargs):
+        """
+        Hash new uploads and reuse the stored file for identical content.
+
+        The upload is streamed through SHA-256 in chunks. If an earlier import
+        already stored the same bytes, its file path is reused and nothing is
+        written to storage.
+        """
+        if self.file and not self.file._committed:
+            sha = hashlib.sha256()
+            for chunk in self.file.chunks():
+                sha.update(chunk)
+            self.file_sha256 = sha.hexdigest()
+            self.file_size = self.file.size
+            existing_path = (
+                InstrumentPriceImport.objects.filter(file_sha256=self.file_sha256)
+                .exclude(pk=self.pk)
+                .values_list("file", flat=True)
+                .first()
+            )
+            if existing_path:
+                self.file = existing_path
+        super().save(*args, **kwargs)
@@ -6,16 +6,78 @@ Models for yield curves, yield curve points, and yield curve imports.
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Iterable
+from datetime import date, timedelta
 
+import numpy as np
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FilteredRelation,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 from djmoney.models.fields import CurrencyField
 
-from apps.reference_data.models.choices import SelectionReason, YieldCurveType
+from apps.reference_data.models.choices import (
+    SelectionReason,
+    StalenessBucket,
+    YieldCurveType,
+)
 from libs.choices import ImportStatus
+from libs.postgres import PortableBrinIndex, batched_upsert, stream_upsert
+
+# Upsert key (the unique_together) and upserted columns for observation ingest
+YIELD_OBSERVATION_KEY_FIELDS = ["curve", "tenor_days", "date", "source", "revision"]
+YIELD_OBSERVATION_VALUE_FIELDS = ["tenor", "rate", "observed_at"]
+# Canonical points chosen by the selection policy rather than by a user
+AUTOMATIC_SELECTION_REASONS = [
+    SelectionReason.AUTO_POLICY,
+    SelectionReason.ONLY_AVAILABLE,
+]
+# Upper bounds (inclusive, in days) of the FRESH and STALE staleness buckets
+STALENESS_FRESH_MAX_DAYS = 7
+STALENESS_STALE_MAX_DAYS = 30
+# Row layout returned by YieldCurvePoint.objects.curve_matrix()
+CURVE_MATRIX_DTYPE = np.dtype(
+    [("date", "datetime64[D]"), ("tenor_days", np.int32), ("rate", np.float64)]
+)
+
+
+class YieldCurveQuerySet(models.QuerySet):
+    """QuerySet for YieldCurve."""
+
+    def with_official_points_on(self, curve_date: date) -> YieldCurveQuerySet:
+        """
+        Keep curves with official, automatically selected points on a date.
+
+        The point filter goes into the JOIN condition (FilteredRelation), so
+        curves and their point counts come from one joined, grouped query
+        instead of a subquery per filter. Annotates official_point_count.
+        """
+        return (
+            self.annotate(
+                official_points=FilteredRelation(
+                    "points",
+                    condition=Q(
+                        points__date=curve_date,
+                        points__is_official=True,
+                        points__selection_reason__in=AUTOMATIC_SELECTION_REASONS,
+                    ),
+                )
+            )
+            .annotate(official_point_count=Count("official_points"))
+            .filter(official_point_count__gt=0)
+        )
 
 
 class YieldCurve(models.Model):
@@ -81,13 +143,19 @@ class YieldCurve(models.Model):
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = YieldCurveQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Yield Curve")
         verbose_name_plural = _("Yield Curves")
         indexes = [
             models.Index(fields=["currency", "curve_type"]),
-            models.Index(fields=["currency"]),
-            models.Index(fields=["curve_type"]),
+            # Dashboards and stress runs only look up active curves
+            models.Index(
+                fields=["currency", "curve_type"],
+                condition=models.Q(is_active=True),
+                name="yc_active_by_ccy_type",
+            ),
         ]
         unique_together = [["currency", "name"]]
 
@@ -108,6 +176,26 @@ class YieldCurve(models.Model):
         delta = today - self.last_observation_date
         return delta.days
 
+    def official_points_for_date(self, curve_date: date) -> YieldCurvePointQuerySet:
+        """
+        Get this curve's official, automatically selected points for a date.
+
+        Args:
+            curve_date: Curve date.
+
+        Returns:
+            QuerySet: YieldCurvePoint rows ordered by tenor_days.
+        """
+        return self.points.official().filter(date=curve_date).order_by("tenor_days")
+
+
+class YieldCurvePointObservationQuerySet(models.QuerySet):
+    """QuerySet for YieldCurvePointObservation."""
+
+    def with_display(self) -> YieldCurvePointObservationQuerySet:
+        """Join the relations used by __str__ to avoid one query per row."""
+        return self.select_related("curve", "source")
+
 
 class YieldCurvePointObservation(models.Model):
     """
@@ -200,23 +288,216 @@ class YieldCurvePointObservation(models.Model):
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = YieldCurvePointObservationQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Yield Curve Point Observation")
         verbose_name_plural = _("Yield Curve Point Observations")
         indexes = [
-            models.Index(fields=["curve", "tenor_days", "date"]),
+            # Covering index: per-tenor lookups read rate/source from the index
+            models.Index(
+                fields=["curve", "tenor_days", "date"],
+                include=["rate", "source"],
+                name="ycpo_curve_tenor_date_cov",
+            ),
             models.Index(fields=["curve", "date"]),
-            models.Index(fields=["date"]),
             models.Index(fields=["source", "date"]),
-            models.Index(fields=["observed_at"]),
+            # Append-only landing zone; BRIN keeps date range scans cheap
+            # without per-row index maintenance on ETL inserts
+            PortableBrinIndex(
+                fields=["date"], pages_per_range=32, name="ycpo_date_brin"
+            ),
+            PortableBrinIndex(
+                fields=["observed_at"], pages_per_range=32, name="ycpo_observed_at_brin"
+            ),
         ]
         # Multiple observations per curve/tenor_days/date/source/revision are allowed
         unique_together = [["curve", "tenor_days", "date", "source", "revision"]]
-        ordering = ["-date", "curve", "tenor_days", "-observed_at"]
 
     def __str__(self) -> str:
         return f"{self.curve.name} {self.tenor} = {self.rate}% from {self.source.code} ({self.date})"
 
+    @classmethod
+    def bulk_ingest(
+        cls,
+        observations: Iterable[YieldCurvePointObservation],
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Insert or update observations in batches.
+
+        Each batch is a single INSERT ... ON CONFLICT DO UPDATE keyed on the
+        (curve, tenor_days, date, source, revision) unique constraint,
+        replacing one update_or_create() round trip per row. All batches run
+        in one transaction (see libs.postgres.batched_upsert). Observations
+        must be unique on that key within the iterable.
+
+        Args:
+            observations: Unsaved YieldCurvePointObservation instances.
+            batch_size: Rows per statement (default: settings.YIELD_CURVE_INGEST_BATCH_SIZE).
+
+        Returns:
+            int: Number of observations written.
+        """
+        return batched_upsert(
+            cls,
+            observations,
+            YIELD_OBSERVATION_KEY_FIELDS,
+            YIELD_OBSERVATION_VALUE_FIELDS,
+            batch_size or settings.YIELD_CURVE_INGEST_BATCH_SIZE,
+        )
+
+    @classmethod
+    def copy_ingest(cls, rows: Iterable[tuple]) -> int:
+        """
+        Stream observations into the table with COPY, upserting on the key.
+
+        For cold-start loads of historical curves. On PostgreSQL rows go
+        through a COPY staging table and one INSERT ... ON CONFLICT DO UPDATE
+        (see libs.postgres.copy_upsert), keeping bulk_ingest() semantics.
+        Other backends fall back to bulk_ingest(). Rows must be unique on the
+        observation key.
+
+        Args:
+            rows: Tuples ordered as YIELD_OBSERVATION_KEY_FIELDS followed by
+                YIELD_OBSERVATION_VALUE_FIELDS, with curve and source given
+                as IDs.
+
+        Returns:
+            int: Number of rows written.
+        """
+        return stream_upsert(
+            cls,
+            YIELD_OBSERVATION_KEY_FIELDS,
+            YIELD_OBSERVATION_VALUE_FIELDS,
+            rows,
+            settings.YIELD_CURVE_INGEST_BATCH_SIZE,
+        )
+
+
+class YieldCurvePointQuerySet(models.QuerySet):
+    """QuerySet for YieldCurvePoint."""
+
+    def with_display(self) -> YieldCurvePointQuerySet:
+        """Join the relations used by __str__ to avoid one query per row."""
+        return self.select_related("curve", "chosen_source")
+
+    def with_staleness(self) -> YieldCurvePointQuerySet:
+        """
+        Annotate published_staleness (timedelta since last_published_date).
+
+        Computed by the database against one date.today(), so list paths do
+        not evaluate the staleness_days property row by row. NULL when
+        last_published_date is NULL.
+        """
+        return self.annotate(
+            published_staleness=ExpressionWrapper(
+                Value(date.today(), output_field=models.DateField())
+                - F("last_published_date"),
+                output_field=models.DurationField(),
+            )
+        )
+
+    def official(self) -> YieldCurvePointQuerySet:
+        """Keep official points selected automatically (no manual overrides)."""
+        return self.filter(
+            is_official=True, selection_reason__in=AUTOMATIC_SELECTION_REASONS
+        )
+
+    def as_numpy(
+        self, curve_id: int, curve_date: date
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Load one curve date as tenor and rate arrays, ordered by tenor.
+
+        Rates are cast to double precision in the query, so no Decimal or
+        model instances are built; interpolation can run on the arrays
+        directly (e.g. np.interp).
+
+        Args:
+            curve_id: YieldCurve primary key.
+            curve_date: Curve date.
+
+        Returns:
+            tuple: (tenor_days as int32, rate in percent as float64).
+        """
+        rows = (
+            self.filter(curve_id=curve_id, date=curve_date)
+            .order_by("tenor_days")
+            .values_list("tenor_days", Cast("rate", models.FloatField()))
+        )
+        matrix = np.array(list(rows), dtype=np.float64).reshape(-1, 2)
+        return matrix[:, 0].astype(np.int32), matrix[:, 1]
+
+    def dv01_matrix(
+        self, curve_ids: list[int], curve_date: date
+    ) -> tuple[dict[int, int], np.ndarray, np.ndarray]:
+        """
+        Load several curves on one date as a dense curve x tenor rate matrix.
+
+        One query fetches (curve_id, tenor_days, rate) tuples, which are
+        scattered into the matrix with vectorized indexing so DV01/duration
+        can be computed with matrix operations (e.g. ``weights @ rates.T``).
+
+        Args:
+            curve_ids: YieldCurve primary keys; their order sets the row order.
+            curve_date: Curve date.
+
+        Returns:
+            tuple: (curve_id -> row index, tenor_days axis as int32 sorted
+            ascending, rates in percent as float64 with NaN where a curve has
+            no point for a tenor).
+        """
+        curve_index = {curve_id: row for row, curve_id in enumerate(curve_ids)}
+        rows = self.filter(curve_id__in=curve_ids, date=curve_date).values_list(
+            "curve_id", "tenor_days", Cast("rate", models.FloatField())
+        )
+        points = np.array(list(rows), dtype=np.float64).reshape(-1, 3)
+        tenor_days, tenor_columns = np.unique(
+            points[:, 1].astype(np.int32), return_inverse=True
+        )
+        curve_rows = np.array(
+            [curve_index[int(curve_id)] for curve_id in points[:, 0]], dtype=np.intp
+        )
+        rates = np.full((len(curve_index), len(tenor_days)), np.nan)
+        rates[curve_rows, tenor_columns] = points[:, 2]
+        return curve_index, tenor_days, rates
+
+    def curve_matrix(
+        self,
+        curve_id: int,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> np.ndarray:
+        """
+        Load a curve's points over a date range as one structured array.
+
+        Rows are streamed as (date, tenor_days, rate) tuples with iterator()
+        straight into NumPy, ordered by date then tenor, without building
+        model instances. Pivot into a date x tenor matrix for vectorized
+        interpolation.
+
+        Args:
+            curve_id: YieldCurve primary key.
+            start_date: First date (inclusive); None for no lower bound.
+            end_date: Last date (inclusive); None for no upper bound.
+
+        Returns:
+            np.ndarray: Structured array with fields date (datetime64[D]),
+            tenor_days (int32) and rate (float64, percent).
+        """
+        points = self.filter(curve_id=curve_id)
+        if start_date:
+            points = points.filter(date__gte=start_date)
+        if end_date:
+            points = points.filter(date__lte=end_date)
+        rows = (
+            points.order_by("date", "tenor_days")
+            .values_list("date", "tenor_days", Cast("rate", models.FloatField()))
+            .iterator(chunk_size=2000)
+        )
+        return np.fromiter(rows, dtype=CURVE_MATRIX_DTYPE)
+
 
 class YieldCurvePoint(models.Model):
     """
@@ -366,20 +647,41 @@ class YieldCurvePoint(models.Model):
         default=True,
         help_text=_("Whether this is official data (e.g., from BEAC central bank)"),
     )
+    staleness_bucket = models.PositiveSmallIntegerField(
+        _("Staleness Bucket"),
+        choices=StalenessBucket.choices,
+        blank=True,
+        null=True,
+        help_text=_(
+            "Staleness of last_published_date (fresh / stale / very stale). "
+            "Set on save and reclassified nightly; NULL if last_published_date is NULL."
+        ),
+    )
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    objects = YieldCurvePointQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Yield Curve Point")
         verbose_name_plural = _("Yield Curve Points")
         indexes = [
-            models.Index(fields=["curve", "tenor_days", "date"]),
+            # Covering index: curve lookups in pricing/DV01 loops are served
+            # by an index-only scan
+            models.Index(
+                fields=["curve", "tenor_days", "date"],
+                include=["rate", "chosen_source", "last_published_date"],
+                name="ycp_curve_tenor_date_cov",
+            ),
             models.Index(fields=["curve", "date"]),
             models.Index(fields=["date"]),
             models.Index(fields=["chosen_source"]),
             models.Index(fields=["last_published_date"]),
             models.Index(fields=["is_official", "last_published_date"]),
             models.Index(fields=["published_date_assumed"]),
+            models.Index(
+                fields=["curve", "staleness_bucket"], name="ycp_curve_staleness_idx"
+            ),
         ]
         # One canonical point per curve/tenor_days/date (global, not org-scoped)
         constraints = [
@@ -388,7 +690,6 @@ class YieldCurvePoint(models.Model):
                 name="uniq_curve_tenor_days_date",
             ),
         ]
-        ordering = ["-date", "curve", "tenor_days"]
 
     def __str__(self) -> str:
         return f"{self.curve.name} {self.tenor} = {self.rate}% from {self.chosen_source.code} ({self.date})"
@@ -420,6 +721,70 @@ class YieldCurvePoint(models.Model):
         delta = today - self.last_published_date
         return delta.days
 
+    def save(self, *args, **kwargs):
+        """Update staleness_bucket from last_published_date."""
+        self.staleness_bucket = self.classify_staleness(self.staleness_days)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "last_published_date" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "staleness_bucket"}
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def classify_staleness(staleness_days: int | None) -> int | None:
+        """
+        Map a staleness in days to a StalenessBucket.
+
+        Args:
+            staleness_days: Days since last_published_date (None if unknown).
+
+        Returns:
+            int: StalenessBucket value, or None if staleness_days is None.
+        """
+        if staleness_days is None:
+            return None
+        if staleness_days <= STALENESS_FRESH_MAX_DAYS:
+            return StalenessBucket.FRESH
+        if staleness_days <= STALENESS_STALE_MAX_DAYS:
+            return StalenessBucket.STALE
+        return StalenessBucket.VERY_STALE
+
+    @classmethod
+    def reclassify_staleness(cls, today: date | None = None) -> int:
+        """
+        Recompute staleness_bucket for all points relative to today.
+
+        Buckets age as days pass without a save, so this runs nightly
+        (see reference_data.tasks). It is a single UPDATE ... SET
+        staleness_bucket = CASE ... END with no rows loaded into Python;
+        points already VERY_STALE cannot change and are skipped.
+
+        Args:
+            today: Reference date (default: date.today()).
+
+        Returns:
+            int: Number of points updated.
+        """
+        today = today or date.today()
+        return (
+            cls.objects.filter(last_published_date__isnull=False)
+            .exclude(staleness_bucket=StalenessBucket.VERY_STALE)
+            .update(
+                staleness_bucket=Case(
+                    When(
+                        last_published_date__gte=today
+                        - timedelta(days=STALENESS_FRESH_MAX_DAYS),
+                        then=Value(StalenessBucket.FRESH),
+                    ),
+                    When(
+                        last_published_date__gte=today
+                        - timedelta(days=STALENESS_STALE_MAX_DAYS),
+                        then=Value(StalenessBucket.STALE),
+                    ),
+                    default=Value(StalenessBucket.VERY_STALE),
+                )
+            )
+        )
+
 
 class YieldCurveImport(models.Model):
     """
@@ -674,10 +1039,57 @@ class YieldCurveStressProfile(models.Model):
 
     def save(self, *args, **kwargs):
         """Update staleness_days from curve's last_observation_date."""
-        if self.curve and self.curve.last_observation_date:
+        update_fields = kwargs.get("update_fields")
+        refresh_staleness = update_fields is None or not {
+            "last_observation_date",
+            "staleness_days",
+        }.isdisjoint(update_fields)
+        if refresh_staleness and self.curve and self.curve.last_observation_date:
             self.last_observation_date = self.curve.last_observation_date
-            if self.last_observation_date:
-                from datetime import date
-
-                self.staleness_days = (date.today() - self.last_observation_date).days
+            self.staleness_days = (date.today() - self.last_observation_date).days
         super().save(*args, **kwargs)
+
+    @classmethod
+    def bulk_refresh_staleness(
+        cls,
+        profile_ids: list[int] | None = None,
+        curve_ids: list[int] | None = None,
+    ) -> int:
+        """
+        Refresh last_observation_date and staleness_days for many profiles.
+
+        Batch alternative to save() for canonicalization jobs: curves are
+        joined in the profile query and all profiles are written with
+        bulk_update() in settings.BULK_UPDATE_BATCH_SIZE batches.
+
+        Args:
+            profile_ids: Profiles to refresh (default: all).
+            curve_ids: Restrict to profiles of these curves (default: all).
+
+        Returns:
+            int: Number of profiles refreshed.
+        """
+        profiles = cls.objects.select_related("curve").filter(
+            curve__last_observation_date__isnull=False
+        )
+        if profile_ids is not None:
+            profiles = profiles.filter(id__in=profile_ids)
+        if curve_ids is not None:
+            profiles = profiles.filter(curve_id__in=curve_ids)
+        profiles = list(profiles)
+
+        today = date.today()
+        now = timezone.now()
+        for profile in profiles:
+            profile.last_observation_date = profile.curve.last_observation_date
+            profile.staleness_days = (today - profile.last_observation_date).days
+            # bulk_update() bypasses auto_now
+            profile.updated_at = now
+
+        with transaction.atomic():
+            cls.objects.bulk_update(
+                profiles,
+                ["last_observation_date", "staleness_days", "updated_at"],
+                batch_size=settings.BULK_UPDATE_BATCH_SIZE,
+            )
+        return len(profiles)
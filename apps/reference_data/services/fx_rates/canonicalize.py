@@ -20,7 +20,10 @@ from django.db.models import Q
 from django.utils import timezone
 
 from apps.reference_data.models import FXRate, FXRateObservation, SelectionReason
-from apps.reference_data.utils.priority import get_effective_priority
+from apps.reference_data.utils.priority import (
+    get_effective_priority,
+    load_priority_overrides,
+)
 
 
 def canonicalize_fx_rates(
@@ -104,6 +107,9 @@ def canonicalize_fx_rates(
     errors = []
     selected_at = timezone.now()
 
+    # Org priority overrides, loaded once for the whole run
+    overrides = load_priority_overrides()
+
     # Process each group
     for (base_ccy, quote_ccy, obs_date), obs_dict in grouped.items():
         buy_obs_list = obs_dict["buy"]
@@ -114,14 +120,14 @@ def canonicalize_fx_rates(
         # Use effective priority (org-specific override or global)
         buy_obs_list.sort(
             key=lambda x: (
-                get_effective_priority(x.source, "fx_rate"),
+                get_effective_priority(x.source, "fx_rate", overrides=overrides),
                 -x.revision,
                 -x.observed_at.timestamp() if x.observed_at else 0,
             )
         )
         sell_obs_list.sort(
             key=lambda x: (
-                get_effective_priority(x.source, "fx_rate"),
+                get_effective_priority(x.source, "fx_rate", overrides=overrides),
                 -x.revision,
                 -x.observed_at.timestamp() if x.observed_at else 0,
             )
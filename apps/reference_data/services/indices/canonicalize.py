@@ -23,7 +23,10 @@ from apps.reference_data.models import (
     MarketIndexValueObservation,
     SelectionReason,
 )
-from apps.reference_data.utils.priority import get_effective_priority
+from apps.reference_data.utils.priority import (
+    get_effective_priority,
+    load_priority_overrides,
+)
 
 
 def canonicalize_index_values(
@@ -48,7 +51,9 @@ def canonicalize_index_values(
         end_date: End date for date range (inclusive).
 
     Returns:
-        dict: Summary with keys 'created', 'updated', 'skipped', 'errors', 'total_groups'.
+        dict: Summary with keys 'created', 'updated', 'skipped', 'errors', 'total_groups',
+            'indices_updated'.
+            - indices_updated: Number of indices whose last_date/last_value were refreshed.
 
     Example:
         >>> result = canonicalize_index_values(
@@ -84,6 +89,7 @@ def canonicalize_index_values(
                 "skipped": 0,
                 "errors": [f"Index code '{index_code}' not found"],
                 "total_groups": 0,
+                "indices_updated": 0,
             }
 
     # Get all observations from active sources
@@ -107,6 +113,9 @@ def canonicalize_index_values(
     skipped = 0
     errors = []
 
+    # Org priority overrides, loaded once for the whole run
+    overrides = load_priority_overrides()
+
     # Process each group
     for (index_id, obs_date), obs_list in grouped.items():
         try:
@@ -118,7 +127,9 @@ def canonicalize_index_values(
 
             for obs in obs_list:
                 # Get effective priority (org-specific override or global)
-                priority = get_effective_priority(obs.source, "index_value")
+                priority = get_effective_priority(
+                    obs.source, "index_value", overrides=overrides
+                )
                 revision = obs.revision
 
                 if best_obs is None:
@@ -146,8 +157,13 @@ def canonicalize_index_values(
                 defaults={
                     "chosen_source": best_obs.source,
                     "observation": best_obs,
-                    "value": best_obs.value,
-                    "return_pct": best_obs.return_pct,
+                    # Canonical table stores floats; observations keep Decimal for audit
+                    "value": float(best_obs.value),
+                    "return_pct": (
+                        float(best_obs.return_pct)
+                        if best_obs.return_pct is not None
+                        else None
+                    ),
                     "selection_reason": SelectionReason.AUTO_POLICY,
                     "selected_at": timezone.now(),
                 },
@@ -163,10 +179,34 @@ def canonicalize_index_values(
                 f"Error processing index_id={index_id}, date={obs_date}: {str(e)}"
             )
 
+    # Automatically maintain the denormalized latest value on MarketIndex
+    indices_updated = 0
+    for index_id in {key[0] for key in grouped}:
+        try:
+            latest = (
+                MarketIndexValue.objects.filter(index_id=index_id)
+                .only("date", "value", "return_pct")
+                .order_by("-date")
+                .first()
+            )
+            if latest:
+                MarketIndex.objects.filter(id=index_id).update(
+                    last_date=latest.date,
+                    last_value=latest.value,
+                    last_return_pct=latest.return_pct,
+                    updated_at=timezone.now(),
+                )
+                indices_updated += 1
+        except Exception as e:
+            errors.append(
+                f"Error updating latest value for index_id={index_id}: {str(e)}"
+            )
+
     return {
         "created": created,
         "updated": updated,
         "skipped": skipped,
         "errors": errors,
         "total_groups": len(grouped),
+        "indices_updated": indices_updated,
     }
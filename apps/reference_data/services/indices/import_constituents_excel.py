@@ -137,9 +137,9 @@ def import_index_constituents_from_file(
     # Find by ISIN (case-insensitive)
     instrument_ids_upper = [id.upper() for id in unique_instrument_ids]
     instruments_by_isin = {}
-    for inst in Instrument.objects.filter(
-        isin__in=instrument_ids_upper
-    ).select_related():
+    for inst in Instrument.objects.filter(isin__in=instrument_ids_upper).only(
+        "id", "isin"
+    ):
         if inst.isin:
             isin_key = inst.isin.upper()
             if isin_key not in instruments_by_isin:  # Take first match if duplicates
@@ -147,9 +147,9 @@ def import_index_constituents_from_file(
 
     # Find by ticker (case-insensitive)
     instruments_by_ticker = {}
-    for inst in Instrument.objects.filter(
-        ticker__in=instrument_ids_upper
-    ).select_related():
+    for inst in Instrument.objects.filter(ticker__in=instrument_ids_upper).only(
+        "id", "ticker"
+    ):
         if inst.ticker:
             ticker_key = inst.ticker.upper()
             if (
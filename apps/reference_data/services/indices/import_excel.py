@@ -64,9 +64,10 @@ def import_index_levels_from_import_record(
         # S3/R2 storage - download to temp file
         with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp_file:
             file_path = tmp_file.name
-            # Download from storage
+            # Stream from storage in chunks so large files never sit fully in memory
             with default_storage.open(import_record.file.name, "rb") as storage_file:
-                tmp_file.write(storage_file.read())
+                for chunk in storage_file.chunks():
+                    tmp_file.write(chunk)
 
     try:
         source = import_record.source
@@ -214,78 +215,85 @@ def _import_index_levels_excel(
     updated = 0
     errors = []
     observed_at = timezone.now()
-    min_date = None
-    max_date = None
+
+    # Range-check per row so one overflowing cell is reported and skipped
+    # instead of aborting the batched upsert for the whole file
+    out_of_range = pd.Series(False, index=df.index)
+    range_checks = [("level", MarketIndexValueObservation._meta.get_field("value"))]
+    if "is_base" in df.columns and "base_value" in df.columns:
+        range_checks.append(("base_value", MarketIndex._meta.get_field("base_value")))
+    for column, field in range_checks:
+        limit = 10 ** (field.max_digits - field.decimal_places)
+        values = pd.to_numeric(df[column], errors="coerce")
+        if column == "base_value":
+            values = values.where(df["is_base"])
+        bad = values.round(field.decimal_places).abs() >= limit
+        for row_idx in df.index[bad & ~out_of_range]:
+            errors.append(
+                f"Row {row_idx + 2}: {column} {df.at[row_idx, column]} is out of "
+                f"range (must be between -{limit} and {limit})"
+            )
+        out_of_range |= bad
+    df = df[~out_of_range]
+    min_date = df["date"].min() if len(df) else None
+    max_date = df["date"].max() if len(df) else None
 
     # Get all indices in one query for efficiency
     indices_by_code = {
         idx.code: idx for idx in MarketIndex.objects.filter(code__in=unique_index_codes)
     }
 
-    # Process each row
-    for idx, row in df.iterrows():
-        try:
-            obs_date = row["date"]
-            index_code = row["index_code"]
-            level = Decimal(str(row["level"]))
-
-            # Get index
-            index = indices_by_code.get(index_code)
-            if not index:
-                errors.append(
-                    f"Row {idx + 2}: Index code '{index_code}' not found (should not happen after validation)"
-                )
-                continue
-
-            # Track date range
-            if min_date is None or obs_date < min_date:
-                min_date = obs_date
-            if max_date is None or obs_date > max_date:
-                max_date = obs_date
-
-            # Handle base/rebase if specified
-            is_base = False
-            base_value = None
-            if "is_base" in df.columns and pd.notna(row.get("is_base")):
-                is_base = bool(row["is_base"])
-                if (
-                    is_base
-                    and "base_value" in df.columns
-                    and pd.notna(row.get("base_value"))
-                ):
-                    base_value = Decimal(str(row["base_value"]))
-                    # Update MarketIndex base_date and base_value if this is a base point
-                    if index.base_date is None or obs_date < index.base_date:
-                        index.base_date = obs_date
-                        index.base_value = base_value
-                        index.save(update_fields=["base_date", "base_value"])
-
-            # Calculate return_pct if we have previous value (optional, can be calculated later)
-            return_pct = None
-
-            # Create or update observation
-            # Use unique_together constraint: (index, date, source, revision)
-            observation, was_created = (
-                MarketIndexValueObservation.objects.update_or_create(
-                    index=index,
-                    date=obs_date,
+    # Handle base/rebase points: the earliest base row per index wins, so
+    # processing base rows in date order saves each index at most once
+    if "is_base" in df.columns and "base_value" in df.columns:
+        base_rows = df[df["is_base"] & df["base_value"].notna()].sort_values("date")
+        for base_date, index_code, base_value in zip(
+            base_rows["date"], base_rows["index_code"], base_rows["base_value"]
+        ):
+            index = indices_by_code[index_code]
+            if index.base_date is None or base_date < index.base_date:
+                index.base_date = base_date
+                index.base_value = Decimal(str(base_value))
+                index.save(update_fields=["base_date", "base_value"])
+
+    # Last row wins for duplicate (index, date) keys, matching upsert semantics
+    rows = df.drop_duplicates(subset=["index_code", "date"], keep="last")
+    duplicate_keys = len(df) - len(rows)
+
+    # Build observations column-wise instead of iterating DataFrame rows.
+    # return_pct is optional and can be calculated later from consecutive values.
+    observations = [
+        MarketIndexValueObservation(
+            index_id=indices_by_code[index_code].id,
+            date=obs_date,
+            source=source,
+            revision=revision,
+            value=Decimal(str(level)),
+            return_pct=None,
+            observed_at=observed_at,
+        )
+        for index_code, obs_date, level in zip(
+            rows["index_code"], rows["date"], rows["level"]
+        )
+    ]
+
+    # Upsert all observations in batches (unique: index, date, source, revision)
+    if observations:
+        keys = {(obs.index_id, obs.date) for obs in observations}
+        existing_keys = (
+            set(
+                MarketIndexValueObservation.objects.filter(
+                    index_id__in={key[0] for key in keys},
+                    date__in={key[1] for key in keys},
                     source=source,
                     revision=revision,
-                    defaults={
-                        "value": level,
-                        "return_pct": return_pct,
-                        "observed_at": observed_at,
-                    },
-                )
+                ).values_list("index_id", "date")
             )
-
-            if was_created:
-                created += 1
-            else:
-                updated += 1
-
-        except Exception as e:
-            errors.append(f"Row {idx + 2}: {str(e)}")
+            & keys
+        )
+        created = len(keys) - len(existing_keys)
+        updated = len(existing_keys) + duplicate_keys
+        MarketIndexValueObservation.objects.bulk_upsert(observations)
 
     return {
         "created": created,
@@ -14,10 +14,13 @@ Expected Excel format:
 
 from __future__ import annotations
 
+import operator
 from decimal import Decimal
+from functools import reduce
 
 import pandas as pd
 from dateutil.relativedelta import relativedelta
+from django.db.models import Q
 
 from apps.reference_data.models import (
     FundCategory,
@@ -159,12 +162,14 @@ def import_instruments_from_file(
     ):
         if issuer.short_name and issuer.short_name.upper() not in issuers_by_code:
             issuers_by_code[issuer.short_name.upper()] = issuer
-    # Finally by name
-    for issuer in Issuer.objects.filter(
-        organization_id=org_id, name__in=unique_issuer_codes
-    ):
-        if issuer.name and issuer.name.upper() not in issuers_by_code:
-            issuers_by_code[issuer.name.upper()] = issuer
+    # Finally by name, case-insensitively to match the Lower(name) uniqueness
+    if len(unique_issuer_codes):
+        name_matches = reduce(
+            operator.or_, (Q(name__iexact=code) for code in unique_issuer_codes)
+        )
+        for issuer in Issuer.objects.filter(name_matches, organization_id=org_id):
+            if issuer.name and issuer.name.upper() not in issuers_by_code:
+                issuers_by_code[issuer.name.upper()] = issuer
 
     # Check for missing issuers
     missing_issuers = [
@@ -12,6 +12,9 @@ Expected Excel format:
 from __future__ import annotations
 
 import pandas as pd
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
 
 from apps.reference_data.models import Issuer
 from apps.reference_data.models.issuers import IssuerGroup
@@ -93,8 +96,8 @@ def import_issuers_from_file(
     # Normalize issuer_group
     df["issuer_group"] = df["issuer_group"].str.strip()
 
-    created = 0
-    updated = 0
+    valid_rows = 0
+    rows_by_name: dict[str, dict] = {}
     errors = []
 
     # Process each row
@@ -163,27 +166,64 @@ def import_issuers_from_file(
                     is_active=True,
                 )
 
-            # Create or update issuer
-            # Use unique_together constraint: (organization, name)
-            issuer, was_created = Issuer.objects.update_or_create(
-                organization_id=org_id,
-                name=name,
-                defaults={
-                    "short_name": short_name,
-                    "country": country,
-                    "issuer_group": issuer_group_obj,
-                    "is_active": True,
-                },
-            )
-
-            if was_created:
-                created += 1
-            else:
-                updated += 1
+            # Later rows with the same name (ignoring case) overwrite earlier
+            # ones, matching the case-insensitive unique constraint
+            valid_rows += 1
+            rows_by_name[name.lower()] = {
+                "name": name,
+                "short_name": short_name,
+                "country": country,
+                "issuer_group": issuer_group_obj,
+            }
 
         except Exception as e:
             errors.append(f"Row {idx + 2}: {str(e)}")
 
+    # Split the batch into new and existing issuers with one lookup instead of
+    # an update_or_create() round trip per row
+    existing = {
+        issuer.name_lower: issuer
+        for issuer in Issuer.objects.annotate(name_lower=Lower("name")).filter(
+            name_lower__in=list(rows_by_name)
+        )
+    }
+    now = timezone.now()
+    to_create = []
+    to_update = []
+    for name_lower, fields in rows_by_name.items():
+        issuer = existing.get(name_lower)
+        if issuer is None:
+            to_create.append(Issuer(organization_id=org_id, is_active=True, **fields))
+            continue
+        # Keep the stored spelling of the name for existing issuers
+        fields.pop("name")
+        for field, value in fields.items():
+            setattr(issuer, field, value)
+        issuer.is_active = True
+        # bulk_update() bypasses auto_now
+        issuer.updated_at = now
+        to_update.append(issuer)
+
+    with transaction.atomic():
+        # Issuers missing a code get one resolved in bulk, not per save()
+        Issuer.generate_unique_codes(to_create + to_update)
+        Issuer.objects.bulk_create(to_create, batch_size=1000)
+        Issuer.objects.bulk_update(
+            to_update,
+            [
+                "short_name",
+                "country",
+                "issuer_group",
+                "is_active",
+                "issuer_code",
+                "updated_at",
+            ],
+            batch_size=1000,
+        )
+
+    created = len(to_create)
+    updated = valid_rows - created
+
     return {
         "created": created,
         "updated": updated,
@@ -12,18 +12,22 @@ Default policy:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import date
 
+from django.conf import settings
+from django.db import transaction
 from django.db.models import Q
-from django.utils import timezone
 
 from apps.reference_data.models import (
     Instrument,
     InstrumentPrice,
     InstrumentPriceObservation,
-    SelectionReason,
 )
-from apps.reference_data.utils.priority import get_effective_priority
+from apps.reference_data.utils.priority import (
+    get_effective_priority,
+    load_priority_overrides,
+)
 
 
 def canonicalize_prices(
@@ -40,7 +44,7 @@ def canonicalize_prices(
     1. Fetches all observations from active sources
     2. Selects best observation based on source priority (lower = higher priority)
     3. If multiple observations from same source, uses most recent revision
-    4. Creates or updates canonical InstrumentPrice
+    4. Creates or updates canonical InstrumentPrice (batched upserts)
 
     Args:
         instrument_id: Instrument identifier (ISIN or ticker). If None, processes all instruments.
@@ -130,6 +134,10 @@ def canonicalize_prices(
     updated = 0
     skipped = 0
     errors = []
+    chosen = []
+
+    # Org priority overrides, loaded once for the whole run
+    overrides = load_priority_overrides()
 
     # Process each group
     for (instrument_id_val, obs_date, price_type_val), obs_list in grouped.items():
@@ -142,7 +150,9 @@ def canonicalize_prices(
 
             for obs in obs_list:
                 # Get effective priority (org-specific override or global)
-                priority = get_effective_priority(obs.source, "price")
+                priority = get_effective_priority(
+                    obs.source, "price", overrides=overrides
+                )
                 revision = obs.revision
 
                 if best_obs is None:
@@ -163,34 +173,28 @@ def canonicalize_prices(
                 skipped += 1
                 continue
 
-            # Create or update canonical price
-            canonical_price, was_created = InstrumentPrice.objects.update_or_create(
-                instrument=best_obs.instrument,
-                date=best_obs.date,
-                price_type=best_obs.price_type,
-                defaults={
-                    "chosen_source": best_obs.source,
-                    "observation": best_obs,
-                    "price": best_obs.price,
-                    "quote_convention": best_obs.quote_convention,
-                    "clean_or_dirty": best_obs.clean_or_dirty,
-                    "volume": best_obs.volume,
-                    "currency": best_obs.currency,
-                    "selection_reason": SelectionReason.AUTO_POLICY,
-                    "selected_at": timezone.now(),
-                },
-            )
-
-            if was_created:
-                created += 1
-            else:
-                updated += 1
+            chosen.append(best_obs)
 
         except Exception as e:
             errors.append(
                 f"Error processing instrument_id={instrument_id_val}, date={obs_date}, price_type={price_type_val}: {str(e)}"
             )
 
+    # Write every canonical price with batched upserts instead of
+    # update_or_create() per group, all or nothing so the counts stay true
+    batch_size = settings.PRICE_INGEST_BATCH_SIZE
+    try:
+        with transaction.atomic():
+            for start in range(0, len(chosen), batch_size):
+                batch = chosen[start : start + batch_size]
+                batch_created = _count_new_keys(batch)
+                InstrumentPrice.upsert_from_observations(batch, batch_size=batch_size)
+                created += batch_created
+                updated += len(batch) - batch_created
+    except Exception as e:
+        created = updated = 0
+        errors.append(f"Error writing canonical prices: {str(e)}")
+
     return {
         "created": created,
         "updated": updated,
@@ -198,3 +202,14 @@ def canonicalize_prices(
         "errors": errors,
         "total_groups": len(grouped),
     }
+
+
+def _count_new_keys(observations: Sequence[InstrumentPriceObservation]) -> int:
+    """Count observations with no canonical price yet for their key."""
+    keys = {(obs.instrument_id, obs.date, obs.price_type) for obs in observations}
+    existing = InstrumentPrice.objects.filter(
+        instrument_id__in={key[0] for key in keys},
+        date__in={key[1] for key in keys},
+        price_type__in={key[2] for key in keys},
+    ).values_list("instrument_id", "date", "price_type")
+    return len(keys - set(existing))
@@ -126,7 +126,9 @@ def import_prices_from_file(
         return str(value).lower().strip()
 
     # Validate price_type values
-    valid_price_types = [choice[0] for choice in InstrumentPriceObservation.PriceType.choices]
+    valid_price_types = [
+        choice[0] for choice in InstrumentPriceObservation.PriceType.choices
+    ]
     df["price_type_normalized"] = df["price_type"].apply(normalize_price_type)
     invalid_price_types = df[
         df["price_type_normalized"].notna()
@@ -172,9 +174,14 @@ def import_prices_from_file(
             f"Valid values: {valid_clean_or_dirty}"
         )
 
-    created = 0
-    updated = 0
+    valid_rows = 0
+    observations_by_key: dict[tuple, InstrumentPriceObservation] = {}
     errors = []
+    now = timezone.now()
+    price_field = InstrumentPriceObservation._meta.get_field("price")
+    price_limit = 10 ** (price_field.max_digits - price_field.decimal_places)
+    volume_field = InstrumentPriceObservation._meta.get_field("volume")
+    volume_limit = 10 ** (volume_field.max_digits - volume_field.decimal_places)
 
     # Get all unique instrument_ids and resolve them
     unique_instrument_ids = df["instrument_id"].dropna().unique()
@@ -246,6 +253,13 @@ def import_prices_from_file(
             except Exception:
                 errors.append(f"Row {idx + 2}: Invalid price value")
                 continue
+            # Range-check here so one bad cell cannot abort the batched ingest
+            if not abs(round(price, price_field.decimal_places)) < price_limit:
+                errors.append(
+                    f"Row {idx + 2}: Price {price_value} is out of range "
+                    f"(must be between -{price_limit} and {price_limit})"
+                )
+                continue
 
             price_type = df.loc[idx, "price_type_normalized"]
             quote_convention = df.loc[idx, "quote_convention_normalized"]
@@ -259,36 +273,54 @@ def import_prices_from_file(
                     volume = Decimal(str(volume_value))
                 except Exception:
                     pass  # Optional field, skip if invalid
-
-            # Create or update observation
+                if volume is not None and not (
+                    abs(round(volume, volume_field.decimal_places)) < volume_limit
+                ):
+                    errors.append(
+                        f"Row {idx + 2}: Volume {volume_value} is out of range "
+                        f"(must be between -{volume_limit} and {volume_limit})"
+                    )
+                    continue
+
+            # Later rows with the same key overwrite earlier ones
             # Unique constraint: (instrument, date, price_type, source, revision)
-            observation, was_created = InstrumentPriceObservation.objects.update_or_create(
-                instrument=instrument,
-                date=date,
-                price_type=price_type,
-                source=source,
-                revision=revision,
-                defaults={
-                    "price": price,
-                    "quote_convention": quote_convention,
-                    "clean_or_dirty": clean_or_dirty,
-                    "volume": volume,
-                    "observed_at": timezone.now(),
-                },
+            valid_rows += 1
+            observations_by_key[(instrument.id, date, price_type)] = (
+                InstrumentPriceObservation(
+                    instrument=instrument,
+                    date=date,
+                    price_type=price_type,
+                    source=source,
+                    revision=revision,
+                    price=price,
+                    quote_convention=quote_convention,
+                    clean_or_dirty=clean_or_dirty,
+                    volume=volume,
+                    observed_at=now,
+                )
             )
 
-            if was_created:
-                created += 1
-            else:
-                updated += 1
-
         except Exception as e:
             errors.append(f"Row {idx + 2}: {str(e)}")
 
+    # Resolve which keys already exist with one query, then write everything
+    # with batched upserts instead of an update_or_create() per row
+    existing_keys = set(
+        InstrumentPriceObservation.objects.filter(
+            instrument_id__in={key[0] for key in observations_by_key},
+            date__in={key[1] for key in observations_by_key},
+            source=source,
+            revision=revision,
+        ).values_list("instrument_id", "date", "price_type")
+    )
+    InstrumentPriceObservation.bulk_ingest(observations_by_key.values())
+
+    created = sum(1 for key in observations_by_key if key not in existing_keys)
+    updated = valid_rows - created
+
     return {
         "created": created,
         "updated": updated,
         "errors": errors,
         "total_rows": len(df),
     }
-
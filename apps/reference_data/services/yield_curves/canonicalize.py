@@ -18,9 +18,13 @@ from apps.reference_data.models import (
     YieldCurve,
     YieldCurvePoint,
     YieldCurvePointObservation,
+    YieldCurveStressProfile,
 )
 from apps.reference_data.models.market_data import MarketDataSource
-from apps.reference_data.utils.priority import get_effective_priority
+from apps.reference_data.utils.priority import (
+    get_effective_priority,
+    load_priority_overrides,
+)
 
 
 def canonicalize_yield_curves(
@@ -96,6 +100,9 @@ def canonicalize_yield_curves(
     selected_at = timezone.now()
     curves_processed = set()  # Track curves for staleness update
 
+    # Org priority overrides, loaded once for the whole run
+    overrides = load_priority_overrides()
+
     # Process each group
     for (curve_id, tenor_days, obs_date), obs_list in grouped.items():
         # Filter to active sources only
@@ -110,7 +117,7 @@ def canonicalize_yield_curves(
         # Use effective priority (org-specific override or global)
         active_obs.sort(
             key=lambda x: (
-                get_effective_priority(x.source, "yield_curve"),
+                get_effective_priority(x.source, "yield_curve", overrides=overrides),
                 -x.revision,  # Negative for descending
                 -x.observed_at.timestamp() if x.observed_at else 0,
             )
@@ -200,6 +207,10 @@ def canonicalize_yield_curves(
         except Exception as e:
             errors.append(f"Error updating staleness for curve_id={curve_id}: {str(e)}")
 
+    # Carry the new curve staleness over to stress profiles in one batch
+    if curves_updated:
+        YieldCurveStressProfile.bulk_refresh_staleness(curve_ids=list(curves_processed))
+
     return {
         "created": created,
         "updated": updated,
@@ -7,11 +7,13 @@ Works with Django FileField (supports local storage and S3/R2).
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Iterator
+from datetime import date, datetime
 
 import pandas as pd
 from django.core.files.storage import default_storage
 from django.utils import timezone
+from openpyxl import load_workbook
 
 from apps.reference_data.models import (
     MarketDataSource,
@@ -126,132 +128,172 @@ def _import_yield_curve_excel(
         file_path: Path to Excel file (local filesystem path).
         curve: YieldCurve instance to import data for.
         source: MarketDataSource instance (e.g., BEAC).
-        sheet_name: Sheet name to read (if None, reads first sheet).
+        sheet_name: Sheet name to read (if None, reads the active sheet).
         date_column: Name of the date column (default: "date").
         revision: Revision number (default: 0).
 
     Returns:
         dict: Summary with keys 'created', 'updated', 'errors'.
     """
-    # Read Excel file
+    # Validate header row and resolve tenor columns (exclude date column)
+    rows = _iter_sheet_rows(file_path, sheet_name)
     try:
-        df = pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
-    except Exception as e:
-        raise ValueError(f"Failed to read Excel file: {str(e)}")
-
-    # Validate date column exists
-    if date_column not in df.columns:
+        header = next(rows)
+    except StopIteration:
+        header = ()
+    columns = ["" if col is None else str(col).strip() for col in header]
+    if date_column not in columns:
         raise ValueError(
-            f"Date column '{date_column}' not found in Excel. Columns: {list(df.columns)}"
+            f"Date column '{date_column}' not found in Excel. Columns: {columns}"
         )
+    date_index = columns.index(date_column)
 
-    # Get valid tenor columns (exclude date column)
-    valid_tenors = get_all_tenors()
+    valid_tenors = {t.upper() for t in get_all_tenors()}
     tenor_columns = [
-        col
-        for col in df.columns
-        if col != date_column and col.upper() in [t.upper() for t in valid_tenors]
+        (position, col.upper())
+        for position, col in enumerate(columns)
+        if position != date_index and col.upper() in valid_tenors
     ]
 
     if not tenor_columns:
         raise ValueError(
-            f"No valid tenor columns found. Expected columns like: {valid_tenors}. "
-            f"Found columns: {list(df.columns)}"
-        )
-
-    # Normalize date column - handle DD/MM/YYYY format explicitly
-    # Try parsing with dayfirst=True for DD/MM/YYYY format (common in BEAC data)
-    try:
-        df[date_column] = pd.to_datetime(
-            df[date_column], errors="coerce", dayfirst=True
+            f"No valid tenor columns found. Expected columns like: {get_all_tenors()}. "
+            f"Found columns: {columns}"
         )
-    except Exception:
-        # Fallback to default parsing if dayfirst fails
-        df[date_column] = pd.to_datetime(df[date_column], errors="coerce")
-    df = df.dropna(subset=[date_column])  # Remove rows with invalid dates
 
-    created = 0
-    updated = 0
+    total_rows = 0
+    valid_rows = 0
+    # Observation tuples in copy_ingest() column order, keyed by (tenor_days, date)
+    rows_by_key: dict[tuple, tuple] = {}
     errors = []
     observed_at = timezone.now()
-    dates_seen = []  # Track dates for date range calculation
-
-    # Process each row
-    for idx, row in df.iterrows():
-        row_date = row[date_column]
-        if pd.isna(row_date):
-            continue
-
-        # Convert to date object
-        if isinstance(row_date, pd.Timestamp):
-            as_of_date = row_date.date()
-        elif isinstance(row_date, date):
-            as_of_date = row_date
-        else:
-            errors.append(f"Row {idx + 2}: Invalid date format: {row_date}")
+    min_date = max_date = None
+    # Rates must fit the rate column: checked per cell, since one overflow
+    # would otherwise abort the whole copy_ingest()
+    rate_field = YieldCurvePointObservation._meta.get_field("rate")
+    rate_limit = 10 ** (rate_field.max_digits - rate_field.decimal_places)
+
+    # Process each row as it is read from the sheet
+    for row_number, row in enumerate(rows, start=2):
+        # Rows without a parseable date are skipped
+        as_of_date = _parse_date(row[date_index] if date_index < len(row) else None)
+        if as_of_date is None:
             continue
 
-        # Track date for range calculation
-        dates_seen.append(as_of_date)
+        total_rows += 1
+        # Track date range
+        min_date = as_of_date if min_date is None else min(min_date, as_of_date)
+        max_date = as_of_date if max_date is None else max(max_date, as_of_date)
 
         # Process each tenor column
-        for tenor_col in tenor_columns:
-            rate_value = row[tenor_col]
+        for position, tenor_str in tenor_columns:
+            rate_value = row[position] if position < len(row) else None
 
-            # Skip NaN/empty cells
-            if pd.isna(rate_value):
+            # Skip empty cells
+            if rate_value is None or (
+                isinstance(rate_value, str) and not rate_value.strip()
+            ):
                 continue
 
             try:
-                # Convert to Decimal-compatible float
                 rate = float(rate_value)
-
-                # Get tenor_days
-                tenor_str = tenor_col.upper().strip()
+                if not abs(round(rate, rate_field.decimal_places)) < rate_limit:
+                    raise ValueError(
+                        f"Rate {rate_value} is out of range "
+                        f"(must be between -{rate_limit} and {rate_limit})"
+                    )
                 tenor_days = get_tenor_days(tenor_str)
 
-                # Create or update observation
-                observation, created_flag = (
-                    YieldCurvePointObservation.objects.update_or_create(
-                        curve=curve,
-                        tenor_days=tenor_days,
-                        date=as_of_date,
-                        source=source,
-                        revision=revision,
-                        defaults={
-                            "tenor": tenor_str,
-                            "rate": rate,
-                            "observed_at": observed_at,
-                        },
-                    )
+                # Later rows for the same date/tenor overwrite earlier ones
+                valid_rows += 1
+                rows_by_key[(tenor_days, as_of_date)] = (
+                    curve.id,
+                    tenor_days,
+                    as_of_date,
+                    source.id,
+                    revision,
+                    tenor_str,
+                    rate,
+                    observed_at,
                 )
 
-                if created_flag:
-                    created += 1
-                else:
-                    # Update existing observation
-                    observation.rate = rate
-                    observation.observed_at = observed_at
-                    observation.save()
-                    updated += 1
-
             except ValueError as e:
-                errors.append(f"Row {idx + 2}, Column {tenor_col}: {str(e)}")
+                errors.append(f"Row {row_number}, Column {tenor_str}: {str(e)}")
             except Exception as e:
                 errors.append(
-                    f"Row {idx + 2}, Column {tenor_col}: Unexpected error: {str(e)}"
+                    f"Row {row_number}, Column {tenor_str}: Unexpected error: {str(e)}"
                 )
 
-    # Calculate date range
-    min_date = min(dates_seen) if dates_seen else None
-    max_date = max(dates_seen) if dates_seen else None
+    # One lookup to split created from updated, then batched upserts instead of
+    # an update_or_create() round trip per cell
+    existing_keys = set(
+        YieldCurvePointObservation.objects.filter(
+            curve=curve,
+            date__in={key[1] for key in rows_by_key},
+            source=source,
+            revision=revision,
+        ).values_list("tenor_days", "date")
+    )
+    YieldCurvePointObservation.copy_ingest(rows_by_key.values())
+
+    created = sum(1 for key in rows_by_key if key not in existing_keys)
+    updated = valid_rows - created
 
     return {
         "created": created,
         "updated": updated,
         "errors": errors,
-        "total_rows": len(df),
+        "total_rows": total_rows,
         "tenor_columns_processed": len(tenor_columns),
         "min_date": min_date,
         "max_date": max_date,
     }
+
+
+def _iter_sheet_rows(file_path: str, sheet_name: str | None) -> Iterator[tuple]:
+    """
+    Stream a worksheet's rows as tuples of cell values, header row first.
+
+    The workbook is opened in openpyxl read-only mode, so rows are parsed
+    lazily from the file instead of materializing every cell (or a
+    DataFrame) up front; memory stays flat for multi-MB, many-sheet files.
+
+    Args:
+        file_path: Path to Excel file (local filesystem path).
+        sheet_name: Sheet name to read (if None, reads the active sheet).
+
+    Raises:
+        ValueError: If the workbook or sheet cannot be opened.
+    """
+    try:
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+    except Exception as e:
+        raise ValueError(f"Failed to read Excel file: {str(e)}") from e
+    try:
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.active
+        except KeyError as e:
+            raise ValueError(
+                f"Failed to read Excel file: Worksheet named '{sheet_name}' not found"
+            ) from e
+        yield from worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _parse_date(value) -> date | None:
+    """
+    Convert a date cell to a date, or None if it is empty or unparseable.
+
+    Text dates are parsed day-first (DD/MM/YYYY, common in BEAC data).
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    parsed = pd.to_datetime(value, errors="coerce", dayfirst=True)
+    if pd.isna(parsed):
+        return None
+    return parsed.date()
@@ -0,0 +1,34 @@
+"""
+Celery tasks for reference data maintenance.
+
+Reference data is global (not organization-scoped), so these tasks take no
+org_id and run outside organization context.
+
+Key tasks:
+    - reclassify_yield_curve_staleness: Nightly refresh of yield curve point
+      staleness buckets
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from celery import shared_task
+
+from apps.reference_data.models import YieldCurvePoint
+
+
+@shared_task
+def reclassify_yield_curve_staleness() -> dict[str, Any]:
+    """
+    Recompute YieldCurvePoint.staleness_bucket relative to today.
+
+    Staleness buckets are set on save but age as days pass, so this task is
+    scheduled nightly (e.g. 00:30 local time) as a django_celery_beat
+    periodic task.
+
+    Returns:
+        dict: Task result containing:
+            - updated (int): Number of points reclassified
+    """
+    return {"updated": YieldCurvePoint.reclassify_staleness()}
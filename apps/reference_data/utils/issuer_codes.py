@@ -23,6 +23,7 @@ Example:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 # Region code mapping: Country codes to region codes
@@ -57,6 +58,10 @@ TYPE_CODE_MAP: dict[str, str] = {
 # Issuer code format regex pattern
 ISSUER_CODE_PATTERN = re.compile(r"^[A-Z]{2,3}-[A-Z]{3}-[A-Z0-9]{1,10}$")
 
+# Patterns used when deriving identifiers from issuer names
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]")
+_BANK_WORDS_RE = re.compile(r"\b(BANQUE|BANK|DE|DU|OF)\b", flags=re.IGNORECASE)
+
 
 def get_region_code(country: Optional[str]) -> str:
     """
@@ -92,6 +97,24 @@ def get_type_code(issuer_group_code: Optional[str]) -> str:
     return TYPE_CODE_MAP.get(code_upper, "COR")
 
 
+@lru_cache(maxsize=256)
+def get_code_prefix(country: Optional[str], issuer_group_code: Optional[str]) -> str:
+    """
+    Get the [REGION]-[TYPE] prefix of an issuer code.
+
+    Memoized: imports repeat a handful of (country, group) pairs across many
+    issuers, so the prefix is only derived once per pair.
+
+    Args:
+        country: ISO 3166-1 alpha-2 country code or None.
+        issuer_group_code: IssuerGroup code or None.
+
+    Returns:
+        str: Prefix such as "CM-SOV".
+    """
+    return f"{get_region_code(country)}-{get_type_code(issuer_group_code)}"
+
+
 def normalize_identifier(name: str, max_length: int = 10) -> str:
     """
     Normalize issuer name to create a unique identifier.
@@ -127,7 +150,7 @@ def normalize_identifier(name: str, max_length: int = 10) -> str:
     # Handle common bank patterns
     if "BANQUE" in name_upper or "BANK" in name_upper:
         # Extract key words after "BANQUE" or "BANK"
-        parts = re.split(r"\b(BANQUE|BANK|DE|DU|OF)\b", name_upper, flags=re.IGNORECASE)
+        parts = _BANK_WORDS_RE.split(name_upper)
         # Get meaningful parts (skip common words)
         meaningful = [
             p.strip()
@@ -136,12 +159,12 @@ def normalize_identifier(name: str, max_length: int = 10) -> str:
         ]
         if meaningful:
             # Take first meaningful part and normalize
-            identifier = "".join(meaningful[0].split())[:max_length]
+            identifier = _NON_ALNUM_RE.sub("", meaningful[0])[:max_length]
             if identifier:
                 return identifier
 
     # Remove special characters, keep only alphanumeric
-    identifier = re.sub(r"[^A-Z0-9]", "", name_upper)
+    identifier = _NON_ALNUM_RE.sub("", name_upper)
 
     # If too long, truncate (don't create acronyms - just truncate)
     if len(identifier) > max_length:
@@ -177,18 +200,45 @@ def generate_issuer_code(
         >>> generate_issuer_code("BANQUE DE GABON", country="GA", issuer_group_code="BANK")
         'GA-BNK-BANQUEDEGAB'
     """
-    region = get_region_code(country)
-    type_code = get_type_code(issuer_group_code)
-
     if identifier:
         # Use provided identifier, normalize it
-        normalized_id = re.sub(r"[^A-Z0-9]", "", identifier.upper())[:10]
+        normalized_id = _NON_ALNUM_RE.sub("", identifier.upper())[:10]
         if not normalized_id:
             normalized_id = normalize_identifier(name)
     else:
         normalized_id = normalize_identifier(name)
 
-    return f"{region}-{type_code}-{normalized_id}"
+    return f"{get_code_prefix(country, issuer_group_code)}-{normalized_id}"
+
+
+def suffix_issuer_code(base_code: str, counter: int) -> str:
+    """
+    Append a numeric suffix to an issuer code to resolve a uniqueness conflict.
+
+    The identifier part is truncated so the suffixed identifier still fits in
+    10 characters.
+
+    Args:
+        base_code: Issuer code that is already taken.
+        counter: Suffix number (1, 2, ...).
+
+    Returns:
+        str: Suffixed issuer code.
+
+    Example:
+        >>> suffix_issuer_code("CM-SOV-GOVT", 1)
+        'CM-SOV-GOVT1'
+        >>> suffix_issuer_code("GA-BNK-BANQUEDEGA", 12)
+        'GA-BNK-BANQUEDE12'
+    """
+    parts = base_code.rsplit("-", 1)
+    if len(parts) != 2:
+        return f"{base_code}{counter}"
+
+    region_type, identifier = parts
+    max_id_length = 10 - len(str(counter))
+    identifier = identifier[:max_id_length] if max_id_length > 0 else "X"
+    return f"{region_type}-{identifier}{counter}"
 
 
 def validate_issuer_code(code: str) -> tuple[bool, Optional[str]]:
@@ -224,8 +274,9 @@ def validate_issuer_code(code: str) -> tuple[bool, Optional[str]]:
     if code != code.upper():
         return False, "Issuer code must be uppercase"
 
-    code = code.strip().upper()
+    code = code.strip()
 
+    # The pattern enforces the part count, part lengths and identifier charset
     if not ISSUER_CODE_PATTERN.match(code):
         return (
             False,
@@ -233,26 +284,4 @@ def validate_issuer_code(code: str) -> tuple[bool, Optional[str]]:
             "(e.g., CM-SOV-GOVT, GA-BNK-BANQUEDEGAB)",
         )
 
-    # Validate region code
-    parts = code.split("-")
-    if len(parts) != 3:
-        return False, "Issuer code must have exactly 3 parts separated by hyphens"
-
-    region, type_code, identifier = parts
-
-    # Check if region is valid (2-3 chars, uppercase)
-    if len(region) < 2 or len(region) > 3:
-        return False, "Region code must be 2-3 characters"
-
-    # Check if type code is valid (3 chars)
-    if len(type_code) != 3:
-        return False, "Type code must be exactly 3 characters"
-
-    # Check if identifier is valid (1-10 chars, alphanumeric)
-    if len(identifier) < 1 or len(identifier) > 10:
-        return False, "Identifier must be 1-10 characters"
-
-    if not re.match(r"^[A-Z0-9]+$", identifier):
-        return False, "Identifier must contain only uppercase letters and numbers"
-
     return True, None
@@ -16,8 +16,29 @@ from apps.reference_data.models import MarketDataSourcePriority
 from libs.tenant_context import get_current_org_id
 
 
+def load_priority_overrides(org_id: int | None = None) -> dict[tuple[str, int], int]:
+    """
+    Load an organization's priority overrides for one canonicalization run.
+
+    Args:
+        org_id: Organization ID (if None, uses current org context).
+
+    Returns:
+        dict: Mapping of (data_type, source_id) -> priority (empty without
+        an organization context).
+    """
+    if org_id is None:
+        org_id = get_current_org_id()
+    if org_id is None:
+        return {}
+    return MarketDataSourcePriority.get_overrides(org_id)
+
+
 def get_effective_priority(
-    source: MarketDataSource, data_type: str, org_id: int | None = None
+    source: MarketDataSource,
+    data_type: str,
+    org_id: int | None = None,
+    overrides: dict[tuple[str, int], int] | None = None,
 ) -> int:
     """
     Get effective priority for a market data source.
@@ -29,6 +50,8 @@ def get_effective_priority(
         source: MarketDataSource instance.
         data_type: Data type ("fx_rate", "price", "yield_curve", "index_value").
         org_id: Organization ID (if None, uses current org context).
+        overrides: Overrides from load_priority_overrides(), loaded once per
+            run by batch callers. If None, the override is queried.
 
     Returns:
         int: Effective priority value (lower = higher priority).
@@ -38,6 +61,10 @@ def get_effective_priority(
         >>> priority = get_effective_priority(source, "fx_rate", org_id=1)
         >>> # Returns org-specific priority if set, else source.priority
     """
+    # Overrides preloaded by the caller, else use global priority
+    if overrides is not None:
+        return overrides.get((data_type, source.id), source.priority)
+
     # Use provided org_id or get from context
     if org_id is None:
         org_id = get_current_org_id()
@@ -92,22 +119,17 @@ def get_source_priorities_for_org(
     priority_map = {}
 
     if org_id is not None:
-        # Get org-specific overrides
-        overrides = {
-            override.source_id: override.priority
-            for override in MarketDataSourcePriority.objects.filter(
-                organization_id=org_id,
-                data_type=data_type,
-            ).select_related("source")
-        }
+        # Get org-specific overrides in one query
+        overrides = MarketDataSourcePriority.get_overrides(org_id)
 
         # Build map: override if exists, else global priority
         for source in sources:
-            priority_map[source.id] = overrides.get(source.id, source.priority)
+            priority_map[source.id] = overrides.get(
+                (data_type, source.id), source.priority
+            )
     else:
         # No org context, use global priorities
         for source in sources:
             priority_map[source.id] = source.priority
 
     return priority_map
-
@@ -167,6 +167,17 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Default currency settings for djmoney
 DEFAULT_CURRENCY = "XAF"  # Central African CFA franc ("XAF" is ISO code; if using a custom/non-ISO code use with care)
 
+# Rows per INSERT batch when ingesting price observations
+PRICE_INGEST_BATCH_SIZE = int(os.environ.get("PRICE_INGEST_BATCH_SIZE", "10000"))
+
+# Rows per INSERT batch when ingesting yield curve observations
+YIELD_CURVE_INGEST_BATCH_SIZE = int(
+    os.environ.get("YIELD_CURVE_INGEST_BATCH_SIZE", "1000")
+)
+
+# Rows per UPDATE batch for bulk_update() refresh jobs
+BULK_UPDATE_BATCH_SIZE = int(os.environ.get("BULK_UPDATE_BATCH_SIZE", "500"))
+
 # If you want S3/R2 storage: set USE_S3=1 and vars below
 USE_S3 = os.environ.get("USE_S3", "0") == "1"
 
@@ -39,6 +39,11 @@ class ImportStatus(models.TextChoices):
     PARTIAL = "partial", _("Partial")  # Some rows succeeded, some failed
 
 
+# Status value -> label map, built once. Model.get_status_display() rebuilds
+# this dict on every call, which adds up when rendering long import lists.
+IMPORT_STATUS_LABELS = dict(ImportStatus.choices)
+
+
 class ImportSourceType(models.TextChoices):
     """
     Source type choices for imports.
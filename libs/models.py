@@ -73,12 +73,17 @@ class OrganizationManager(models.Manager):
     """
     Custom manager for organization-owned models.
 
-    Provides automatic filtering by current organization context.
+    Provides automatic filtering by current organization context. Models with
+    their own QuerySet subclass can build a manager with
+    ``OrganizationManager.from_queryset(MyQuerySet)()``, provided the QuerySet
+    extends OrganizationQuerySet.
     """
 
+    _queryset_class = OrganizationQuerySet
+
     def get_queryset(self):
         """Return QuerySet filtered by current organization."""
-        return OrganizationQuerySet(self.model, using=self._db)
+        return self._queryset_class(self.model, using=self._db)
 
     def all(self):
         """Return all objects for current organization."""
@@ -0,0 +1,243 @@
+"""
+PostgreSQL-specific database helpers.
+
+Production runs on PostgreSQL, while the test suite runs on SQLite. The helpers
+in this module let models and migrations declare PostgreSQL-only features
+(BRIN and trigram GIN indexes, raw DDL, COPY) while degrading gracefully on
+other database vendors, so migrations still apply cleanly in tests.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from itertools import islice
+
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.db import connection, migrations, models, transaction
+
+
+def is_postgres(connection) -> bool:
+    """
+    Check whether a database connection targets PostgreSQL.
+
+    Args:
+        connection: Django database connection (or schema_editor.connection).
+
+    Returns:
+        bool: True if the connection vendor is PostgreSQL.
+    """
+    return connection.vendor == "postgresql"
+
+
+class PortableBrinIndex(BrinIndex):
+    """
+    BRIN index that falls back to a regular B-tree index on non-PostgreSQL backends.
+
+    BRIN indexes store per-block min/max summaries and are a good fit for
+    append-only time-series columns (dates, timestamps) whose physical order
+    correlates with insertion order. On other vendors (SQLite in tests) a plain
+    index is created instead so migrations remain portable.
+
+    Example:
+        >>> PortableBrinIndex(fields=["date"], pages_per_range=32, name="obs_date_brin")
+    """
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if not is_postgres(schema_editor.connection):
+            return models.Index.create_sql(
+                self, model, schema_editor, using=using, **kwargs
+            )
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
+
+
+class PortableGinIndex(GinIndex):
+    """
+    GIN index that falls back to a regular B-tree index on non-PostgreSQL backends.
+
+    Mainly used with the ``gin_trgm_ops`` operator class (requires the pg_trgm
+    extension) so ``icontains``/``trigram_similar`` lookups on text columns can
+    use an index. On other vendors operator classes are dropped and a plain
+    index on the same fields is created instead.
+
+    Example:
+        >>> PortableGinIndex(
+        ...     fields=["name"], opclasses=["gin_trgm_ops"], name="issuer_name_trgm"
+        ... )
+    """
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if not is_postgres(schema_editor.connection):
+            return models.Index(fields=self.fields, name=self.name).create_sql(
+                model, schema_editor, using=using, **kwargs
+            )
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
+
+
+class PostgresRunSQL(migrations.RunSQL):
+    """
+    RunSQL operation that only executes on PostgreSQL.
+
+    Used for PostgreSQL-only DDL (triggers, functions) that has no equivalent
+    on other backends. On other vendors the operation is a no-op in both
+    directions.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgres(schema_editor.connection):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgres(schema_editor.connection):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+def copy_upsert(
+    model: type[models.Model],
+    key_fields: list[str],
+    value_fields: list[str],
+    rows: Iterable[tuple],
+) -> int:
+    """
+    Stream rows into a model's table with COPY, upserting on a unique key.
+
+    Rows are COPYed into a temporary staging table (no model instances, no
+    per-row statement) and merged with one INSERT ... SELECT ... ON CONFLICT
+    DO UPDATE, which also sets created_at/updated_at. Other columns with a
+    model default get that default on insert, as bulk_create() would set
+    them. PostgreSQL only; callers fall back to bulk_create() elsewhere.
+    Rows must be unique on the key.
+
+    Args:
+        model: Model class with created_at/updated_at columns.
+        key_fields: Field names of the unique constraint to upsert on.
+        value_fields: Field names updated on conflict.
+        rows: Tuples ordered as key_fields followed by value_fields, with
+            foreign keys given as IDs.
+
+    Returns:
+        int: Number of rows written.
+    """
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    stage = quote(f"{model._meta.db_table}_stage")
+    columns = [
+        quote(model._meta.get_field(name).column)
+        for name in [*key_fields, *value_fields]
+    ]
+    key_columns = columns[: len(key_fields)]
+    value_columns = columns[len(key_fields) :]
+    column_list = ", ".join(columns)
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}"
+        for column in [*value_columns, quote("updated_at")]
+    )
+    # Columns not copied are inserted with the model default, not NULL
+    defaulted = [
+        field
+        for field in model._meta.concrete_fields
+        if field.has_default()
+        and not field.primary_key
+        and field.name not in {*key_fields, *value_fields, "created_at", "updated_at"}
+    ]
+    default_columns = "".join(f", {quote(field.column)}" for field in defaulted)
+    default_values = "".join(
+        f", %s::{field.db_type(connection)}" for field in defaulted
+    )
+    default_params = [
+        field.get_db_prep_save(field.get_default(), connection) for field in defaulted
+    ]
+
+    written = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {stage} AS "
+            f"SELECT {column_list} FROM {table} WITH NO DATA"
+        )
+        with cursor.copy(f"COPY {stage} ({column_list}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+                written += 1
+        cursor.execute(
+            f"INSERT INTO {table} "
+            f"({column_list}{default_columns}, created_at, updated_at) "
+            f"SELECT {column_list}{default_values}, now(), now() FROM {stage} "
+            f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {updates}",
+            default_params,
+        )
+        cursor.execute(f"DROP TABLE {stage}")
+    return written
+
+
+def batched_upsert(
+    model: type[models.Model],
+    objs: Iterable[models.Model],
+    key_fields: list[str],
+    value_fields: list[str],
+    batch_size: int,
+) -> int:
+    """
+    Insert or update unsaved instances in batches, upserting on a unique key.
+
+    Each batch is a single INSERT ... ON CONFLICT DO UPDATE (bulk_create with
+    update_conflicts), which also sets updated_at. All batches run in one
+    transaction, so a failure part way through writes nothing. Instances
+    must be unique on the key.
+
+    Args:
+        model: Model class with an updated_at column.
+        objs: Unsaved model instances (consumed lazily, batch by batch).
+        key_fields: Field names of the unique constraint to upsert on.
+        value_fields: Field names updated on conflict.
+        batch_size: Rows per statement.
+
+    Returns:
+        int: Number of rows written.
+    """
+    objs = iter(objs)
+    written = 0
+    with transaction.atomic():
+        while batch := list(islice(objs, batch_size)):
+            model._default_manager.bulk_create(
+                batch,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=key_fields,
+                update_fields=[*value_fields, "updated_at"],
+            )
+            written += len(batch)
+    return written
+
+
+def stream_upsert(
+    model: type[models.Model],
+    key_fields: list[str],
+    value_fields: list[str],
+    rows: Iterable[tuple],
+    batch_size: int,
+) -> int:
+    """
+    Upsert tuple rows with copy_upsert(), or batched_upsert() off PostgreSQL.
+
+    Args:
+        model: Model class with created_at/updated_at columns.
+        key_fields: Field names of the unique constraint to upsert on.
+        value_fields: Field names updated on conflict.
+        rows: Tuples ordered as key_fields followed by value_fields, with
+            foreign keys given as IDs.
+        batch_size: Rows per statement for the batched_upsert() fallback.
+
+    Returns:
+        int: Number of rows written.
+    """
+    if is_postgres(connection):
+        return copy_upsert(model, key_fields, value_fields, rows)
+    attnames = [
+        model._meta.get_field(name).attname for name in [*key_fields, *value_fields]
+    ]
+    return batched_upsert(
+        model,
+        (model(**dict(zip(attnames, row, strict=True))) for row in rows),
+        key_fields,
+        value_fields,
+        batch_size,
+    )
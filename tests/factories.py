@@ -431,7 +431,8 @@ class MarketDataSourceFactory(factory.django.DjangoModelFactory):
 
     code = factory.Sequence(lambda n: f"SOURCE{n:03d}")
     name = factory.Sequence(lambda n: f"Market Data Source {n}")
-    priority = factory.Sequence(lambda n: n + 1)
+    # Stay within the 1-1000 range enforced by the database
+    priority = factory.Sequence(lambda n: n % 1000 + 1)
     source_type = factory.Iterator(
         [
             MarketDataSource.SourceType.EXCHANGE,
@@ -739,10 +740,10 @@ class MarketIndexValueFactory(factory.django.DjangoModelFactory):
     date = factory.LazyFunction(date.today)
     chosen_source = factory.SubFactory(MarketDataSourceFactory)
     value = factory.Faker(
-        "pydecimal", left_digits=5, right_digits=2, positive=True, max_value=10000
+        "pyfloat", left_digits=5, right_digits=2, positive=True, max_value=10000
     )
     return_pct = factory.Faker(
-        "pydecimal",
+        "pyfloat",
         left_digits=2,
         right_digits=2,
         positive=False,
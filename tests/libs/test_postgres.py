@@ -0,0 +1,117 @@
+"""
+Tests for PostgreSQL-specific database helpers.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import IntegrityError, connection
+from django.utils import timezone
+
+from apps.reference_data.models import (
+    Issuer,
+    MarketIndexValueObservation,
+    YieldCurvePointObservation,
+)
+from apps.reference_data.models.yield_curves import (
+    YIELD_OBSERVATION_KEY_FIELDS,
+    YIELD_OBSERVATION_VALUE_FIELDS,
+)
+from libs.postgres import (
+    PortableBrinIndex,
+    PortableGinIndex,
+    is_postgres,
+    stream_upsert,
+)
+
+
+class TestPortableBrinIndex:
+    """Test cases for PortableBrinIndex."""
+
+    def test_is_postgres_matches_connection_vendor(self):
+        """Test is_postgres reflects the active database vendor."""
+        assert is_postgres(connection) == (connection.vendor == "postgresql")
+
+    @pytest.mark.django_db
+    def test_index_created_on_current_backend(self):
+        """Test BRIN indexes are created (as B-tree fallback outside PostgreSQL)."""
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, MarketIndexValueObservation._meta.db_table
+            )
+        assert "mivo_date_brin" in constraints
+        assert constraints["mivo_date_brin"]["columns"] == ["date"]
+
+    def test_deconstruct_keeps_pages_per_range(self):
+        """Test deconstruction preserves BRIN options for migrations."""
+        index = PortableBrinIndex(
+            fields=["date"], pages_per_range=32, name="test_date_brin"
+        )
+        path, args, kwargs = index.deconstruct()
+        assert path == "libs.postgres.PortableBrinIndex"
+        assert kwargs["pages_per_range"] == 32
+
+
+class TestPortableGinIndex:
+    """Test cases for PortableGinIndex."""
+
+    @pytest.mark.django_db
+    def test_index_created_on_current_backend(self):
+        """Test trigram indexes are created (as B-tree fallback outside PostgreSQL)."""
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Issuer._meta.db_table
+            )
+        assert "issuer_name_trgm" in constraints
+        assert constraints["issuer_name_trgm"]["columns"] == ["name"]
+
+    def test_deconstruct_keeps_opclasses(self):
+        """Test deconstruction preserves operator classes for migrations."""
+        index = PortableGinIndex(
+            fields=["name"], opclasses=["gin_trgm_ops"], name="test_name_trgm"
+        )
+        path, args, kwargs = index.deconstruct()
+        assert path == "libs.postgres.PortableGinIndex"
+        assert kwargs["opclasses"] == ["gin_trgm_ops"]
+
+
+@pytest.mark.django_db
+class TestStreamUpsert:
+    """Test cases for stream_upsert (and its batched_upsert fallback)."""
+
+    def upsert(self, curve, source, rates, batch_size=2):
+        """Upsert yield curve observations given as {tenor_days: rate}."""
+        now = timezone.now()
+        rows = [
+            (curve.id, tenor_days, date(2025, 1, 1), source.id, 0, "1Y", rate, now)
+            for tenor_days, rate in rates.items()
+        ]
+        return stream_upsert(
+            YieldCurvePointObservation,
+            YIELD_OBSERVATION_KEY_FIELDS,
+            YIELD_OBSERVATION_VALUE_FIELDS,
+            rows,
+            batch_size,
+        )
+
+    def test_inserts_and_updates_across_batches(self, yield_curve, market_data_source):
+        """Test rows are inserted in batches and existing keys are updated."""
+        assert (
+            self.upsert(yield_curve, market_data_source, {365: 4, 730: 5, 1095: 6}) == 3
+        )
+        assert self.upsert(yield_curve, market_data_source, {365: Decimal("4.5")}) == 1
+
+        rates = dict(
+            YieldCurvePointObservation.objects.values_list("tenor_days", "rate")
+        )
+        assert rates == {365: Decimal("4.5"), 730: 5, 1095: 6}
+
+    def test_failed_batch_rolls_back_earlier_batches(
+        self, yield_curve, market_data_source
+    ):
+        """Test a failure in a later batch leaves nothing written."""
+        with pytest.raises(IntegrityError):
+            self.upsert(yield_curve, market_data_source, {365: 4, 730: 5, 1095: None})
+
+        assert not YieldCurvePointObservation.objects.exists()
@@ -91,6 +91,30 @@ class TestCanonicalizeIndexValues:
         assert result["created"] == 2
         assert MarketIndexValue.objects.filter(index=market_index).count() == 2
 
+    def test_canonicalize_index_values_updates_latest_value(
+        self, market_index, market_data_source
+    ):
+        """Test canonicalization maintains the latest value cache on MarketIndex."""
+        source = MarketDataSourceFactory(priority=1)
+        MarketIndexValueObservationFactory(
+            index=market_index, date=date(2024, 1, 1), value=100.0, source=source
+        )
+        MarketIndexValueObservationFactory(
+            index=market_index,
+            date=date(2024, 1, 2),
+            value=101.5,
+            return_pct=1.5,
+            source=source,
+        )
+
+        result = canonicalize_index_values(index_code=market_index.code)
+
+        assert result["indices_updated"] == 1
+        market_index.refresh_from_db()
+        assert market_index.last_date == date(2024, 1, 2)
+        assert market_index.last_value == 101.5
+        assert market_index.last_return_pct == 1.5
+
     def test_canonicalize_index_values_revision_priority(
         self, market_index, market_data_source
     ):
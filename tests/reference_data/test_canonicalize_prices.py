@@ -0,0 +1,82 @@
+"""
+Tests for instrument price canonicalization service.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from apps.reference_data.models import InstrumentPrice
+from apps.reference_data.services.prices.canonicalize import canonicalize_prices
+from tests.factories import (
+    InstrumentPriceFactory,
+    InstrumentPriceObservationFactory,
+    MarketDataSourceFactory,
+)
+
+
+class TestCanonicalizePrices:
+    """Test cases for instrument price canonicalization service."""
+
+    def test_counts_created_and_updated_per_batch(self, instrument, settings):
+        """Test created/updated are counted from each batch's own keys."""
+        settings.PRICE_INGEST_BATCH_SIZE = 2
+        source = MarketDataSourceFactory(priority=1)
+        InstrumentPriceFactory(
+            instrument=instrument,
+            date=date(2025, 1, 2),
+            price_type="close",
+            chosen_source=source,
+            price=Decimal("90"),
+        )
+        for day in (1, 2, 3):
+            InstrumentPriceObservationFactory(
+                instrument=instrument,
+                date=date(2025, 1, day),
+                price_type="close",
+                source=source,
+                price=Decimal("100"),
+            )
+
+        result = canonicalize_prices()
+
+        assert result["created"] == 2
+        assert result["updated"] == 1
+        assert result["errors"] == []
+        assert set(
+            InstrumentPrice.objects.filter(instrument=instrument).values_list(
+                "price", flat=True
+            )
+        ) == {Decimal("100")}
+
+    def test_failed_batch_rolls_back_earlier_batches(self, instrument, settings):
+        """Test a failing batch leaves no canonical prices and reports no counts."""
+        settings.PRICE_INGEST_BATCH_SIZE = 1
+        source = MarketDataSourceFactory(priority=1)
+        for day in (1, 2):
+            InstrumentPriceObservationFactory(
+                instrument=instrument,
+                date=date(2025, 1, day),
+                price_type="close",
+                source=source,
+            )
+        upsert = InstrumentPrice.upsert_from_observations
+        calls = []
+
+        def fail_second_batch(observations, **kwargs):
+            calls.append(observations)
+            if len(calls) == 2:
+                raise RuntimeError("write failed")
+            return upsert(observations, **kwargs)
+
+        with patch.object(
+            InstrumentPrice, "upsert_from_observations", side_effect=fail_second_batch
+        ):
+            result = canonicalize_prices()
+
+        assert result["created"] == 0
+        assert result["updated"] == 0
+        assert result["errors"] == ["Error writing canonical prices: write failed"]
+        assert not InstrumentPrice.objects.exists()
@@ -127,6 +127,40 @@ class TestImportIndexLevelsExcel:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 
+    def test_import_index_levels_excel_out_of_range_row_is_skipped(
+        self, market_index, market_data_source
+    ):
+        """Test an out-of-range level is reported per row without aborting the import."""
+        df = pd.DataFrame(
+            {
+                "date": [date(2024, 1, 1), date(2024, 1, 2)],
+                "index_code": [market_index.code, market_index.code],
+                "level": [100.0, 1e15],
+            }
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+            df.to_excel(tmp_path, index=False, sheet_name="INDEX_LEVELS")
+
+        try:
+            result = _import_index_levels_excel(
+                file_path=tmp_path,
+                source=market_data_source,
+                sheet_name="INDEX_LEVELS",
+            )
+
+            assert result["created"] == 1
+            assert len(result["errors"]) == 1
+            assert result["errors"][0].startswith("Row 3: level")
+            assert list(
+                MarketIndexValueObservation.objects.filter(
+                    index=market_index
+                ).values_list("date", flat=True)
+            ) == [date(2024, 1, 1)]
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
     def test_import_index_levels_excel_with_base_point(
         self, market_index, market_data_source
     ):
@@ -390,3 +390,43 @@ class TestImportInstrumentPricesExcel:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 
+    def test_import_prices_out_of_range_row_is_skipped(self, org_context_with_org):
+        """Test an out-of-range price is reported per row without aborting the import."""
+        instrument = EquityInstrumentFactory(isin="ISIN001")
+        MarketDataSourceFactory(code="BVMAC")
+
+        df = pd.DataFrame(
+            {
+                "date": [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)],
+                "instrument_id": ["ISIN001", "ISIN001", "ISIN001"],
+                "price": [100.0, 1e15, 101.0],
+                "price_type": ["close", "close", "close"],
+                "quote_convention": ["percent_of_par"] * 3,
+                "clean_or_dirty": ["clean"] * 3,
+                "Volume": [1000, 1000, 1e19],
+            }
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+            df.to_excel(tmp_path, index=False, sheet_name="PRICES")
+
+        try:
+            result = import_prices_from_file(
+                file_path=tmp_path,
+                source_code="BVMAC",
+                sheet_name="PRICES",
+            )
+
+            assert result["created"] == 1
+            assert len(result["errors"]) == 2
+            assert result["errors"][0].startswith("Row 3: Price")
+            assert result["errors"][1].startswith("Row 4: Volume")
+            assert list(
+                InstrumentPriceObservation.objects.filter(
+                    instrument=instrument
+                ).values_list("date", flat=True)
+            ) == [date(2024, 1, 1)]
+
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
@@ -303,3 +303,35 @@ class TestImportInstrumentsExcel:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 
+    def test_import_instruments_matches_issuer_name_case_insensitively(
+        self, org_context_with_org
+    ):
+        """Test issuers are matched by name regardless of case."""
+        group = InstrumentGroupFactory(name="BOND")
+        InstrumentTypeFactory(group=group, name="GOVERNMENT")
+        issuer = IssuerFactory(short_name="GOV", name="Republic of Cameroon")
+
+        df = pd.DataFrame(
+            {
+                "name": ["Test Bond"],
+                "instrument_group_code": ["BOND"],
+                "instrument_type_code": ["GOVERNMENT"],
+                "currency": ["XAF"],
+                "issuer_code": ["REPUBLIC OF CAMEROON"],
+                "valuation_method": ["mark_to_market"],
+            }
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+            df.to_excel(tmp_path, index=False, sheet_name="INSTRUMENTS")
+
+        try:
+            result = import_instruments_from_file(file_path=tmp_path)
+
+            assert result["created"] == 1
+            assert len(result["errors"]) == 0
+            assert Instrument.objects.get(name="Test Bond").issuer == issuer
+
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
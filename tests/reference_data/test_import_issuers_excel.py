@@ -55,6 +55,34 @@ class TestImportIssuersExcel:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 
+    def test_import_issuers_assigns_unique_codes(self, org_context_with_org):
+        """Test issuers colliding on generated codes get distinct codes."""
+        df = pd.DataFrame(
+            {
+                "name": ["ETAT DU CAMEROUN", "REPUBLIQUE DU CAMEROUN"],
+                "short_name": ["CMR", "RDC"],
+                "country": ["CM", "CM"],
+                "issuer_group": ["Sovereign", "Sovereign"],
+            }
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+            df.to_excel(tmp_path, index=False, sheet_name="ISSUERS")
+
+        try:
+            result = import_issuers_from_file(
+                file_path=tmp_path,
+                sheet_name="ISSUERS",
+            )
+
+            assert result["created"] == 2
+            codes = set(Issuer.objects.values_list("issuer_code", flat=True))
+            assert codes == {"CM-SOV-GOVT", "CM-SOV-GOVT1"}
+
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
     def test_import_issuers_missing_columns(self, org_context_with_org):
         """Test import fails with missing required columns."""
         df = pd.DataFrame(
@@ -148,6 +176,47 @@ class TestImportIssuersExcel:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 
+    def test_import_issuers_matches_existing_ignoring_case(self, org_context_with_org):
+        """Test import matches existing issuers regardless of name casing."""
+        from apps.reference_data.models.issuers import IssuerGroup
+
+        bank_group = IssuerGroup.objects.create(code="BANK", name="Bank")
+        Issuer.objects.create(
+            organization=org_context_with_org,
+            name="Test Issuer",
+            short_name="TI",
+            country="GA",
+            issuer_group=bank_group,
+        )
+
+        df = pd.DataFrame(
+            {
+                "name": ["TEST ISSUER"],
+                "short_name": ["TI_UPDATED"],
+                "country": ["CM"],
+                "issuer_group": ["Bank"],
+            }
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+            df.to_excel(tmp_path, index=False, sheet_name="ISSUERS")
+
+        try:
+            result = import_issuers_from_file(
+                file_path=tmp_path,
+                sheet_name="ISSUERS",
+            )
+
+            assert result["created"] == 0
+            assert result["updated"] == 1
+            issuer = Issuer.objects.get()
+            assert issuer.name == "Test Issuer"
+            assert issuer.short_name == "TI_UPDATED"
+
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
     def test_import_issuers_requires_org_context(self):
         """Test import fails without organization context."""
         df = pd.DataFrame(
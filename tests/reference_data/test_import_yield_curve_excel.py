@@ -3,6 +3,7 @@ Tests for import_yield_curve_excel management command.
 """
 
 import tempfile
+from datetime import date
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
@@ -13,6 +14,10 @@ from django.core.management import call_command
 from django.core.management.base import CommandError
 
 from apps.audit.models import AuditEvent
+from apps.reference_data.models import YieldCurvePointObservation
+from apps.reference_data.services.yield_curves.import_excel import (
+    _import_yield_curve_excel,
+)
 
 
 class TestImportYieldCurveExcel:
@@ -218,3 +223,80 @@ class TestImportYieldCurveExcel:
 
             # Command should execute without error
             mock_import.assert_called_once()
+
+
+class TestImportYieldCurveExcelService:
+    """Test cases for the streaming Excel reader."""
+
+    def test_streams_sheet_rows_into_observations(
+        self, yield_curve, market_data_source
+    ):
+        """Test rows are read from the named sheet, deduplicated and counted."""
+        df = pd.DataFrame(
+            {
+                "date": ["15/01/2024", "16/01/2024", None, "16/01/2024"],
+                "1M": [2.5, 2.6, 9.9, 2.7],
+                "1Y": [4.0, None, 9.9, 4.1],
+            }
+        )
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+        try:
+            with pd.ExcelWriter(tmp_path) as writer:
+                pd.DataFrame({"other": [1]}).to_excel(
+                    writer, sheet_name="OTHER", index=False
+                )
+                df.to_excel(writer, sheet_name="CM", index=False)
+
+            result = _import_yield_curve_excel(
+                file_path=tmp_path,
+                curve=yield_curve,
+                source=market_data_source,
+                sheet_name="CM",
+            )
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
+        assert result["total_rows"] == 3
+        assert result["created"] == 4
+        assert result["updated"] == 1
+        assert result["errors"] == []
+        assert result["min_date"] == date(2024, 1, 15)
+        assert result["max_date"] == date(2024, 1, 16)
+        rates = dict(
+            YieldCurvePointObservation.objects.filter(
+                curve=yield_curve, date=date(2024, 1, 16)
+            ).values_list("tenor", "rate")
+        )
+        assert {tenor: float(rate) for tenor, rate in rates.items()} == {
+            "1M": 2.7,
+            "1Y": 4.1,
+        }
+
+    def test_out_of_range_rate_is_reported_per_cell(
+        self, yield_curve, market_data_source
+    ):
+        """Test a rate overflowing the rate column is an error, not an abort."""
+        df = pd.DataFrame(
+            {"date": ["15/01/2024"], "1M": [2.5], "1Y": [12345.0]},
+        )
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+        try:
+            df.to_excel(tmp_path, index=False)
+            result = _import_yield_curve_excel(
+                file_path=tmp_path, curve=yield_curve, source=market_data_source
+            )
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
+        assert result["created"] == 1
+        assert result["errors"] == [
+            "Row 2, Column 1Y: Rate 12345 is out of range "
+            "(must be between -10000 and 10000)"
+        ]
+        assert list(
+            YieldCurvePointObservation.objects.filter(curve=yield_curve).values_list(
+                "tenor", flat=True
+            )
+        ) == ["1M"]
@@ -9,9 +9,11 @@ from __future__ import annotations
 
 from apps.reference_data.utils.issuer_codes import (
     generate_issuer_code,
+    get_code_prefix,
     get_region_code,
     get_type_code,
     normalize_identifier,
+    suffix_issuer_code,
     validate_issuer_code,
 )
 
@@ -116,6 +118,18 @@ class TestGetTypeCode:
         assert get_type_code("Bank") == "BNK"
 
 
+class TestGetCodePrefix:
+    """Test cases for get_code_prefix function."""
+
+    def test_get_code_prefix(self):
+        """Test prefix combines region and type codes."""
+        assert get_code_prefix("CM", "SOV") == "CM-SOV"
+
+    def test_get_code_prefix_defaults(self):
+        """Test prefix falls back to INT and COR."""
+        assert get_code_prefix(None, None) == "INT-COR"
+
+
 class TestNormalizeIdentifier:
     """Test cases for normalize_identifier function."""
 
@@ -144,6 +158,10 @@ class TestNormalizeIdentifier:
         result = normalize_identifier("BANQUE DE GABON")
         assert result.startswith("BANQUEDEGAB") or len(result) <= 10
 
+    def test_normalize_identifier_banque_strips_special_chars(self):
+        """Test bank identifiers contain only alphanumeric characters."""
+        assert normalize_identifier("BANQUE D'ETAT") == "DETAT"
+
     def test_normalize_identifier_removes_special_chars(self):
         """Test that special characters are removed."""
         result = normalize_identifier("Test & Company, Inc.")
@@ -238,6 +256,20 @@ class TestGenerateIssuerCode:
         assert len(parts[2]) >= 1 and len(parts[2]) <= 10  # Identifier
 
 
+class TestSuffixIssuerCode:
+    """Test cases for suffix_issuer_code function."""
+
+    def test_suffix_issuer_code_appends_counter(self):
+        """Test suffix is appended to the identifier."""
+        assert suffix_issuer_code("CM-SOV-GOVT", 1) == "CM-SOV-GOVT1"
+
+    def test_suffix_issuer_code_truncates_identifier(self):
+        """Test long identifiers are truncated to keep 10 characters."""
+        code = suffix_issuer_code("GA-BNK-BANQUEDEGA", 12)
+        assert code == "GA-BNK-BANQUEDE12"
+        assert validate_issuer_code(code) == (True, None)
+
+
 class TestValidateIssuerCode:
     """Test cases for validate_issuer_code function."""
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 from io import StringIO
 
 from django.core.management import call_command
+from django.db import connection
 
 from apps.audit.models import AuditEvent
 from apps.reference_data.models.issuers import Issuer, IssuerGroup
@@ -82,8 +83,14 @@ class TestMigrateIssuerCodes:
             country="CM",
             issuer_group=issuer_group,
         )
-        # Set invalid code using update to bypass validation
-        Issuer.objects.filter(pk=issuer.pk).update(issuer_code="INVALID_FORMAT")
+        # Simulate a legacy code predating the issuer_code_format constraint
+        # (the test database is SQLite, which can skip CHECK constraints)
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA ignore_check_constraints = ON")
+            try:
+                Issuer.objects.filter(pk=issuer.pk).update(issuer_code="INVALID_FORMAT")
+            finally:
+                cursor.execute("PRAGMA ignore_check_constraints = OFF")
         issuer.refresh_from_db()
 
         out = StringIO()
@@ -8,13 +8,27 @@ organization scoping, and relationships.
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
-
-from apps.reference_data.models import IssuerRating, ValuationMethod
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError, IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.reference_data.models import (
+    Instrument,
+    InstrumentType,
+    Issuer,
+    IssuerRating,
+    MarketIndex,
+    MarketIndexValueObservation,
+    ValuationMethod,
+)
 from libs.tenant_context import organization_context
 from tests.factories import (
     FXRateFactory,
@@ -80,6 +94,15 @@ class TestInstrumentType:
         expected = f"{instrument_type.group.name} - {instrument_type.name}"
         assert str(instrument_type) == expected
 
+    def test_instrument_type_str_cached(
+        self, instrument_type, django_assert_num_queries
+    ):
+        """Test the display name loads the group at most once per instance."""
+        instance = InstrumentType.objects.get(pk=instrument_type.pk)
+        with django_assert_num_queries(1):
+            str(instance)
+            str(instance)
+
     def test_instrument_type_unique_per_group(self, instrument_group):
         """Test that instrument type names must be unique within a group."""
         InstrumentTypeFactory(group=instrument_group, name="TEST_TYPE")
@@ -110,6 +133,53 @@ class TestInstrumentType:
         """Test that updated_at is automatically set."""
         assert instrument_type.updated_at is not None
 
+    def test_instrument_type_with_related_avoids_n_plus_one(
+        self, django_assert_num_queries
+    ):
+        """Test with_related() renders __str__ without per-row queries."""
+        InstrumentTypeFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            for instrument_type in InstrumentType.objects.with_related():
+                str(instrument_type)
+
+
+class TestIssuerGroup:
+    """Test cases for IssuerGroup model."""
+
+    def test_issuer_group_full_path(self, django_assert_num_queries):
+        """Test full path is stored and rendered without walking parents."""
+        from apps.reference_data.models.issuers import IssuerGroup
+
+        financial = IssuerGroup.objects.create(name="Financial", code="FIN_T")
+        IssuerGroup.objects.create(name="Bank", code="BANK_T", parent=financial)
+
+        with django_assert_num_queries(1):
+            bank = IssuerGroup.objects.get(code="BANK_T")
+            assert str(bank) == "Financial > Bank"
+
+    def test_issuer_group_for_list_defers_description(self):
+        """Test for_list() leaves the description column unloaded."""
+        from apps.reference_data.models.issuers import IssuerGroup
+
+        IssuerGroup.objects.create(name="Financial", code="FIN_T", description="x")
+        group = IssuerGroup.objects.for_list().get(code="FIN_T")
+
+        assert "description" in group.get_deferred_fields()
+
+    def test_issuer_group_rename_updates_descendants(self):
+        """Test renaming a group refreshes descendant paths."""
+        from apps.reference_data.models.issuers import IssuerGroup
+
+        financial = IssuerGroup.objects.create(name="Financial", code="FIN_T")
+        bank = IssuerGroup.objects.create(name="Bank", code="BANK_T", parent=financial)
+        IssuerGroup.objects.create(name="Retail", code="RETAIL_T", parent=bank)
+
+        financial.name = "Finance"
+        financial.save()
+
+        retail = IssuerGroup.objects.get(code="RETAIL_T")
+        assert retail.get_full_path() == "Finance > Bank > Retail"
+
 
 class TestIssuer:
     """Test cases for Issuer model."""
@@ -130,6 +200,12 @@ class TestIssuer:
         with pytest.raises(IntegrityError):
             IssuerFactory(name="Test Issuer")
 
+    def test_issuer_name_unique_ignoring_case(self, org_context_with_org):
+        """Test that issuer names differing only by case are rejected."""
+        IssuerFactory(name="Test Issuer")
+        with pytest.raises(IntegrityError):
+            IssuerFactory(name="TEST ISSUER")
+
     def test_issuer_can_have_same_name_different_organizations(self):
         """Test that same issuer name can exist in different organizations."""
         org1 = OrganizationFactory()
@@ -259,6 +335,72 @@ class TestIssuer:
         # Second code should have conflict resolution (number appended or identifier modified)
         assert "GOVT" in code2 or code2.endswith("1") or len(code2.split("-")[2]) > 4
 
+    def test_issuer_code_conflict_suffix_on_collision_only(self, org_context_with_org):
+        """Test generated codes get a numeric suffix only when already taken."""
+        from apps.reference_data.models.issuers import IssuerGroup
+
+        issuer_group = IssuerGroup.objects.create(code="SOV", name="Sovereign")
+        issuer1 = IssuerFactory(
+            name="ETAT DU CAMEROUN", country="CM", issuer_group=issuer_group
+        )
+        issuer2 = IssuerFactory(
+            name="REPUBLIQUE DU CAMEROUN", country="CM", issuer_group=issuer_group
+        )
+        issuer3 = IssuerFactory(
+            name="REPUBLIC OF CAMEROON", country="CM", issuer_group=issuer_group
+        )
+
+        assert issuer1.issuer_code == "CM-SOV-GOVT"
+        assert issuer2.issuer_code == "CM-SOV-GOVT1"
+        assert issuer3.issuer_code == "CM-SOV-GOVT2"
+
+    def test_issuer_code_conflict_picks_next_free_suffix(self, org_context_with_org):
+        """Test a collision jumps straight to the first free suffix."""
+        from apps.reference_data.models.issuers import IssuerGroup
+
+        issuer_group = IssuerGroup.objects.create(code="SOV", name="Sovereign")
+        for index, code in enumerate(["CM-SOV-GOVT", "CM-SOV-GOVT1", "CM-SOV-GOVT2"]):
+            IssuerFactory(
+                name=f"Existing {index}",
+                country="CM",
+                issuer_group=issuer_group,
+                issuer_code=code,
+            )
+
+        issuer = IssuerFactory(
+            name="ETAT DU CAMEROUN", country="CM", issuer_group=issuer_group
+        )
+
+        assert issuer.issuer_code == "CM-SOV-GOVT3"
+
+    def test_generate_unique_codes_resolves_db_and_batch_collisions(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test bulk code generation resolves collisions with few queries."""
+        from apps.reference_data.models.issuers import Issuer, IssuerGroup
+
+        issuer_group = IssuerGroup.objects.create(code="SOV", name="Sovereign")
+        IssuerFactory(name="ETAT DU CAMEROUN", country="CM", issuer_group=issuer_group)
+        batch = [
+            Issuer(
+                organization=org_context_with_org,
+                name=name,
+                country="CM",
+                issuer_group=issuer_group,
+            )
+            for name in ["REPUBLIQUE DU CAMEROUN", "REPUBLIC OF CAMEROON"]
+        ]
+
+        # One lookup for the base codes, one for the suffixed candidates
+        with django_assert_num_queries(2):
+            Issuer.generate_unique_codes(batch)
+
+        assert [issuer.issuer_code for issuer in batch] == [
+            "CM-SOV-GOVT1",
+            "CM-SOV-GOVT2",
+        ]
+        Issuer.objects.bulk_create(batch)
+
     def test_issuer_code_not_regenerated_if_provided(self, org_context_with_org):
         """Test that issuer_code is not regenerated if manually provided."""
         from apps.reference_data.models.issuers import IssuerGroup
@@ -367,6 +509,14 @@ class TestIssuer:
         with pytest.raises(ValidationError):
             issuer.save()
 
+    def test_issuer_code_format_enforced_by_database(self, org_context_with_org):
+        """Test invalid codes are rejected even when save() is bypassed."""
+        from apps.reference_data.models.issuers import Issuer
+
+        issuer = IssuerFactory()
+        with pytest.raises(IntegrityError):
+            Issuer.objects.filter(pk=issuer.pk).update(issuer_code="INVALID")
+
     def test_issuer_code_multiple_conflicts_resolved(self, org_context_with_org):
         """Test that multiple conflicts are resolved sequentially."""
         from apps.reference_data.models.issuers import IssuerGroup
@@ -403,6 +553,35 @@ class TestIssuer:
         assert len(codes) == len(set(codes)), f"Codes should be unique: {codes}"
         assert all(code.startswith("CM-SOV-") for code in codes)
 
+    def test_issuer_with_related_avoids_n_plus_one(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test with_related() loads issuer groups and ratings in a single query."""
+        from apps.reference_data.models.issuers import Issuer
+
+        IssuerFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            for issuer in Issuer.objects.with_related():
+                str(issuer.issuer_group)
+                assert issuer.current_rating == ""
+
+    def test_issuer_with_active_ratings_prefetches_in_one_query(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test active ratings are attached without per-issuer queries."""
+        from apps.reference_data.models.issuers import Issuer
+
+        issuers = IssuerFactory.create_batch(2)
+        for issuer in issuers:
+            IssuerRatingFactory(issuer=issuer, is_active=False)
+            IssuerRatingFactory(issuer=issuer, is_active=True)
+
+        with django_assert_num_queries(2):
+            loaded = list(Issuer.objects.all().with_active_ratings())
+            for issuer in loaded:
+                assert len(issuer.active_ratings) == 1
+                assert issuer.active_ratings[0].is_active
+
 
 class TestIssuerRating:
     """Test cases for IssuerRating model."""
@@ -423,6 +602,162 @@ class TestIssuerRating:
         )
         assert str(issuer_rating) == expected
 
+    def test_issuer_rating_save_updates_issuer_current_rating(self, issuer):
+        """Test saving ratings keeps the issuer's current rating denormalized."""
+        from datetime import date
+
+        IssuerRatingFactory(
+            issuer=issuer, agency="S&P", rating="BB", date_assigned=date(2024, 1, 1)
+        )
+        latest = IssuerRatingFactory(
+            issuer=issuer, agency="Fitch", rating="BB+", date_assigned=date(2024, 6, 1)
+        )
+        issuer.refresh_from_db()
+        assert issuer.current_rating == "BB+"
+        assert issuer.current_rating_agency == "Fitch"
+        assert issuer.current_rating_date == date(2024, 6, 1)
+
+        latest.is_active = False
+        latest.save()
+        issuer.refresh_from_db()
+        assert issuer.current_rating == "BB"
+        assert issuer.current_rating_agency == "S&P"
+
+    def test_stale_issuer_save_keeps_current_rating(self, issuer):
+        """Test saving an issuer loaded before a rating change keeps the rating."""
+        stale = Issuer.objects.get(pk=issuer.pk)
+        IssuerRatingFactory(
+            issuer=issuer, agency="Fitch", rating="BB+", date_assigned=date(2024, 6, 1)
+        )
+
+        stale.short_name = "EDITED"
+        stale.save()
+
+        issuer.refresh_from_db()
+        assert issuer.short_name == "EDITED"
+        assert issuer.current_rating == "BB+"
+        assert issuer.current_rating_agency == "Fitch"
+        assert issuer.current_rating_date == date(2024, 6, 1)
+
+    def test_issuer_rating_delete_clears_issuer_current_rating(self, issuer):
+        """Test deleting the last active rating clears the current rating."""
+        rating = IssuerRatingFactory(issuer=issuer, is_active=True)
+        rating.delete()
+        issuer.refresh_from_db()
+        assert issuer.current_rating == ""
+        assert issuer.current_rating_agency == ""
+        assert issuer.current_rating_date is None
+
+    def test_new_active_rating_supersedes_previous(self, issuer):
+        """Test saving an active rating deactivates the agency's previous one."""
+        previous = IssuerRatingFactory(
+            issuer=issuer, agency="S&P", rating="BB", date_assigned=date(2024, 1, 1)
+        )
+        IssuerRatingFactory(
+            issuer=issuer, agency="S&P", rating="BB+", date_assigned=date(2024, 6, 1)
+        )
+        previous.refresh_from_db()
+        assert previous.is_active is False
+        assert issuer.ratings.filter(is_active=True).count() == 1
+
+    def test_backfilled_rating_does_not_supersede_newer(self, issuer):
+        """Test saving an older active rating keeps the newer one current."""
+        latest = IssuerRatingFactory(
+            issuer=issuer, agency="S&P", rating="BB+", date_assigned=date(2024, 6, 1)
+        )
+        backfilled = IssuerRatingFactory(
+            issuer=issuer, agency="S&P", rating="B", date_assigned=date(2023, 1, 1)
+        )
+
+        latest.refresh_from_db()
+        backfilled.refresh_from_db()
+        assert latest.is_active is True
+        assert backfilled.is_active is False
+        issuer.refresh_from_db()
+        assert issuer.current_rating == "BB+"
+
+    def test_failed_rating_save_keeps_previous_rating_active(self, issuer):
+        """Test a failing save does not leave the agency without an active rating."""
+        previous = IssuerRatingFactory(
+            issuer=issuer, agency="S&P", rating="BB", date_assigned=date(2024, 1, 1)
+        )
+        newer = IssuerRating(
+            issuer=issuer, agency="S&P", rating="BB+", date_assigned=date(2024, 6, 1)
+        )
+
+        with patch.object(
+            Issuer, "sync_current_ratings", side_effect=DatabaseError("sync failed")
+        ):
+            with pytest.raises(DatabaseError):
+                newer.save()
+
+        previous.refresh_from_db()
+        assert previous.is_active is True
+        assert not IssuerRating.objects.filter(rating="BB+").exists()
+
+    def test_one_active_rating_per_agency_enforced_by_database(self, issuer):
+        """Test bulk writes cannot create two active ratings for one agency."""
+        with pytest.raises(IntegrityError):
+            IssuerRating.objects.bulk_create(
+                [
+                    IssuerRating(
+                        issuer=issuer,
+                        agency="S&P",
+                        rating="BB",
+                        date_assigned=date(2024, 1, 1),
+                    ),
+                    IssuerRating(
+                        issuer=issuer,
+                        agency="S&P",
+                        rating="BB+",
+                        date_assigned=date(2024, 6, 1),
+                    ),
+                ]
+            )
+
+    def test_bulk_load_applies_supersede_rules(self, issuer):
+        """Test bulk loading keeps one active rating per agency and syncs issuer."""
+        previous = IssuerRatingFactory(
+            issuer=issuer, agency="S&P", rating="B", date_assigned=date(2023, 1, 1)
+        )
+
+        loaded = IssuerRating.bulk_load(
+            [
+                (issuer.id, "S&P", "BB", date(2024, 1, 1), True),
+                (issuer.id, "S&P", "BB+", date(2024, 6, 1), True),
+                (issuer.id, "Fitch", "BB-", date(2024, 3, 1), False),
+            ]
+        )
+
+        assert loaded == 3
+        previous.refresh_from_db()
+        assert previous.is_active is False
+        active = issuer.ratings.filter(is_active=True)
+        assert [rating.rating for rating in active] == ["BB+"]
+        issuer.refresh_from_db()
+        assert issuer.current_rating == "BB+"
+        assert issuer.current_rating_date == date(2024, 6, 1)
+
+    def test_bulk_load_keeps_newer_stored_rating_active(self, issuer):
+        """Test an older feed, loaded in batches, does not supersede a newer rating."""
+        latest = IssuerRatingFactory(
+            issuer=issuer, agency="S&P", rating="BB+", date_assigned=date(2024, 6, 1)
+        )
+
+        loaded = IssuerRating.bulk_load(
+            (
+                (issuer.id, "S&P", rating, date(2023, month, 1), True)
+                for month, rating in [(1, "B"), (3, "B+"), (6, "BB-")]
+            ),
+            batch_size=2,
+        )
+
+        assert loaded == 3
+        active = issuer.ratings.filter(is_active=True)
+        assert [rating.pk for rating in active] == [latest.pk]
+        issuer.refresh_from_db()
+        assert issuer.current_rating == "BB+"
+
     def test_issuer_rating_unique_per_issuer_agency_date(self, issuer):
         """Test that ratings are unique per issuer, agency, and date."""
         rating_date = date(2024, 1, 1)
@@ -483,6 +818,17 @@ class TestIssuerRating:
         """Test that created_at is automatically set."""
         assert issuer_rating.created_at is not None
 
+    def test_issuer_rating_with_display_avoids_n_plus_one(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test with_display() renders __str__ without per-row queries."""
+        from apps.reference_data.models.issuers import IssuerRating
+
+        IssuerRatingFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            for rating in IssuerRating.objects.with_display():
+                str(rating)
+
 
 class TestInstrument:
     """Test cases for Instrument model."""
@@ -526,6 +872,44 @@ class TestInstrument:
         """Test instrument string representation without ISIN or ticker."""
         assert str(instrument) == instrument.name
 
+    def test_instrument_with_related_avoids_n_plus_one(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test with_related() loads list-view relations in a single query."""
+        InstrumentFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            for instrument in Instrument.objects.with_related():
+                str(instrument.instrument_type)
+                str(instrument.issuer.issuer_group)
+
+    def test_instrument_issuer_name_follows_issuer(self, instrument):
+        """Test the denormalized issuer name tracks issuer renames."""
+        assert instrument.issuer_name == instrument.issuer.name
+
+        issuer = instrument.issuer
+        issuer.name = "Renamed Issuer"
+        issuer.save()
+
+        instrument.refresh_from_db()
+        assert instrument.issuer_name == "Renamed Issuer"
+
+    def test_unchanged_names_skip_issuer_name_sync(self, instrument):
+        """Test saves that do not rename or re-point the issuer skip the sync."""
+        issuer = Issuer.objects.get(pk=instrument.issuer_id)
+        issuer.short_name = "NEW"
+        with CaptureQueriesContext(connection) as issuer_queries:
+            issuer.save()
+        assert not any(
+            "reference_data_instrument" in query["sql"]
+            for query in issuer_queries.captured_queries
+        )
+
+        loaded = Instrument.objects.get(pk=instrument.pk)
+        loaded.name = "Renamed Instrument"
+        with CaptureQueriesContext(connection) as instrument_queries:
+            loaded.save()
+        assert len(instrument_queries.captured_queries) == 1
+
     def test_instrument_organization_isolation(self):
         """Test that instruments are isolated by organization."""
         org1 = OrganizationFactory()
@@ -672,6 +1056,11 @@ class TestMarketDataSource:
         with pytest.raises(IntegrityError):
             MarketDataSourceFactory(code="TEST")
 
+    def test_market_data_source_priority_range_enforced(self):
+        """Test that priorities outside 1-1000 are rejected by the database."""
+        with pytest.raises(IntegrityError):
+            MarketDataSourceFactory(priority=0)
+
     def test_market_data_source_has_created_at(self, market_data_source):
         """Test that created_at is automatically set."""
         assert market_data_source.created_at is not None
@@ -681,6 +1070,58 @@ class TestMarketDataSource:
         assert market_data_source.updated_at is not None
 
 
+class TestMarketDataSourcePriority:
+    """Test cases for MarketDataSourcePriority model."""
+
+    def test_effective_priority_uses_preloaded_overrides(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test overrides are loaded once per run and re-read on the next run."""
+        from apps.reference_data.models import MarketDataSourcePriority
+        from apps.reference_data.utils.priority import (
+            get_effective_priority,
+            load_priority_overrides,
+        )
+
+        source = MarketDataSourceFactory(priority=10)
+        other = MarketDataSourceFactory(priority=20)
+        override = MarketDataSourcePriority.objects.create(
+            organization=org_context_with_org,
+            data_type=MarketDataSourcePriority.DataType.FX_RATE,
+            source=source,
+            priority=1,
+        )
+
+        with django_assert_num_queries(1):
+            overrides = load_priority_overrides()
+            assert get_effective_priority(source, "fx_rate", overrides=overrides) == 1
+            assert get_effective_priority(source, "price", overrides=overrides) == 10
+            assert get_effective_priority(other, "fx_rate", overrides=overrides) == 20
+
+        # Bulk edits that bypass save() are seen by the next run
+        MarketDataSourcePriority.objects.filter(pk=override.pk).update(priority=5)
+        overrides = load_priority_overrides()
+        assert get_effective_priority(source, "fx_rate", overrides=overrides) == 5
+        assert get_effective_priority(source, "fx_rate") == 5
+
+    def test_with_display_avoids_n_plus_one(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test with_display() renders __str__ without per-row queries."""
+        from apps.reference_data.models import MarketDataSourcePriority
+
+        for data_type in MarketDataSourcePriority.DataType.values:
+            MarketDataSourcePriority.objects.create(
+                organization=org_context_with_org,
+                data_type=data_type,
+                source=MarketDataSourceFactory(),
+                priority=1,
+            )
+        with django_assert_num_queries(1):
+            for override in MarketDataSourcePriority.objects.with_display():
+                str(override)
+
+
 class TestInstrumentPriceObservation:
     """Test cases for InstrumentPriceObservation model."""
 
@@ -703,6 +1144,25 @@ class TestInstrumentPriceObservation:
         )
         assert str(instrument_price_observation) == expected
 
+    def test_copy_ingest_upserts_rows(self, instrument):
+        """Test copy_ingest writes tuple rows with upsert semantics."""
+        from apps.reference_data.models import InstrumentPriceObservation
+
+        source = MarketDataSourceFactory()
+        now = timezone.now()
+        row = [instrument.id, date(2025, 1, 1), "close", source.id, 0]
+        row += [Decimal("95"), "price", "clean", None, now]
+
+        assert InstrumentPriceObservation.copy_ingest([tuple(row)]) == 1
+        row[5] = Decimal("96")
+        assert InstrumentPriceObservation.copy_ingest([tuple(row)]) == 1
+
+        observation = InstrumentPriceObservation.objects.get(source=source)
+        assert observation.price == Decimal("96")
+        # Columns not in the copied rows get the model default, as in bulk_ingest()
+        currency_field = InstrumentPriceObservation._meta.get_field("currency")
+        assert observation.currency == currency_field.get_default()
+
     def test_instrument_price_observation_unique_constraint(self, instrument):
         """Test unique constraint on instrument/date/price_type/source/revision."""
         source = MarketDataSourceFactory()
@@ -729,6 +1189,17 @@ class TestInstrumentPriceObservation:
         """Test that created_at is automatically set."""
         assert instrument_price_observation.created_at is not None
 
+    def test_with_display_avoids_n_plus_one(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test with_display() renders __str__ without per-row queries."""
+        from apps.reference_data.models import InstrumentPriceObservation
+
+        InstrumentPriceObservationFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            for observation in InstrumentPriceObservation.objects.with_display():
+                str(observation)
+
 
 class TestInstrumentPrice:
     """Test cases for InstrumentPrice model."""
@@ -774,6 +1245,122 @@ class TestInstrumentPrice:
         """Test that created_at is automatically set."""
         assert instrument_price.created_at is not None
 
+    def test_with_display_avoids_n_plus_one(
+        self, org_context_with_org, django_assert_num_queries
+    ):
+        """Test with_display() renders __str__ without per-row queries."""
+        from apps.reference_data.models import InstrumentPrice
+
+        InstrumentPriceFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            for price in InstrumentPrice.objects.with_display():
+                str(price)
+
+    def test_upsert_from_observations_inserts_and_updates(self, instrument):
+        """Test upsert_from_observations upserts on instrument/date/price_type."""
+        from apps.reference_data.models import InstrumentPrice
+
+        source = MarketDataSourceFactory()
+        existing = InstrumentPriceFactory(
+            instrument=instrument,
+            date=date(2025, 1, 1),
+            price_type="close",
+            chosen_source=source,
+            price=Decimal("90"),
+        )
+        observations = [
+            InstrumentPriceObservationFactory(
+                instrument=instrument,
+                date=date(2025, 1, day),
+                price_type="close",
+                source=source,
+                price=price,
+            )
+            for day, price in [(1, Decimal("95")), (2, Decimal("96"))]
+        ]
+
+        written = InstrumentPrice.upsert_from_observations(observations, batch_size=1)
+
+        assert written == 2
+        assert InstrumentPrice.objects.filter(instrument=instrument).count() == 2
+        existing.refresh_from_db()
+        assert existing.price == Decimal("95")
+        assert existing.observation == observations[0]
+
+    def test_deleting_instrument_cascades_to_prices(self, instrument):
+        """Test deleting an instrument removes its observations and prices."""
+        from apps.reference_data.models import (
+            InstrumentPrice,
+            InstrumentPriceObservation,
+        )
+
+        observation = InstrumentPriceObservationFactory(instrument=instrument)
+        InstrumentPriceFactory(instrument=instrument, observation=observation)
+
+        instrument.delete()
+
+        assert not InstrumentPriceObservation.objects.exists()
+        assert not InstrumentPrice.objects.exists()
+
+
+class TestInstrumentPriceImport:
+    """Test cases for InstrumentPriceImport model."""
+
+    def test_identical_uploads_share_stored_file(self, settings, tmp_path):
+        """Test re-uploading identical bytes reuses the content-addressed file."""
+        import hashlib
+
+        from apps.reference_data.models import InstrumentPriceImport
+
+        settings.MEDIA_ROOT = tmp_path
+        source = MarketDataSourceFactory()
+        content = b"price sheet"
+
+        first = InstrumentPriceImport.objects.create(
+            source=source, file=SimpleUploadedFile("prices.xlsx", content)
+        )
+        second = InstrumentPriceImport.objects.create(
+            source=source, file=SimpleUploadedFile("again.xlsx", content)
+        )
+
+        sha = hashlib.sha256(content).hexdigest()
+        assert first.file_sha256 == sha
+        assert first.file_size == len(content)
+        assert first.file.name.endswith(f"by-sha/{sha[:2]}/{sha}.xlsx")
+        assert second.file.name == first.file.name
+        assert len(list((tmp_path / "market_data").rglob("*.xlsx"))) == 1
+
+    def test_deleting_import_keeps_shared_file(self, settings, tmp_path):
+        """Test deleting one import leaves the shared stored file in place."""
+        from apps.reference_data.models import InstrumentPriceImport
+
+        settings.MEDIA_ROOT = tmp_path
+        source = MarketDataSourceFactory()
+        content = b"price sheet"
+        first = InstrumentPriceImport.objects.create(
+            source=source, file=SimpleUploadedFile("prices.xlsx", content)
+        )
+        second = InstrumentPriceImport.objects.create(
+            source=source, file=SimpleUploadedFile("again.xlsx", content)
+        )
+
+        first.delete()
+
+        assert second.file.storage.exists(second.file.name)
+
+    def test_upload_without_hash_uses_dated_path(self):
+        """Test the no-hash fallback keeps the year/month layout."""
+        from apps.reference_data.models import InstrumentPriceImport
+        from apps.reference_data.models.prices import (
+            instrument_price_import_upload_to,
+        )
+
+        path = instrument_price_import_upload_to(InstrumentPriceImport(), "prices.xlsx")
+
+        assert path == timezone.now().strftime(
+            "market_data/instrument_prices/%Y/%m/prices.xlsx"
+        )
+
 
 class TestYieldCurve:
     """Test cases for YieldCurve model."""
@@ -825,6 +1412,15 @@ class TestYieldCurvePointObservation:
         )
         assert str(yield_curve_point_observation) == expected
 
+    def test_with_display_avoids_n_plus_one(self, django_assert_num_queries):
+        """Test with_display() renders __str__ without per-row queries."""
+        from apps.reference_data.models import YieldCurvePointObservation
+
+        YieldCurvePointObservationFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            for observation in YieldCurvePointObservation.objects.with_display():
+                str(observation)
+
     def test_yield_curve_point_observation_unique_constraint(self, yield_curve):
         """Test unique constraint on curve/tenor_days/date/source/revision."""
         source = MarketDataSourceFactory()
@@ -851,6 +1447,21 @@ class TestYieldCurvePointObservation:
         """Test that created_at is automatically set."""
         assert yield_curve_point_observation.created_at is not None
 
+    def test_copy_ingest_upserts_rows(self, yield_curve):
+        """Test copy_ingest writes tuple rows with upsert semantics."""
+        from apps.reference_data.models import YieldCurvePointObservation
+
+        source = MarketDataSourceFactory()
+        row = [yield_curve.id, 365, date(2025, 1, 1), source.id, 0]
+        row += ["1Y", Decimal("4.5"), timezone.now()]
+
+        assert YieldCurvePointObservation.copy_ingest([tuple(row)]) == 1
+        row[6] = Decimal("4.75")
+        assert YieldCurvePointObservation.copy_ingest([tuple(row)]) == 1
+
+        observation = YieldCurvePointObservation.objects.get(source=source)
+        assert observation.rate == Decimal("4.75")
+
 
 class TestYieldCurvePoint:
     """Test cases for YieldCurvePoint model."""
@@ -897,6 +1508,113 @@ class TestYieldCurvePoint:
         """Test that created_at is automatically set."""
         assert yield_curve_point.created_at is not None
 
+    def test_with_display_avoids_n_plus_one(self, django_assert_num_queries):
+        """Test with_display() renders __str__ without per-row queries."""
+        from apps.reference_data.models import YieldCurvePoint
+
+        YieldCurvePointFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            for point in YieldCurvePoint.objects.with_display():
+                str(point)
+
+
+class TestYieldCurvePointQuerySet:
+    """Test cases for YieldCurvePoint queryset and bulk helpers."""
+
+    def test_as_numpy_returns_tenor_ordered_arrays(self, yield_curve):
+        """Test as_numpy() loads one curve date as int/float arrays."""
+        from apps.reference_data.models import YieldCurvePoint
+
+        curve_date = date(2024, 1, 15)
+        for tenor, rate in [("5Y", "5.5"), ("1Y", "4.25")]:
+            YieldCurvePointFactory(
+                curve=yield_curve, tenor=tenor, date=curve_date, rate=Decimal(rate)
+            )
+
+        tenor_days, rates = YieldCurvePoint.objects.as_numpy(yield_curve.id, curve_date)
+
+        assert tenor_days.dtype == np.int32
+        assert tenor_days.tolist() == [365, 1825]
+        assert rates.tolist() == [4.25, 5.5]
+
+    def test_curve_matrix_streams_date_tenor_rate_rows(self, yield_curve):
+        """Test curve_matrix() returns date/tenor ordered structured rows."""
+        from apps.reference_data.models import YieldCurvePoint
+
+        for curve_date in [date(2024, 1, 16), date(2024, 1, 15)]:
+            for tenor in ["5Y", "1Y"]:
+                YieldCurvePointFactory(
+                    curve=yield_curve, tenor=tenor, date=curve_date, rate=Decimal("4.5")
+                )
+
+        matrix = YieldCurvePoint.objects.curve_matrix(
+            yield_curve.id, start_date=date(2024, 1, 16)
+        )
+
+        assert matrix["tenor_days"].tolist() == [365, 1825]
+        assert matrix["date"].tolist() == [date(2024, 1, 16)] * 2
+        assert matrix["rate"].tolist() == [4.5, 4.5]
+
+    def test_official_points_for_date(self, yield_curve):
+        """Test official automatic points are found per curve and per date."""
+        from apps.reference_data.models import YieldCurve
+
+        curve_date = date(2024, 1, 15)
+        YieldCurvePointFactory(
+            curve=yield_curve, tenor="1Y", date=curve_date, is_official=True
+        )
+        YieldCurvePointFactory(
+            curve=yield_curve, tenor="5Y", date=curve_date, is_official=False
+        )
+
+        points = yield_curve.official_points_for_date(curve_date)
+        assert [point.tenor_days for point in points] == [365]
+
+        curves = YieldCurve.objects.with_official_points_on(curve_date)
+        assert [(curve, curve.official_point_count) for curve in curves] == [
+            (yield_curve, 1)
+        ]
+        assert not YieldCurve.objects.with_official_points_on(date(2024, 1, 16))
+
+    def test_dv01_matrix_pivots_curves_by_tenor(self):
+        """Test dv01_matrix() returns a dense curve x tenor matrix with gaps as NaN."""
+        from apps.reference_data.models import YieldCurvePoint
+
+        curve_date = date(2024, 1, 15)
+        first, second = YieldCurveFactory(), YieldCurveFactory()
+        for curve, tenor, rate in [
+            (first, "1Y", "4.0"),
+            (first, "5Y", "5.0"),
+            (second, "1Y", "3.5"),
+        ]:
+            YieldCurvePointFactory(
+                curve=curve, tenor=tenor, date=curve_date, rate=Decimal(rate)
+            )
+
+        curve_index, tenor_days, rates = YieldCurvePoint.objects.dv01_matrix(
+            [second.id, first.id], curve_date
+        )
+
+        assert curve_index == {second.id: 0, first.id: 1}
+        assert tenor_days.tolist() == [365, 1825]
+        assert rates[1].tolist() == [4.0, 5.0]
+        assert rates[0, 0] == 3.5
+        assert np.isnan(rates[0, 1])
+
+    def test_reclassify_staleness_ages_buckets(self, yield_curve):
+        """Test reclassify_staleness() moves points into older buckets as days pass."""
+        from apps.reference_data.models import StalenessBucket, YieldCurvePoint
+
+        point = YieldCurvePointFactory(
+            curve=yield_curve, last_published_date=date.today()
+        )
+        assert point.staleness_bucket == StalenessBucket.FRESH
+
+        YieldCurvePoint.reclassify_staleness(today=date.today() + timedelta(days=31))
+
+        point.refresh_from_db()
+        assert point.staleness_bucket == StalenessBucket.VERY_STALE
+
 
 class TestFXRateObservation:
     """Test cases for FXRateObservation model."""
@@ -1021,6 +1739,18 @@ class TestMarketIndex:
         """Test that market index is active by default."""
         assert market_index.is_active is True
 
+    def test_market_index_timestamps_have_db_defaults(self):
+        """Test created_at/updated_at are filled by the database on raw inserts."""
+        table = MarketIndex._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (code, name, currency, is_active) "
+                "VALUES ('RAW', 'Raw Index', 'XAF', TRUE)"
+            )
+        index = MarketIndex.objects.get(code="RAW")
+        assert index.created_at is not None
+        assert index.updated_at is not None
+
     def test_market_index_can_be_inactive(self):
         """Test that market index can be set to inactive."""
         index = MarketIndexFactory(is_active=False)
@@ -1088,6 +1818,48 @@ class TestMarketIndexValueObservation:
         )
         assert observation.return_pct is None
 
+    def test_market_index_value_observation_bulk_upsert(self, market_index):
+        """Test bulk_upsert inserts new rows and updates conflicting ones."""
+        source = MarketDataSourceFactory()
+        date_val = date.today()
+        MarketIndexValueObservationFactory(
+            index=market_index, date=date_val, source=source, revision=0, value=100
+        )
+
+        MarketIndexValueObservation.objects.bulk_upsert(
+            [
+                MarketIndexValueObservation(
+                    index=market_index,
+                    date=date_val,
+                    source=source,
+                    revision=0,
+                    value=101,
+                    observed_at=timezone.now(),
+                ),
+                MarketIndexValueObservation(
+                    index=market_index,
+                    date=date(2024, 1, 2),
+                    source=source,
+                    revision=0,
+                    value=99,
+                    observed_at=timezone.now(),
+                ),
+            ]
+        )
+
+        observations = MarketIndexValueObservation.objects.filter(source=source)
+        assert observations.count() == 2
+        assert observations.get(date=date_val).value == 101
+
+    def test_market_index_value_observation_with_display_avoids_n_plus_one(
+        self, market_index, django_assert_num_queries
+    ):
+        """Test with_display() renders __str__ without per-row queries."""
+        MarketIndexValueObservationFactory.create_batch(3, index=market_index)
+        with django_assert_num_queries(1):
+            for observation in MarketIndexValueObservation.objects.with_display():
+                str(observation)
+
 
 class TestMarketIndexValue:
     """Test cases for MarketIndexValue model."""
@@ -11,7 +11,11 @@ from datetime import date, datetime, timedelta
 
 from django.utils import timezone
 
-from apps.reference_data.models import YieldCurvePoint
+from apps.reference_data.models import (
+    StalenessBucket,
+    YieldCurvePoint,
+    YieldCurveStressProfile,
+)
 from apps.reference_data.services.yield_curves.canonicalize import (
     canonicalize_yield_curves,
 )
@@ -143,6 +147,33 @@ class TestCurveLevelStalenessMaintenance:
         yield_curve.refresh_from_db()
         assert yield_curve.last_observation_date == date(2024, 3, 15)  # Max date
 
+    def test_stress_profiles_refreshed_after_canonicalization(
+        self, yield_curve, market_data_source
+    ):
+        """Test that stress profile staleness follows the curve in one batch."""
+        profile = YieldCurveStressProfile.objects.create(
+            curve=yield_curve,
+            narrative="gradual_deterioration",
+            period_start=date(2023, 1, 1),
+            period_end=date(2023, 12, 31),
+            regime_type="normal",
+            calibration_rationale="Test",
+        )
+        assert profile.staleness_days is None
+
+        YieldCurvePointObservationFactory(
+            curve=yield_curve,
+            source=market_data_source,
+            tenor="5Y",
+            tenor_days=1825,
+            date=date(2024, 3, 15),
+        )
+        canonicalize_yield_curves(curve=yield_curve)
+
+        profile.refresh_from_db()
+        assert profile.last_observation_date == date(2024, 3, 15)
+        assert profile.staleness_days == (date.today() - date(2024, 3, 15)).days
+
     def test_curve_last_observation_date_updates_on_new_points(
         self, yield_curve, market_data_source
     ):
@@ -242,6 +273,44 @@ class TestStalenessCalculations:
         # Allow for 1 day variance due to test execution timing
         assert 9 <= point.staleness_days <= 11
 
+    def test_with_staleness_matches_property(self, yield_curve, market_data_source):
+        """Test with_staleness() annotates the same staleness as the property."""
+        published_date = date.today() - timedelta(days=10)
+        YieldCurvePointObservationFactory(
+            curve=yield_curve,
+            source=market_data_source,
+            tenor="5Y",
+            tenor_days=1825,
+            date=date(2024, 1, 15),
+            observed_at=timezone.make_aware(
+                datetime.combine(published_date, datetime.min.time())
+            ),
+        )
+        canonicalize_yield_curves(curve=yield_curve)
+
+        point = YieldCurvePoint.objects.with_staleness().get(curve=yield_curve)
+        assert point.published_staleness.days == point.staleness_days
+
+    def test_staleness_bucket_set_on_canonicalization(
+        self, yield_curve, market_data_source
+    ):
+        """Test canonicalization stores the staleness bucket of each point."""
+        published_date = date.today() - timedelta(days=10)
+        YieldCurvePointObservationFactory(
+            curve=yield_curve,
+            source=market_data_source,
+            tenor="5Y",
+            tenor_days=1825,
+            date=date(2024, 1, 15),
+            observed_at=timezone.make_aware(
+                datetime.combine(published_date, datetime.min.time())
+            ),
+        )
+        canonicalize_yield_curves(curve=yield_curve)
+
+        point = YieldCurvePoint.objects.get(curve=yield_curve)
+        assert point.staleness_bucket == StalenessBucket.STALE
+
     def test_yield_curve_point_staleness_none_when_no_published_date(
         self, yield_curve, market_data_source
     ):
@@ -264,6 +333,7 @@ class TestStalenessCalculations:
         )
 
         assert point.staleness_days is None
+        assert point.staleness_bucket is None
 
     def test_yield_curve_staleness_days(self, yield_curve, market_data_source):
         """Test YieldCurve.staleness_days property."""